@@ -8,6 +8,20 @@ This module contains the following classes:
 - RedisSet
 - RedisString
 - RedisDoubleHash
+- RedisCounterAggregator
+- RedisBucketedHash
+- BloomFilter
+- RedisStringBatch
+- RedisCache
+- RedisLock
+- RedisTokenBucket
+- RedisSlidingWindow
+- RedisBitmap
+- RedisPackedArray
+- RedisKeyspaceScanner
+- RedisMemoryReport
+- RedisBackup
+- RedisDoubleHashMirror
 """
 
 from .redis_client import RedisClient
@@ -18,3 +32,17 @@ from .redis_hash import RedisHash
 from .redis_set import RedisSet
 from .redis_string import RedisString
 from .redis_double_hash import RedisDoubleHash
+from .redis_counter_aggregator import RedisCounterAggregator
+from .redis_bucketed_hash import RedisBucketedHash
+from .bloom_filter import BloomFilter
+from .redis_string_batch import RedisStringBatch
+from .redis_cache import RedisCache
+from .redis_lock import RedisLock
+from .redis_token_bucket import RedisTokenBucket
+from .redis_sliding_window import RedisSlidingWindow
+from .redis_bitmap import RedisBitmap
+from .redis_packed_array import RedisPackedArray
+from .redis_keyspace_scanner import RedisKeyspaceScanner
+from .redis_memory_report import RedisMemoryReport
+from .redis_backup import RedisBackup
+from .redis_double_hash_mirror import RedisDoubleHashMirror
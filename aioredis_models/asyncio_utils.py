@@ -2,8 +2,17 @@
 Provides some basic asyncio utilities.
 """
 
-async def noop():
+from typing import Any
+
+
+async def noop(result: Any=None) -> Any:
     """
     A coroutine that does nothing.
+
+    Args:
+        result (Any, optional): The value to return. Defaults to `None`.
+
+    Returns:
+        Any: The given value.
     """
-    return
+    return result
@@ -0,0 +1,73 @@
+"""
+This module contains the following classes:
+- BloomFilter: A client-side probabilistic set used to rule out members without querying Redis.
+"""
+
+from hashlib import blake2b
+from math import ceil, log
+from typing import Any
+
+
+class BloomFilter:
+    """
+    A client-side probabilistic set. A value that was added is always reported as possibly present,
+    while a value that was not added is reported as possibly present only with a small probability
+    (the false positive rate). This makes it suitable for ruling out definite misses before
+    querying Redis.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float=0.01):
+        """
+        Creates an instance of `BloomFilter`.
+
+        Args:
+            capacity (int): The expected number of values to add.
+            false_positive_rate (float, optional): The target false positive rate once `capacity`
+                values have been added. Defaults to 0.01.
+        """
+
+        capacity = max(capacity, 1)
+        self._size = max(ceil(-capacity * log(false_positive_rate) / (log(2) ** 2)), 8)
+        self._hash_count = max(round(self._size / capacity * log(2)), 1)
+        self._bits = bytearray(ceil(self._size / 8))
+        self._count = 0
+
+    def __contains__(self, value: Any) -> bool:
+        return all(
+            self._bits[index >> 3] & (1 << (index & 7)) for index in self._get_indices(value)
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, value: Any):
+        """
+        Adds a value to the filter.
+
+        Args:
+            value (Any): The value to add. Values other than `bytes` are converted to UTF-8 encoded
+                strings, matching how Redis stores them.
+        """
+
+        for index in self._get_indices(value):
+            self._bits[index >> 3] |= 1 << (index & 7)
+        self._count += 1
+
+    def false_positive_rate(self) -> float:
+        """
+        Estimates the current false positive rate from the proportion of bits that are set.
+
+        Returns:
+            float: The probability that a value that was not added is reported as present.
+        """
+
+        set_bits = sum(bin(byte).count('1') for byte in self._bits)
+        return (set_bits / self._size) ** self._hash_count
+
+    def _get_indices(self, value: Any):
+        if not isinstance(value, (bytes, bytearray, memoryview)):
+            value = str(value).encode('utf-8')
+        digest = blake2b(value, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return ((first + i * second) % self._size for i in range(self._hash_count))
@@ -0,0 +1,228 @@
+"""
+This module contains the following classes:
+- RedisBackup: Exports keys stored in Redis to JSON lines and restores them.
+"""
+
+import json
+from asyncio import gather
+from base64 import b64decode, b64encode
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, List, TextIO, Union
+from aioredis import Redis
+from .redis_model import RedisModel
+from .redis_client import RedisClient
+from .redis_key import RedisKey
+from .redis_string import RedisString
+
+
+class RedisBackup(RedisModel):
+    """
+    Exports keys stored in Redis to a file of JSON lines and restores them, to back up models or
+    move them between Redis servers. Hash maps, sets, sorted sets and lists are read in batches
+    with HSCAN, SSCAN, ZSCAN and LRANGE, and strings in chunks with GETRANGE, and written as one
+    line per batch or chunk, so memory stays bounded regardless of the size of each key.
+    Alternatively, keys can be exported with DUMP, which is faster and exact but holds each
+    serialized key in memory and can only be restored on a Redis server of the same or a later
+    version. Keys of other types are always exported with DUMP. Values are stored as UTF-8 text,
+    with bytes that are not valid UTF-8 escaped so that binary values and strings split mid
+    character survive the round trip.
+    """
+
+    _SCAN_COMMANDS = {'hash': 'hscan', 'set': 'sscan', 'zset': 'zscan'}
+    _string_chunk_size: int = 65536
+
+    def __init__(
+        self,
+        redis: Union[Redis, RedisClient],  # pylint:disable=unsubscriptable-object
+        batch_size: int=100,
+        use_dump: bool=False
+    ):
+        """
+        Creates an instance of `RedisBackup`.
+
+        Args:
+            redis (Union[Redis, RedisClient]): The Redis instance to use to connect to Redis.
+                This can be an instance of `RedisClient` to allow controlling transactions
+                externally.
+            batch_size (int, optional): The approximate number of items to read or write with each
+                command when exporting and restoring, and the number of RESTORE commands to send
+                at once. Defaults to 100.
+            use_dump (bool, optional): Whether to export all keys with DUMP. Defaults to `False`.
+        """
+
+        super().__init__(redis)
+        self._batch_size = batch_size
+        self._use_dump = use_dump
+
+    async def export(
+        self,
+        keys: Union[Iterable, AsyncIterable],  # pylint:disable=unsubscriptable-object
+        output: TextIO
+    ) -> int:
+        """
+        Exports the given keys. This operation is not atomic and cannot be performed
+        transactionally, so keys changed during the export may be exported partially updated.
+
+        Args:
+            keys (Union[Iterable, AsyncIterable]): The models or Redis keys to export, such as the
+                keys yielded by `RedisKeyspaceScanner.scan`, which can be used to export all keys
+                of a `RedisDoubleHash` by their prefixes.
+            output (TextIO): The file to write the lines to.
+
+        Returns:
+            int: The number of keys that were exported, excluding keys that did not exist.
+        """
+
+        exported = 0
+        async for key in self._iterate(keys):
+            if isinstance(key, RedisKey):
+                key = key.key
+            exported += await self._export_key(key, output)
+        return exported
+
+    async def restore(self, lines: Iterable[str]) -> int:
+        """
+        Restores the keys exported to the given lines, replacing existing keys with the same names
+        and keeping their remaining time to live. Lines are written one transaction at a time and
+        RESTORE commands are sent in batches. This operation is not atomic.
+
+        Args:
+            lines (Iterable[str]): The exported lines, such as a file opened for reading.
+
+        Returns:
+            int: The number of keys that were restored.
+        """
+
+        restored = 0
+        pending = []
+        previous_key = None
+        for line in lines:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            key = record['key']
+            if 'dump' in record:
+                pending.append(self.get_connection().execute(
+                    b'RESTORE', key, record['ttl'] or 0, b64decode(record['dump']), b'REPLACE'
+                ))
+                restored += 1
+                if len(pending) >= self._batch_size:
+                    await gather(*pending)
+                    pending = []
+                continue
+
+            # The lines of a key are consecutive; its first line replaces any existing value.
+            is_first_line = key != previous_key
+            previous_key = key
+            async with self.begin_transaction() as transaction:
+                connection = self.get_connection()
+                if is_first_line:
+                    transaction.add_operation(connection.delete(key))
+                    restored += 1
+                transaction.add_operation(
+                    self._write_items(key, record['type'], record['items'])
+                )
+                if record.get('ttl'):
+                    transaction.add_operation(connection.pexpire(key, record['ttl']))
+        await gather(*pending)
+        return restored
+
+    async def _export_key(self, key: str, output: TextIO) -> int:
+        connection = self.get_connection()
+        key_type, ttl = await gather(
+            connection.execute(b'TYPE', key, encoding='utf-8'),
+            connection.pttl(key)
+        )
+        ttl = ttl if ttl > 0 else None
+        if key_type == 'none':
+            return 0
+        if self._use_dump or key_type not in ('string', 'list', *self._SCAN_COMMANDS):
+            data = await connection.dump(key)
+            if data is None:
+                return 0
+            self._write_line(
+                output, {'key': key, 'ttl': ttl, 'dump': b64encode(data).decode('ascii')}
+            )
+            return 1
+
+        exported = 0
+        async for items in self._read_items(key, key_type):
+            record = {'key': key, 'type': key_type, 'items': items}
+            if not exported:
+                record['ttl'] = ttl
+                exported = 1
+            self._write_line(output, record)
+        return exported
+
+    async def _read_items(self, key: str, key_type: str) -> AsyncIterator[List]:
+        connection = self.get_connection()
+        if key_type == 'string':
+            empty = True
+            async for chunk in RedisString(self._redis, key).read_chunks(self._string_chunk_size):
+                empty = False
+                yield [self._decode(chunk)]
+            if empty and await connection.exists(key):
+                yield ['']
+        elif key_type == 'list':
+            start = 0
+            while True:
+                values = await connection.lrange(
+                    key, start, start + self._batch_size - 1, encoding=None
+                )
+                if values:
+                    yield [self._decode(value) for value in values]
+                if len(values) < self._batch_size:
+                    return
+                start += self._batch_size
+        else:
+            scan = getattr(connection, self._SCAN_COMMANDS[key_type])
+            cursor = None
+            while cursor != 0:
+                cursor, items = await scan(key, cursor or 0, count=self._batch_size)
+                if items:
+                    yield [self._decode_item(item) for item in items]
+
+    def _write_items(self, key: str, key_type: str, items: List) -> Any:
+        connection = self.get_connection()
+        if key_type == 'string':
+            # The first line of a key is written after deleting it, so appending replaces it.
+            return connection.append(key, self._encode(items[0]))
+        if key_type == 'list':
+            return connection.rpush(key, *(self._encode(value) for value in items))
+        if key_type == 'set':
+            return connection.sadd(key, *(self._encode(member) for member in items))
+        if key_type == 'hash':
+            return connection.hmset(key, *(
+                self._encode(part) for field, value in items for part in (field, value)
+            ))
+        return connection.zadd(key, *(
+            part for member, score in items for part in (score, self._encode(member))
+        ))
+
+    def _decode_item(self, item: Any) -> Any:
+        if isinstance(item, bytes):
+            return self._decode(item)
+        first, second = item
+        # Sorted set scores are numbers; hash map fields and values are both bytes.
+        return [self._decode(first), self._decode(second) if isinstance(second, bytes) else second]
+
+    @staticmethod
+    def _decode(value: bytes) -> str:
+        return value.decode('utf-8', 'surrogateescape')
+
+    @staticmethod
+    def _encode(value: str) -> bytes:
+        return value.encode('utf-8', 'surrogateescape')
+
+    @staticmethod
+    def _write_line(output: TextIO, record: dict):
+        output.write(json.dumps(record, separators=(',', ':')))
+        output.write('\n')
+
+    @staticmethod
+    async def _iterate(values: Any) -> AsyncIterator:
+        if hasattr(values, '__aiter__'):
+            async for value in values:
+                yield value
+        else:
+            for value in values:
+                yield value
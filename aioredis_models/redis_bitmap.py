@@ -0,0 +1,134 @@
+"""
+This module contains the following classes:
+- RedisBitmap: Represents a bitmap stored in Redis as a string.
+"""
+
+from itertools import chain, islice
+from typing import Awaitable, Iterable, List, Tuple
+from .redis_string import RedisString
+from .asyncio_utils import noop
+
+
+class RedisBitmap(RedisString):
+    """
+    Represents a bitmap stored in Redis as a string, where each bit is addressed by its offset.
+    Using integer IDs as offsets, a bitmap stores one flag per ID in a single bit, which is far more
+    compact than a set of IDs when the IDs are dense.
+    """
+
+    def get_bit(self, offset: int) -> Awaitable[int]:
+        """
+        Gets the bit at the given offset.
+
+        Args:
+            offset (int): The offset of the bit.
+
+        Returns:
+            Awaitable[int]: The value of the bit, 0 for offsets beyond the end of the bitmap.
+        """
+
+        return self.get_connection().getbit(self._key, offset)
+
+    def set_bit(self, offset: int, value: int=1) -> Awaitable[int]:
+        """
+        Sets the bit at the given offset. The bitmap grows as needed.
+
+        Args:
+            offset (int): The offset of the bit.
+            value (int, optional): The value of the bit, either 0 or 1. Defaults to 1.
+
+        Returns:
+            Awaitable[int]: The previous value of the bit.
+        """
+
+        return self.get_connection().setbit(self._key, offset, value)
+
+    def get_bits(self, offsets: List[int]) -> Awaitable[List[int]]:
+        """
+        Gets the bits at the given offsets with a single BITFIELD command.
+
+        Args:
+            offsets (List[int]): The offsets of the bits.
+
+        Returns:
+            Awaitable[List[int]]: The values of the bits in the same order as the offsets.
+        """
+
+        if not offsets:
+            return noop([])
+        return self._redis.execute(
+            b'BITFIELD', self._key,
+            *chain.from_iterable((b'GET', b'u1', offset) for offset in offsets)
+        )
+
+    def set_bits(self, offsets: List[int], value: int=1) -> Awaitable[List[int]]:
+        """
+        Sets the bits at the given offsets with a single BITFIELD command.
+
+        Args:
+            offsets (List[int]): The offsets of the bits.
+            value (int, optional): The value of the bits, either 0 or 1. Defaults to 1.
+
+        Returns:
+            Awaitable[List[int]]: The previous values of the bits in the same order as the offsets.
+        """
+
+        if not offsets:
+            return noop([])
+        return self._redis.execute(
+            b'BITFIELD', self._key,
+            *chain.from_iterable((b'SET', b'u1', offset, value) for offset in offsets)
+        )
+
+    def count(self, start: int=None, end: int=None) -> Awaitable[int]:
+        """
+        Counts the bits that are set.
+
+        Args:
+            start (int, optional): The index of the first byte to count. Negative indices are
+                offsets from the end. Defaults to `None`, which counts the whole bitmap.
+            end (int, optional): The index of the last byte to count, required if `start` is
+                given. Defaults to `None`.
+
+        Returns:
+            Awaitable[int]: The number of bits that are set.
+        """
+
+        return self.get_connection().bitcount(self._key, start, end)
+
+    def combine(self, operation: str, destination_key: str, *keys: Tuple) -> Awaitable[int]:
+        """
+        Stores the result of a bitwise operation between this bitmap and the bitmaps stored at the
+        given keys in the destination key, on the server.
+
+        Args:
+            operation (str): The operation to perform, one of 'AND', 'OR', 'XOR' or 'NOT'. 'NOT'
+                takes no other keys.
+            destination_key (str): The key to store the result in.
+            keys (Tuple): The keys of the other bitmaps.
+
+        Returns:
+            Awaitable[int]: The length in bytes of the resulting bitmap.
+        """
+
+        bitop = getattr(self.get_connection(), f'bitop_{operation.lower()}')
+        return bitop(destination_key, self._key, *keys)
+
+    async def load(self, offsets: Iterable[int], batch_size: int=1000):
+        """
+        Sets the bits at the given offsets, such as IDs read from a file, using one BITFIELD
+        command per batch so that memory stays bounded for large iterables. This operation is not
+        atomic and cannot be performed transactionally.
+
+        Args:
+            offsets (Iterable[int]): The offsets of the bits to set.
+            batch_size (int, optional): The number of bits to set with each command. Defaults to
+                1000.
+        """
+
+        iterator = iter(offsets)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            await self.set_bits(batch)
@@ -0,0 +1,187 @@
+"""
+This module contains the following classes:
+- RedisBucketedHash: Represents a large hash map stored in Redis as many small hash maps.
+"""
+
+from asyncio import gather
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Union
+from zlib import crc32
+from aioredis import Redis
+from .redis_model import RedisModel
+from .redis_client import RedisClient
+from .redis_key import RedisKey
+from .redis_hash import RedisHash
+
+
+class RedisBucketedHash(RedisModel):
+    """
+    Represents a large hash map stored in Redis as a fixed number of small hash maps (buckets).
+    Each field is assigned to a bucket based on a stable hash of its name. Small hash maps are
+    stored by Redis in a compact encoding (listpack or ziplist) which has far less memory overhead
+    than one key per field. To benefit from it, the number of buckets should be chosen so that each
+    bucket stays within the `hash-max-listpack-entries` (`hash-max-ziplist-entries` before Redis 7)
+    server setting, which defaults to 128, e.g. one bucket for every 100 expected fields. Values
+    should also stay within the `hash-max-listpack-value` setting, which defaults to 64 bytes.
+    """
+
+    def __init__(
+        self,
+        redis: Union[Redis, RedisClient],  # pylint:disable=unsubscriptable-object
+        key: str,
+        bucket_count: int=1024
+    ):
+        """
+        Creates an instance of `RedisBucketedHash`.
+
+        Args:
+            redis (Union[Redis, RedisClient]): The Redis instance to use to connect to Redis.
+                This can be an instance of `RedisClient` to allow controlling transactions
+                externally.
+            key (str): The key prefix to use for the buckets.
+            bucket_count (int, optional): The number of buckets to spread fields across. Must not
+                change once data has been stored. Defaults to 1024.
+        """
+
+        super().__init__(redis)
+        self._key = key
+        self._bucket_count = bucket_count
+
+    def get(self, field: str, encoding='utf-8') -> Awaitable[Any]:
+        """
+        Gets the value of the given field.
+
+        Args:
+            field (str): The field to get.
+            encoding (str, optional): The encoding to use for decoding the value. Defaults to
+                'utf-8'.
+
+        Returns:
+            Awaitable[Any]: The value of the field.
+        """
+
+        return self._get_bucket(field).get(field, encoding=encoding)
+
+    async def get_many(self, fields: List[str], encoding='utf-8') -> Dict[str, Any]:
+        """
+        Gets the values of the given fields with one HMGET command per bucket involved. The
+        commands are sent concurrently and are pipelined by the connection. This operation is not
+        atomic and cannot be performed transactionally.
+
+        Args:
+            fields (List[str]): The fields to get.
+            encoding (str, optional): The encoding to use for decoding the values. Defaults to
+                'utf-8'.
+
+        Returns:
+            Dict[str, Any]: A `dict` mapping each field to its value, `None` for fields that do
+                not exist.
+        """
+
+        buckets: Dict[int, List[str]] = {}
+        for field in fields:
+            buckets.setdefault(self._get_bucket_index(field), []).append(field)
+        bucket_fields = list(buckets.values())
+        results = await gather(*(
+            self._get_bucket(bucket[0]).get_many(*bucket, encoding=encoding)
+            for bucket in bucket_fields
+        ))
+        return {
+            field: value
+            for bucket, values in zip(bucket_fields, results)
+            for field, value in zip(bucket, values)
+        }
+
+    async def enumerate(
+        self,
+        field_pattern: str=None,
+        batch_size: int=None,
+        encoding: str='utf-8'
+    ) -> AsyncIterator[Any]:
+        """
+        Enumerates over the items of all buckets using the HSCAN command. This operation is not
+        atomic and cannot be performed transactionally.
+
+        Args:
+            field_pattern (str, optional): A string to filter fields with, if needed.
+                Defaults to None.
+            batch_size (int, optional): The maximum number of items to get with each scan.
+                Defaults to None.
+            encoding (str, optional): The encoding to use for decoding fields and values.
+                Defaults to 'utf-8'.
+
+        Returns:
+            AsyncIterator[Any]: An iterator that can be used to iterate over the result.
+        """
+
+        for index in range(self._bucket_count):
+            async for item in RedisHash(self._redis, self._get_bucket_key(index)).enumerate(
+                field_pattern=field_pattern,
+                batch_size=batch_size,
+                encoding=encoding
+            ):
+                yield item
+
+    def set(self, field: str, value: str):
+        """
+        Sets the value of the given field.
+
+        Args:
+            field (str): The field whose value is to be set.
+            value (str): The value to set for the given field.
+        """
+
+        return self._get_bucket(field).set(field, value)
+
+    async def set_all(self, values: dict):
+        """
+        Sets the values of the given fields in a single transaction, with one HMSET command per
+        bucket involved.
+
+        Args:
+            values (dict): A `dict` containing the field/value map to set.
+        """
+
+        if not values:
+            return
+
+        buckets: Dict[int, dict] = {}
+        for field, value in values.items():
+            buckets.setdefault(self._get_bucket_index(field), {})[field] = value
+        async with self.begin_transaction() as transaction:
+            transaction.add_operation(*(
+                RedisHash(self._redis, self._get_bucket_key(index)).set_all(bucket_values)
+                for index, bucket_values in buckets.items()
+            ))
+
+    def remove(self, field: str) -> Awaitable[int]:
+        """
+        Removes the given field.
+
+        Args:
+            field (str): The field to remove.
+
+        Returns:
+            Awaitable[int]: The number of fields removed.
+        """
+
+        return self._get_bucket(field).remove(field)
+
+    async def delete(self):
+        """
+        Deletes all buckets from Redis in a single transaction.
+        """
+
+        async with self.begin_transaction() as transaction:
+            transaction.add_operation(*(
+                RedisKey(self._redis, self._get_bucket_key(index)).delete()
+                for index in range(self._bucket_count)
+            ))
+
+    def _get_bucket(self, field: str) -> RedisHash:
+        return RedisHash(self._redis, self._get_bucket_key(self._get_bucket_index(field)))
+
+    def _get_bucket_index(self, field: str) -> int:
+        return crc32(str(field).encode('utf-8')) % self._bucket_count
+
+    def _get_bucket_key(self, index: int) -> str:
+        return f'{self._key}:{index}'
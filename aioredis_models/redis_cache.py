@@ -0,0 +1,164 @@
+"""
+This module contains the following classes:
+- RedisCache: A read-through cache of strings stored in Redis with stampede protection.
+"""
+
+from asyncio import Future, ensure_future, sleep
+from math import log
+from random import random
+from time import monotonic, time
+from typing import Awaitable, Callable, Dict, Union
+from aioredis import Redis
+from .redis_model import RedisModel
+from .redis_client import RedisClient
+from .redis_string import RedisString
+from .redis_lock import RedisLock
+
+
+class RedisCache(RedisModel):
+    """
+    A read-through cache of strings stored in Redis as `RedisString` values. When a value is
+    missing, it is computed by a caller-provided coroutine function and stored. Concurrent misses
+    for the same key are coalesced: within a process they share a single computation, and across
+    processes a short Redis lock lets only one process compute while the others wait for its
+    result. Values can be served stale for a while after they expire while they are recomputed in
+    the background, and are recomputed early with a probability that grows as expiry approaches
+    and with the time the last computation took. Each entry is stored together with its expiry time
+    and computation time, so `get` should only be used on keys written by this class.
+    """
+
+    _lock_poll_seconds: float = 0.05
+
+    def __init__(
+        self,
+        redis: Union[Redis, RedisClient],  # pylint:disable=unsubscriptable-object
+        timeout_seconds: Union[int, float],  # pylint:disable=unsubscriptable-object
+        stale_seconds: Union[int, float]=0,  # pylint:disable=unsubscriptable-object
+        lock_timeout_seconds: Union[int, float]=10  # pylint:disable=unsubscriptable-object
+    ):
+        """
+        Creates an instance of `RedisCache`.
+
+        Args:
+            redis (Union[Redis, RedisClient]): The Redis instance to use to connect to Redis.
+                This can be an instance of `RedisClient` to allow controlling transactions
+                externally.
+            timeout_seconds (Union[int, float]): The amount of time in seconds for which a
+                computed value is fresh.
+            stale_seconds (Union[int, float], optional): The amount of time in seconds after a
+                value expires during which it is still served while being recomputed in the
+                background. Defaults to 0.
+            lock_timeout_seconds (Union[int, float], optional): The maximum amount of time in
+                seconds that one process may hold the lock for computing a value, after which
+                other processes compute it themselves. Defaults to 10.
+        """
+
+        super().__init__(redis)
+        self._timeout_seconds = timeout_seconds
+        self._stale_seconds = stale_seconds
+        self._lock_timeout_seconds = lock_timeout_seconds
+        self._refreshes: Dict[str, Future] = {}
+        self._background_refreshes: Dict[str, Future] = {}
+        self.hits = 0
+        self.early_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.recomputes = 0
+
+    def hit_ratio(self) -> float:
+        """
+        Gets the proportion of calls to `get` that were served from Redis, including values that
+        were recomputed early and stale values.
+
+        Returns:
+            float: The hit ratio, 0 if `get` has not been called yet.
+        """
+
+        served = self.hits + self.early_hits + self.stale_hits
+        total = served + self.misses
+        return served / total if total else 0
+
+    async def get(self, key: str, compute: Callable[[], Awaitable[str]]) -> str:
+        """
+        Gets the cached value of the given key, computing and storing it if it is missing. This
+        operation cannot be performed transactionally.
+
+        Args:
+            key (str): The key of the cached value.
+            compute (Callable[[], Awaitable[str]]): A coroutine function that computes the value.
+
+        Returns:
+            str: The cached value.
+        """
+
+        entry = await RedisString(self._redis, key).get()
+        if entry is not None:
+            expires_at, duration, value = self._parse_entry(entry)
+            now = time()
+            # Probabilistic early expiration: recompute before expiry with a probability that
+            # increases as expiry approaches and with the duration of the last computation.
+            if now - duration * log(1 - random()) < expires_at:
+                self.hits += 1
+                return value
+            if now < expires_at:
+                self.early_hits += 1
+            else:
+                self.stale_hits += 1
+            self._refresh(key, compute, background=True)
+            return value
+
+        self.misses += 1
+        return await self._refresh(key, compute)
+
+    def _refresh(self, key: str, compute: Callable[[], Awaitable[str]], background=False):
+        refresh = self._refreshes.get(key)
+        # Background refreshes give up and return `None` when another process is computing, so
+        # only other background refreshes may join them.
+        if refresh is None and background:
+            refresh = self._background_refreshes.get(key)
+        if refresh is None:
+            refreshes = self._background_refreshes if background else self._refreshes
+            refresh = ensure_future(self._compute(key, compute, background))
+            refreshes[key] = refresh
+            refresh.add_done_callback(lambda _: refreshes.pop(key, None))
+        return refresh
+
+    async def _compute(self, key: str, compute: Callable[[], Awaitable[str]], background: bool):
+        try:
+            lock = RedisLock(
+                self._redis, f'{key}:lock', lease_seconds=self._lock_timeout_seconds
+            )
+            deadline = monotonic() + self._lock_timeout_seconds
+            while not await lock.acquire(blocking=False):
+                if background:
+                    # Another process is already recomputing; the stale value is being served.
+                    return None
+                await sleep(self._lock_poll_seconds)
+                entry = await RedisString(self._redis, key).get()
+                if entry is not None:
+                    return self._parse_entry(entry)[2]
+                if monotonic() >= deadline:
+                    break
+
+            try:
+                started_at = monotonic()
+                value = await compute()
+                duration = monotonic() - started_at
+                self.recomputes += 1
+                await RedisString(self._redis, key).set(
+                    f'{time() + self._timeout_seconds:.3f} {duration:.3f} {value}',
+                    timeout_seconds=self._timeout_seconds + self._stale_seconds
+                )
+                return value
+            finally:
+                await lock.release()
+        except Exception:  # pylint:disable=broad-except
+            if not background:
+                raise
+            # Background refreshes keep serving the stale value and are retried on the next get.
+            return None
+
+    @staticmethod
+    def _parse_entry(entry: str):
+        expires_at, duration, value = entry.split(' ', 2)
+        return float(expires_at), float(duration), value
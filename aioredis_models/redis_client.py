@@ -6,7 +6,7 @@ This module contains the following classes:
 
 from typing import Awaitable, List, Union
 from aioredis import Redis
-from aioredis.commands import MultiExec
+from aioredis.commands import MultiExec, Pipeline
 from .redis_transaction import RedisTransaction
 
 
@@ -35,6 +35,26 @@ class RedisClient:
         """
         return self._multi_exec or self._redis
 
+    def execute(self, command: bytes, *args, **kwargs) -> Awaitable:
+        """
+        Executes a Redis command that has no dedicated method in aioredis, as part of the
+        transaction in progress if there is one.
+
+        Args:
+            command (bytes): The name of the command, such as `b'SINTER'`.
+            args: The arguments of the command.
+            kwargs: Options for aioredis, such as `encoding`.
+
+        Returns:
+            Awaitable: The result of the command.
+        """
+
+        if self._multi_exec is None:
+            return self._redis.execute(command, *args, **kwargs)
+        # `MultiExec.execute` executes the whole transaction, so the command is queued through the
+        # same wrapper that queues the methods named after commands instead.
+        return Pipeline.__getattr__(self._multi_exec, 'execute')(command, *args, **kwargs)
+
     def is_in_transaction(self) -> bool:
         """
         Returns a value indicating whether a transaction is in progress.
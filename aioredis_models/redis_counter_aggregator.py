@@ -0,0 +1,186 @@
+"""
+This module contains the following classes:
+- RedisCounterAggregator: Aggregates counter increments in process and writes them to Redis in
+    batches.
+"""
+
+from asyncio import Future, Task, CancelledError, ensure_future, gather, shield, sleep
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple, Union
+from aioredis import Redis, MultiExecError, ReplyError
+from .redis_model import RedisModel
+from .redis_client import RedisClient
+from .redis_hash import RedisHash
+from .redis_string import RedisString
+
+
+class RedisCounterAggregator(RedisModel):
+    """
+    Aggregates increments of hash field and string counters in process and writes them behind to
+    Redis. Increments to the same counter are summed locally and the totals are flushed as a single
+    transaction, either periodically, once the number of pending counters reaches a threshold or
+    when the aggregator is closed. Can be used as an async context manager, which starts periodic
+    flushing on enter and closes the aggregator on exit.
+    """
+
+    _pending: Dict[Tuple[str, str], Union[int, float]]  # pylint:disable=unsubscriptable-object
+    _flushes: Set[Future]
+    _flush_task: Optional[Task] = None  # pylint:disable=unsubscriptable-object
+    _threshold_flush: Optional[Future] = None  # pylint:disable=unsubscriptable-object
+
+    def __init__(
+        self,
+        redis: Union[Redis, RedisClient],  # pylint:disable=unsubscriptable-object
+        flush_interval_seconds: Union[int, float]=1,  # pylint:disable=unsubscriptable-object
+        max_pending: int=1000,
+        on_dropped: Callable[[str, str, Union[int, float], ReplyError], Any]=None
+    ):
+        """
+        Creates an instance of `RedisCounterAggregator`.
+
+        Args:
+            redis (Union[Redis, RedisClient]): The Redis instance to use to connect to Redis.
+                This can be an instance of `RedisClient` to allow controlling transactions
+                externally.
+            flush_interval_seconds (Union[int, float], optional): The amount of time in seconds
+                between periodic flushes. Defaults to 1.
+            max_pending (int, optional): The number of distinct pending counters after which a
+                flush is triggered without waiting for the next periodic flush. Defaults to 1000.
+            on_dropped (Callable[[str, str, Union[int, float], ReplyError], Any], optional): A
+                function called with the key, field, amount and error of each increment that
+                Redis rejected, such as an increment of a key holding another type. Rejected
+                increments would fail again, so they are dropped instead of retried. Defaults to
+                `None`.
+        """
+
+        super().__init__(redis)
+        self._flush_interval_seconds = flush_interval_seconds
+        self._max_pending = max_pending
+        self._on_dropped = on_dropped
+        self._pending = {}
+        self._flushes = set()
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.close()
+
+    def pending_count(self) -> int:
+        """
+        Gets the number of distinct counters with increments that have not been flushed yet.
+
+        Returns:
+            int: The number of pending counters.
+        """
+
+        return len(self._pending)
+
+    def increment(
+        self,
+        key: str,
+        amount: Union[int, float]=1,  # pylint:disable=unsubscriptable-object
+        field: str=None
+    ):
+        """
+        Records an increment of a counter. Nothing is sent to Redis until the next flush.
+
+        Args:
+            key (str): The Redis key of the counter.
+            amount (Union[int, float], optional): The amount to increment by. Can be negative.
+                Defaults to 1.
+            field (str, optional): The hash field to increment. If `None`, the key is treated as a
+                string counter. Defaults to `None`.
+        """
+
+        counter = (key, field)
+        self._pending[counter] = self._pending.get(counter, 0) + amount
+        if len(self._pending) >= self._max_pending and self._threshold_flush is None:
+            self._threshold_flush = self._schedule_flush()
+            self._threshold_flush.add_done_callback(self._clear_threshold_flush)
+
+    async def flush(self):
+        """
+        Writes all pending increments to Redis in a single transaction. If the transaction fails,
+        the increments are returned to the pending counters so that they are not lost. If only
+        some increments fail, Redis still applies the others, so only the failed increments are
+        returned. Increments rejected by Redis, such as increments of keys holding another type,
+        are dropped and reported to `on_dropped` instead.
+        """
+
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        operations = []
+        try:
+            async with self.begin_transaction() as transaction:
+                operations = [
+                    RedisHash(self._redis, key).increment(field, amount) if field is not None \
+                        else RedisString(self._redis, key).increment(amount)
+                    for (key, field), amount in pending.items()
+                ]
+                transaction.add_operation(*operations)
+        except MultiExecError:
+            results = await gather(*operations, return_exceptions=True)
+            for ((key, field), amount), result in zip(pending.items(), results):
+                if isinstance(result, ReplyError):
+                    if self._on_dropped is not None:
+                        self._on_dropped(key, field, amount, result)
+                elif isinstance(result, Exception):
+                    self._restore([((key, field), amount)])
+            raise
+        except Exception:
+            self._restore(pending.items())
+            raise
+
+    def start(self):
+        """
+        Starts flushing pending increments periodically in the background.
+        """
+
+        if self._flush_task is None:
+            self._flush_task = ensure_future(self._flush_periodically())
+
+    async def close(self):
+        """
+        Stops periodic flushing, waits for in-flight flushes and flushes all remaining increments.
+        """
+
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except CancelledError:
+                pass
+            self._flush_task = None
+
+        if self._flushes:
+            await gather(*self._flushes)
+        await self.flush()
+
+    def _restore(self, increments: Iterable[Tuple[Tuple[str, str], Union[int, float]]]):
+        for counter, amount in increments:
+            self._pending[counter] = self._pending.get(counter, 0) + amount
+
+    async def _flush_periodically(self):
+        while True:
+            await sleep(self._flush_interval_seconds)
+            # Shielded so that closing the aggregator never interrupts a flush halfway.
+            await shield(self._schedule_flush())
+
+    def _clear_threshold_flush(self, _: Future):
+        self._threshold_flush = None
+
+    def _schedule_flush(self) -> Future:
+        flush = ensure_future(self._try_flush())
+        self._flushes.add(flush)
+        flush.add_done_callback(self._flushes.discard)
+        return flush
+
+    async def _try_flush(self):
+        try:
+            await self.flush()
+        except Exception:  # pylint:disable=broad-except
+            # Failed increments are back in the pending counters and are retried on the next flush.
+            pass
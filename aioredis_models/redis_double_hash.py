@@ -3,7 +3,10 @@ This module contains the following classes:
 - RedisDoubleHash: Represents a two-way hash map stored in Redis.
 """
 
-from typing import Awaitable, List, Set, Union
+import json
+from collections import defaultdict
+from itertools import islice
+from typing import Any, Awaitable, Callable, Iterable, List, Set, Tuple, Union
 # Aliasing this to avoid confusion with the `set` function below.
 from builtins import set as builtin_set
 from aioredis import Redis
@@ -11,6 +14,7 @@ from .redis_model import RedisModel
 from .redis_client import RedisClient
 from .redis_key import RedisKey
 from .redis_set import RedisSet
+from .redis_keyspace_scanner import RedisKeyspaceScanner
 
 
 class RedisDoubleHash(RedisModel):
@@ -21,12 +25,96 @@ class RedisDoubleHash(RedisModel):
     thus referred to as inverted fields. Since this class manages more than one Redis structure,
     some of the methods here are not completely atomic and most of them cannot participate in
     transactions.
+
+    By default, the values of each field are stored in their own Redis set named after the key and
+    the field, which creates one Redis key per field and per value. With the compact layout, each
+    side is instead stored as a single Redis hash map from fields to JSON lists of values, which
+    avoids the overhead of millions of small keys and lets small maps use compact encodings. In the
+    compact layout, adding or removing a value rewrites the list of its field in a Lua script, so
+    it suits maps where each field has few values.
+    """
+
+    _ADD_SCRIPT = """
+        local current = redis.call('hget', KEYS[1], ARGV[1])
+        local members = current and cjson.decode(current) or {}
+        local seen = {}
+        for _, member in ipairs(members) do
+            seen[member] = true
+        end
+        local added = 0
+        for index = 2, #ARGV do
+            if not seen[ARGV[index]] then
+                seen[ARGV[index]] = true
+                members[#members + 1] = ARGV[index]
+                added = added + 1
+            end
+        end
+        if added > 0 then
+            redis.call('hset', KEYS[1], ARGV[1], cjson.encode(members))
+        end
+        return added
+    """
+    _REMOVE_SCRIPT = """
+        local current = redis.call('hget', KEYS[1], ARGV[1])
+        if not current then
+            return 0
+        end
+        local removing = {}
+        for index = 2, #ARGV do
+            removing[ARGV[index]] = true
+        end
+        local members = {}
+        local removed = 0
+        for _, member in ipairs(cjson.decode(current)) do
+            if removing[member] then
+                removed = removed + 1
+            else
+                members[#members + 1] = member
+            end
+        end
+        if #members == 0 then
+            redis.call('hdel', KEYS[1], ARGV[1])
+        elseif removed > 0 then
+            redis.call('hset', KEYS[1], ARGV[1], cjson.encode(members))
+        end
+        return removed
+    """
+    _QUERY_SCRIPT = """
+        local packed = redis.call('hmget', KEYS[1], unpack(ARGV, 3))
+        local counts = {}
+        local members = {}
+        for _, current in ipairs(packed) do
+            if current then
+                for _, member in ipairs(cjson.decode(current)) do
+                    if not counts[member] then
+                        counts[member] = 0
+                        members[#members + 1] = member
+                    end
+                    counts[member] = counts[member] + 1
+                end
+            end
+        end
+        local required = ARGV[1] == '1' and #packed or 1
+        local result = {}
+        for _, member in ipairs(members) do
+            if counts[member] >= required then
+                result[#result + 1] = member
+            end
+        end
+        if ARGV[2] == '1' then
+            return #result
+        end
+        return result
+    """
+    _COUNT_SCRIPT = """
+        return #redis.call(ARGV[1] == '1' and 'sinter' or 'sunion', unpack(KEYS))
     """
 
     def __init__(
         self,
         redis: Union[Redis, RedisClient],  # pylint:disable=unsubscriptable-object
-        key: str, inverse_key: str
+        key: str, inverse_key: str,
+        compact: bool=False
     ):
         """
         Creates an instance of `RedisDoubleHash`.
@@ -35,11 +123,48 @@ class RedisDoubleHash(RedisModel):
             redis (Redis): The Redis instance to use to connect to Redis.
             key (str): The key to use for forward hash map.
             inverse_key (str): The key to use for inverted hash map.
+            compact (bool, optional): Whether to store each side as a single Redis hash map
+                instead of one Redis set per field. The two layouts are not compatible with each
+                other. Defaults to `False`.
         """
 
         super().__init__(redis)
         self._key = key
         self._inverse_key = inverse_key
+        self._compact = compact
+
+    @property
+    def key(self) -> str:
+        """
+        Gets the key of the forward hash map.
+
+        Returns:
+            str: The key of the forward hash map.
+        """
+
+        return self._key
+
+    @property
+    def inverse_key(self) -> str:
+        """
+        Gets the key of the inverted hash map.
+
+        Returns:
+            str: The key of the inverted hash map.
+        """
+
+        return self._inverse_key
+
+    @property
+    def compact(self) -> bool:
+        """
+        Gets a value indicating whether the hash map uses the compact layout.
+
+        Returns:
+            bool: Whether each side is stored as a single Redis hash map.
+        """
+
+        return self._compact
 
     async def fields(self) -> Awaitable[Set]:
         """
@@ -49,6 +174,8 @@ class RedisDoubleHash(RedisModel):
             Awaitable[Set]: The fields in the hash map.
         """
 
+        if self._compact:
+            return builtin_set(await self.get_connection().hkeys(self._key, encoding='utf-8'))
         return builtin_set(
             self._extract_field_name(redis_key, self._key) \
                 for redis_key in await self._fields_generic()
@@ -62,6 +189,10 @@ class RedisDoubleHash(RedisModel):
             Awaitable[Set]: The inverted fields (values) in the hash map.
         """
 
+        if self._compact:
+            return builtin_set(
+                await self.get_connection().hkeys(self._inverse_key, encoding='utf-8')
+            )
         return builtin_set(
             self._extract_field_name(redis_key, self._inverse_key) \
                 for redis_key in await self._fields_generic(inverse=True)
@@ -93,6 +224,89 @@ class RedisDoubleHash(RedisModel):
 
         return self._get_field_value(self._inverse_key, field)
 
+    def get_all_of(self, fields: Iterable[str]) -> Awaitable[List]:
+        """
+        Gets the inverted fields associated with all of the given fields. The intersection is
+        computed by Redis, so only the result is transferred.
+
+        Args:
+            fields (Iterable[str]): The fields to get.
+
+        Returns:
+            Awaitable[List]: The list of inverted fields associated with every given field.
+        """
+
+        return self._query(self._key, fields, match_all=True)
+
+    def get_any_of(self, fields: Iterable[str]) -> Awaitable[List]:
+        """
+        Gets the inverted fields associated with any of the given fields. The union is computed by
+        Redis, so only the result is transferred.
+
+        Args:
+            fields (Iterable[str]): The fields to get.
+
+        Returns:
+            Awaitable[List]: The list of inverted fields associated with at least one given field.
+        """
+
+        return self._query(self._key, fields, match_all=False)
+
+    def get_inverted_all_of(self, fields: Iterable[str]) -> Awaitable[List]:
+        """
+        Gets the fields associated with all of the given inverted fields (values). The
+        intersection is computed by Redis, so only the result is transferred.
+
+        Args:
+            fields (Iterable[str]): The inverted fields to get.
+
+        Returns:
+            Awaitable[List]: The list of fields associated with every given inverted field.
+        """
+
+        return self._query(self._inverse_key, fields, match_all=True)
+
+    def get_inverted_any_of(self, fields: Iterable[str]) -> Awaitable[List]:
+        """
+        Gets the fields associated with any of the given inverted fields (values). The union is
+        computed by Redis, so only the result is transferred.
+
+        Args:
+            fields (Iterable[str]): The inverted fields to get.
+
+        Returns:
+            Awaitable[List]: The list of fields associated with at least one given inverted field.
+        """
+
+        return self._query(self._inverse_key, fields, match_all=False)
+
+    def count(
+        self,
+        fields: Iterable[str],
+        match_all: bool=True,
+        inverted: bool=False
+    ) -> Awaitable[int]:
+        """
+        Counts the inverted fields associated with all or any of the given fields, like
+        `get_all_of` and `get_any_of` and their inverted equivalents, without transferring them.
+
+        Args:
+            fields (Iterable[str]): The fields, or inverted fields if `inverted` is set, to count
+                the associations of.
+            match_all (bool, optional): Whether to count the associations common to all of the
+                given fields instead of those of any of them. Defaults to `True`.
+            inverted (bool, optional): Whether the given fields are inverted fields (values).
+                Defaults to `False`.
+
+        Returns:
+            Awaitable[int]: The number of associated inverted fields, or fields if `inverted` is
+                set.
+        """
+
+        return self._query(
+            self._inverse_key if inverted else self._key, fields, match_all, count_only=True
+        )
+
     async def set(self, field: str, value: str):
         """
         Associates the given value with the given field.
@@ -129,6 +343,36 @@ class RedisDoubleHash(RedisModel):
                 self._unset_field(self._inverse_key, value, field)
             )
 
+    async def set_many(self, pairs: Iterable[Tuple[str, str]], batch_size: int=1000):
+        """
+        Associates each of the given values with its field. The pairs are written in transactions
+        of up to `batch_size` pairs, in which the values of each field and the fields of each
+        value are added with a single command. Pairs with a value of `None` are skipped. This
+        operation is not atomic as a whole.
+
+        Args:
+            pairs (Iterable[Tuple[str, str]]): The pairs of fields and values to associate.
+            batch_size (int, optional): The maximum number of pairs to write in each transaction.
+                Defaults to 1000.
+        """
+
+        await self._update_many(pairs, batch_size)
+
+    async def unset_many(self, pairs: Iterable[Tuple[str, str]], batch_size: int=1000):
+        """
+        Dissociates each of the given values from its field. The pairs are written in
+        transactions of up to `batch_size` pairs, in which the values of each field and the
+        fields of each value are removed with a single command. Pairs with a value of `None` are
+        skipped. This operation is not atomic as a whole.
+
+        Args:
+            pairs (Iterable[Tuple[str, str]]): The pairs of fields and values to dissociate.
+            batch_size (int, optional): The maximum number of pairs to write in each transaction.
+                Defaults to 1000.
+        """
+
+        await self._update_many(pairs, batch_size, unset=True)
+
     async def set_inverted(self, field: str, value: str):
         """
         Associates the given value with the inverted field.
@@ -162,28 +406,106 @@ class RedisDoubleHash(RedisModel):
 
         return await self._remove_generic(self._inverse_key, self._key, field)
 
-    async def delete(self):
-        """
-        Deletes all mappings from both sides of the hash map.
+    async def delete(
+        self,
+        batch_size: int=1000,
+        on_progress: Callable[[int], Any]=None
+    ) -> int:
         """
+        Deletes all mappings from both sides of the hash map. The Redis sets of the fields are
+        found with SCAN, filtered by type on the server, and deleted with one UNLINK command per
+        batch, so memory stays bounded and the server is never blocked for long, however large the
+        hash map is. Requires Redis 6.0 or later, or Redis 4.0 or later with the compact layout.
+        This operation is not atomic and cannot be performed transactionally.
 
-        all_keys = builtin_set()
+        Args:
+            batch_size (int, optional): The number of keys to scan for and delete at once.
+                Defaults to 1000.
+            on_progress (Callable[[int], Any], optional): A function called after each batch with
+                the number of keys deleted so far. Defaults to `None`.
 
-        async with self.begin_transaction() as transaction:
-            transaction.add_operation(
-                self._fields_generic(),
-                self._fields_generic(inverse=True)
+        Returns:
+            int: The number of keys that were deleted.
+        """
+
+        if self._compact:
+            deleted = await self.get_connection().unlink(self._key, self._inverse_key)
+            if on_progress is not None:
+                on_progress(deleted)
+            return deleted
+
+        deleted = 0
+        batch = []
+
+        async def unlink_batch():
+            nonlocal deleted, batch
+            deleted += await RedisKey.unlink_many(batch, batch_size)
+            batch = []
+            if on_progress is not None:
+                on_progress(deleted)
+
+        scanner = RedisKeyspaceScanner(self._redis, batch_size=batch_size)
+        for key in (self._key, self._inverse_key):
+            async for redis_set in scanner.scan(self._get_field_name(key, '*'), key_type='set'):
+                batch.append(redis_set)
+                if len(batch) >= batch_size:
+                    await unlink_batch()
+        if batch:
+            await unlink_batch()
+        return deleted
+
+    async def _update_many(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        batch_size: int,
+        unset: bool=False
+    ):
+        iterator = iter(pairs)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            values = defaultdict(list)
+            fields = defaultdict(list)
+            for field, value in batch:
+                if value is not None:
+                    values[field].append(value)
+                    fields[value].append(field)
+            if not values:
+                continue
+            async with self.begin_transaction() as transaction:
+                for key, members_by_field in ((self._key, values), (self._inverse_key, fields)):
+                    for field, members in members_by_field.items():
+                        transaction.add_operation(
+                            self._unset_field(key, field, *members) if unset
+                            else self._set_field(key, field, *members)
+                        )
+
+    async def _query(
+        self,
+        key: str,
+        fields: Iterable[str],
+        match_all: bool,
+        count_only: bool=False
+    ) -> Any:
+        # Repeated fields would not change the result but would be sent and read again.
+        fields = list(dict.fromkeys(fields))
+        if not fields:
+            return 0 if count_only else []
+        if self._compact:
+            return await self.get_connection().execute(
+                b'EVAL', self._QUERY_SCRIPT, 1, key, int(match_all), int(count_only), *fields,
+                encoding='utf-8'
             )
-            transaction.set_result_callback(
-                lambda *result: all_keys.update(
-                    key for keys in result for key in keys
-                )
+        redis_keys = [self._get_field_name(key, field) for field in fields]
+        if count_only:
+            return await self.get_connection().eval(
+                self._COUNT_SCRIPT, keys=redis_keys, args=[int(match_all)]
             )
-
-        async with self.begin_transaction() as transaction:
-            transaction.add_operation(*(
-                RedisKey(self.get_connection(), key).delete() for key in all_keys
-            ))
+        sub_set = RedisSet(self._redis, redis_keys[0])
+        if match_all:
+            return await sub_set.intersection(*redis_keys[1:])
+        return await sub_set.union(*redis_keys[1:])
 
     def _fields_generic(self, inverse: bool=False) -> Awaitable[List]:
         return self.get_connection().keys(self._get_field_name(
@@ -192,18 +514,40 @@ class RedisDoubleHash(RedisModel):
         ), encoding='utf-8')
 
     def _get_field_value(self, key: str, field: str) -> Awaitable[List]:
+        if self._compact:
+            return self._get_packed_value(key, field)
         sub_set = self._get_redis_set(key, field)
         return sub_set.get_all()
 
-    def _set_field(self, key: str, field: str, value: str):
+    async def _get_packed_value(self, key: str, field: str) -> List:
+        packed = await self.get_connection().hget(key, field, encoding='utf-8')
+        return json.loads(packed) if packed else []
+
+    def _set_field(self, key: str, field: str, value: str, *values: Tuple):
+        if self._compact:
+            return self.get_connection().eval(
+                self._ADD_SCRIPT, keys=[key], args=[field, value, *values]
+            )
         sub_set = self._get_redis_set(key, field)
-        return sub_set.add(value)
+        return sub_set.add(value, *values)
 
-    def _unset_field(self, key: str, field: str, value: str):
+    def _unset_field(self, key: str, field: str, value: str, *values: Tuple):
+        if self._compact:
+            return self.get_connection().eval(
+                self._REMOVE_SCRIPT, keys=[key], args=[field, value, *values]
+            )
         sub_set = self._get_redis_set(key, field)
-        return sub_set.remove(value)
+        return sub_set.remove(value, *values)
 
     async def _remove_generic(self, key: str, inverse_key: str, field: str):
+        if self._compact:
+            values = await self._get_packed_value(key, field)
+            async with self.begin_transaction() as transaction:
+                transaction.add_operation(self.get_connection().hdel(key, field))
+                for value in values:
+                    transaction.add_operation(self._unset_field(inverse_key, value, field))
+            return
+
         sub_set = self._get_redis_set(key, field)
         values = await sub_set.get_all()
         async with self.begin_transaction() as transaction:
@@ -0,0 +1,305 @@
+"""
+This module contains the following classes:
+- RedisDoubleHashMirror: Mirrors a two-way hash map stored in Redis in process.
+"""
+
+import json
+import re
+from asyncio import CancelledError, Future, ensure_future, gather
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from aioredis.pubsub import Channel
+from .redis_double_hash import RedisDoubleHash
+from .redis_keyspace_scanner import RedisKeyspaceScanner
+
+
+class _MirroredSide:
+    """
+    Holds the mirrored fields of one side of a `RedisDoubleHash`.
+    """
+
+    entries: Dict[str, List]
+    stale: Set[str]
+    versions: Dict[str, int]
+
+    def __init__(self, key: str):
+        self.key = key
+        self.entries = {}
+        self.stale = set()
+        self.versions = {}
+        self.generation = 0
+        self.loaded = False
+
+    def invalidate(self, field: str):
+        """
+        Drops a field that changed in Redis.
+        """
+
+        self.entries.pop(field, None)
+        self.stale.add(field)
+        self.versions[field] = self.versions.get(field, 0) + 1
+
+    def reset(self):
+        """
+        Drops all fields, such as when changes can no longer be seen.
+        """
+
+        self.entries.clear()
+        self.stale.clear()
+        self.versions.clear()
+        self.generation += 1
+        self.loaded = False
+
+    def snapshot(self, field: str) -> Tuple[int, int]:
+        """
+        Gets the version of a field, to compare against once it has been read.
+        """
+
+        return self.generation, self.versions.get(field, 0)
+
+    def store(self, field: str, values: List, snapshot: Tuple[int, int]):
+        """
+        Stores the values read for a field, unless it changed since the snapshot was taken.
+        """
+
+        if snapshot != self.snapshot(field):
+            return
+        self.stale.discard(field)
+        if values:
+            self.entries[field] = values
+        else:
+            self.entries.pop(field, None)
+
+
+class RedisDoubleHashMirror:
+    """
+    Mirrors the sides of a `RedisDoubleHash` in process, so that reading the values of a field or
+    the fields of a value is a dictionary lookup. The mirrored sides are loaded in bulk and kept
+    up to date with Redis keyspace notifications, which must be enabled on the server with the
+    `notify-keyspace-events` setting including the 'K' and 'g' classes and either 's' for the
+    default layout or 'h' for the compact layout.
+
+    A notification for a field drops it from the mirror and the next read of the field gets it
+    from Redis again, so changes made by any client are picked up. Notifications are delivered
+    asynchronously, so reads may briefly return values that were just changed. In the compact
+    layout, notifications do not name the changed field, so every change drops the whole side and
+    its fields are read from Redis again one at a time. If the subscription ends, such as when the
+    connection is lost, the mirror is dropped and reads go to Redis until it is started again.
+    Subscribing puts a single connection in subscribe mode, where it cannot send other commands,
+    so the double hash must use a connection pool, such as one created with `create_redis_pool`,
+    which subscribes on a dedicated connection. Loading the default layout scans by type, which
+    requires Redis 6.0 or later. Can be used as an async context manager, which starts the mirror
+    on enter and stops it on exit.
+    """
+
+    _listeners: List[Future]
+    _patterns: List[str]
+    _prefix: Optional[str] = None  # pylint:disable=unsubscriptable-object
+    _subscribed: bool = False
+
+    def __init__(
+        self,
+        redis_double_hash: RedisDoubleHash,
+        mirror_fields: bool=True,
+        mirror_inverted_fields: bool=True
+    ):
+        """
+        Creates an instance of `RedisDoubleHashMirror`.
+
+        Args:
+            redis_double_hash (RedisDoubleHash): The two-way hash map to mirror.
+            mirror_fields (bool, optional): Whether to mirror the forward side, which serves
+                `get`. Defaults to `True`.
+            mirror_inverted_fields (bool, optional): Whether to mirror the inverted side, which
+                serves `get_inverted`. Defaults to `True`.
+        """
+
+        self._redis_double_hash = redis_double_hash
+        self._forward = _MirroredSide(redis_double_hash.key) if mirror_fields else None
+        self._inverse = _MirroredSide(redis_double_hash.inverse_key) \
+            if mirror_inverted_fields else None
+        self._listeners = []
+        self._patterns = []
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.stop()
+
+    def is_started(self) -> bool:
+        """
+        Returns a value indicating whether the mirror is subscribed to changes.
+
+        Returns:
+            bool: Whether the mirror is started.
+        """
+
+        return self._subscribed
+
+    async def start(self, batch_size: int=1000):
+        """
+        Subscribes to the keyspace notifications of the mirrored sides and loads them. The
+        subscription is made before loading, so changes made while loading are not missed.
+
+        Args:
+            batch_size (int, optional): The number of fields to read at once while loading.
+                Defaults to 1000.
+        """
+
+        if self.is_started() or not self._get_sides():
+            return
+
+        # Listeners left over from a subscription that ended are cancelled before subscribing again.
+        await self._cancel_listeners()
+        connection = self._redis_double_hash.get_connection()
+        self._prefix = f'__keyspace@{connection.db}__:'
+        self._patterns = [
+            self._prefix + self._escape_pattern(side.key) + \
+                ('' if self._redis_double_hash.compact else ':*')
+            for side in self._get_sides()
+        ]
+        channels = await connection.psubscribe(*self._patterns)
+        self._subscribed = True
+        self._listeners = [ensure_future(self._listen(channel)) for channel in channels]
+        await self.load(batch_size)
+
+    async def stop(self):
+        """
+        Unsubscribes from keyspace notifications and drops the mirror.
+        """
+
+        if not self._listeners:
+            return
+
+        self._subscribed = False
+        try:
+            await self._redis_double_hash.get_connection().punsubscribe(*self._patterns)
+        finally:
+            await self._cancel_listeners()
+            self._reset()
+
+    async def load(self, batch_size: int=1000):
+        """
+        Reloads the mirrored sides from Redis. Fields are read in batches and fields that change
+        while loading are read from Redis again on their next read. This operation is not atomic
+        and cannot be performed transactionally.
+
+        Args:
+            batch_size (int, optional): The number of fields to read at once. Defaults to 1000.
+        """
+
+        await gather(*(self._load_side(side, batch_size) for side in self._get_sides()))
+
+    def get(self, field: str) -> Awaitable[List]:
+        """
+        Gets the inverted fields associated with the given field, from the mirror if the forward
+        side is mirrored.
+
+        Args:
+            field (str): The field to get.
+
+        Returns:
+            Awaitable[List]: The list of all inverted fields associated with the given field.
+        """
+
+        return self._get_field_value(self._forward, self._redis_double_hash.get, field)
+
+    def get_inverted(self, field: str) -> Awaitable[List]:
+        """
+        Gets the fields associated with the given inverted field (value), from the mirror if the
+        inverted side is mirrored.
+
+        Args:
+            field (str): The inverted field to get.
+
+        Returns:
+            Awaitable[List]: The list of all fields associated with the given inverted field.
+        """
+
+        return self._get_field_value(
+            self._inverse, self._redis_double_hash.get_inverted, field
+        )
+
+    async def _get_field_value(
+        self,
+        side: Optional[_MirroredSide],  # pylint:disable=unsubscriptable-object
+        fetch: Callable[[str], Awaitable[List]],
+        field: str
+    ) -> List:
+        if side is None or not self.is_started():
+            return await fetch(field)
+        values = side.entries.get(field)
+        if values is not None:
+            return list(values)
+        if side.loaded and field not in side.stale:
+            return []
+        snapshot = side.snapshot(field)
+        values = await fetch(field)
+        side.store(field, values, snapshot)
+        return list(values)
+
+    async def _load_side(self, side: _MirroredSide, batch_size: int):
+        connection = self._redis_double_hash.get_connection()
+        generation = side.generation
+        if self._redis_double_hash.compact:
+            # Fields of the compact layout are only ever dropped together, so they have no versions.
+            packed = await connection.hgetall(side.key, encoding='utf-8')
+            for field, values in packed.items():
+                side.store(field, json.loads(values), (generation, 0))
+        else:
+            batch = []
+            scanner = RedisKeyspaceScanner(connection, batch_size=batch_size)
+            async for redis_set in scanner.scan(f'{self._escape_pattern(side.key)}:*', 'set'):
+                batch.append(redis_set)
+                if len(batch) >= batch_size:
+                    await self._load_batch(side, batch)
+                    batch = []
+            await self._load_batch(side, batch)
+        if side.generation == generation:
+            side.loaded = True
+
+    @staticmethod
+    async def _load_batch(side: _MirroredSide, redis_sets: List):
+        fields = [redis_set.key[len(side.key) + 1:] for redis_set in redis_sets]
+        snapshots = [side.snapshot(field) for field in fields]
+        results = await gather(*(redis_set.get_all() for redis_set in redis_sets))
+        for field, values, snapshot in zip(fields, results, snapshots):
+            side.store(field, values, snapshot)
+
+    async def _listen(self, channel: Channel):
+        try:
+            async for channel_name, _ in channel.iter():
+                self._invalidate(channel_name.decode('utf-8')[len(self._prefix):])
+        finally:
+            # Changes cannot be seen without the subscription, so the mirror can no longer be used.
+            self._subscribed = False
+            self._reset()
+
+    async def _cancel_listeners(self):
+        listeners, self._listeners = self._listeners, []
+        for listener in listeners:
+            listener.cancel()
+            try:
+                await listener
+            except CancelledError:
+                pass
+
+    def _invalidate(self, redis_key: str):
+        for side in self._get_sides():
+            if self._redis_double_hash.compact:
+                if redis_key == side.key:
+                    side.reset()
+            elif redis_key.startswith(side.key + ':'):
+                side.invalidate(redis_key[len(side.key) + 1:])
+
+    def _reset(self):
+        for side in self._get_sides():
+            side.reset()
+
+    def _get_sides(self) -> List[_MirroredSide]:
+        return [side for side in (self._forward, self._inverse) if side is not None]
+
+    @staticmethod
+    def _escape_pattern(key: str) -> str:
+        return re.sub(r'([*?\[\]\\])', r'\\\1', key)
@@ -3,7 +3,7 @@ This module contains the following classes:
 - RedisHash: Represents a hash map stored in Redis.
 """
 
-from typing import List, Any, Awaitable, AsyncIterator
+from typing import List, Tuple, Any, Awaitable, AsyncIterator, Union
 from .redis_key import RedisKey
 from .asyncio_utils import noop
 
@@ -92,6 +92,24 @@ class RedisHash(RedisKey):
 
         return self.get_connection().hget(self._key, field, encoding=encoding)
 
+    def get_many(self, *fields: Tuple, encoding='utf-8') -> Awaitable[List]:
+        """
+        Gets the values of the given fields in the hash map using a single HMGET command.
+
+        Args:
+            fields (Tuple): The fields to get.
+            encoding (str, optional): The encoding to use for decoding the values. Defaults to
+                'utf-8'.
+
+        Returns:
+            Awaitable[List]: The values of the fields in the same order as the fields. Values of
+                fields that do not exist are `None`.
+        """
+
+        if not fields:
+            return noop([])
+        return self.get_connection().hmget(self._key, *fields, encoding=encoding)
+
     async def enumerate(
         self,
         field_pattern: str=None,
@@ -147,15 +165,73 @@ class RedisHash(RedisKey):
             return self.get_connection().hset(self._key, field, value)
         return noop()
 
-    def remove(self, field: str) -> Awaitable[int]:
+    def increment(
+        self,
+        field: str,
+        amount: Union[int, float]=1  # pylint:disable=unsubscriptable-object
+    ) -> Awaitable[Union[int, float]]:  # pylint:disable=unsubscriptable-object
+        """
+        Increments the numeric value of the given field. Uses HINCRBYFLOAT if `amount` is a float
+        and HINCRBY otherwise. A field that does not exist is treated as 0.
+
+        Args:
+            field (str): The field whose value is to be incremented.
+            amount (Union[int, float], optional): The amount to increment by. Can be negative.
+                Defaults to 1.
+
+        Returns:
+            Awaitable[Union[int, float]]: The value of the field after the increment.
+        """
+
+        if isinstance(amount, float):
+            return self.get_connection().hincrbyfloat(self._key, field, amount)
+        return self.get_connection().hincrby(self._key, field, amount)
+
+    async def sync(self, values: dict, snapshot: dict=None, encoding='utf-8') -> dict:
+        """
+        Makes the hash map equal to the given `dict` by writing only the fields whose values differ
+        from the snapshot and removing only the fields missing from it, in a single transaction.
+        The snapshot is the `dict` returned by the previous call, which reflects what was last
+        written. Values are compared as-is, so they should be strings for the comparison with a
+        snapshot read from Redis to be accurate.
+
+        Args:
+            values (dict): A `dict` containing the complete key/value map to store.
+            snapshot (dict, optional): The `dict` returned by the previous call. If `None`, the
+                hash map is read from Redis to be used as the snapshot. Defaults to `None`.
+            encoding (str, optional): The encoding to use for decoding the hash map when it has
+                to be read. Defaults to 'utf-8'.
+
+        Returns:
+            dict: The snapshot to pass to the next call.
+        """
+
+        if snapshot is None:
+            snapshot = await self.get_all(encoding=encoding)
+
+        changed = {
+            field: value for field, value in values.items()
+            if field not in snapshot or snapshot[field] != value
+        }
+        removed = [field for field in snapshot if field not in values]
+        if changed or removed:
+            async with self.begin_transaction() as transaction:
+                if changed:
+                    transaction.add_operation(self.set_all(changed))
+                if removed:
+                    transaction.add_operation(self.remove(*removed))
+        return dict(values)
+
+    def remove(self, field: str, *fields: Tuple) -> Awaitable[int]:
         """
-        Removes the given field from the hash map.
+        Removes the given field(s) from the hash map.
 
         Args:
             field (str): The field to remove.
+            fields (Tuple): Additional fields to remove.
 
         Returns:
             Awaitable[int]: The number of field removed from the hash map.
         """
 
-        return self.get_connection().hdel(self._key, field)
+        return self.get_connection().hdel(self._key, field, *fields)
@@ -3,7 +3,12 @@ This module contains the following classes:
 - RedisKey: represents a generic Redis key.
 """
 
-from typing import Awaitable, Union
+from asyncio import gather, sleep
+from contextlib import asynccontextmanager
+from copy import copy
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, List, Optional, Union
+from uuid import uuid4
 from aioredis import Redis
 from .redis_model import RedisModel
 from .redis_client import RedisClient
@@ -14,6 +19,15 @@ class RedisKey(RedisModel):
     Represents a Redis key of any type. Acts as the class for all data structures.
     """
 
+    _SWAP_SCRIPT = """
+        if redis.call('exists', KEYS[2]) == 1 then
+            redis.call('rename', KEYS[2], KEYS[3])
+        end
+        if redis.call('exists', KEYS[1]) == 1 then
+            redis.call('rename', KEYS[1], KEYS[2])
+        end
+    """
+
     def __init__(
         self,
         redis: Union[Redis, RedisClient],  # pylint:disable=unsubscriptable-object
@@ -32,6 +46,17 @@ class RedisKey(RedisModel):
         super().__init__(redis)
         self._key = key
 
+    @property
+    def key(self) -> str:
+        """
+        Gets the Redis key of this instance.
+
+        Returns:
+            str: The Redis key.
+        """
+
+        return self._key
+
     def delete(self) -> Awaitable[int]:
         """
         Deletes the key from Redis.
@@ -42,6 +67,106 @@ class RedisKey(RedisModel):
 
         return self.get_connection().delete(self._key)
 
+    def unlink(self) -> Awaitable[int]:
+        """
+        Deletes the key from Redis without blocking the server, freeing the memory of the value in
+        the background. Requires Redis 4.0 or later.
+
+        Returns:
+            Awaitable[int]: The number of items that were deleted.
+        """
+
+        return self.get_connection().unlink(self._key)
+
+    async def delete_incrementally(
+        self,
+        batch_size: int=100,
+        delay_seconds: Union[int, float]=0  # pylint:disable=unsubscriptable-object
+    ):
+        """
+        Deletes the key by removing its items in small batches before deleting the key itself, so
+        that deleting a very large hash map, set, sorted set or list never blocks the server for
+        long. Useful when UNLINK is not available. Items added while this is in progress may be
+        removed by the final DEL in one go. This operation is not atomic and cannot be performed
+        transactionally.
+
+        Args:
+            batch_size (int, optional): The approximate number of items to remove with each
+                command. Defaults to 100.
+            delay_seconds (Union[int, float], optional): The amount of time in seconds to wait
+                between batches. Defaults to 0.
+        """
+
+        connection = self.get_connection()
+        key_type = await connection.execute(b'TYPE', self._key, encoding='utf-8')
+        if key_type == 'hash':
+            cursor = None
+            while cursor != 0:
+                cursor, items = await connection.hscan(self._key, cursor or 0, count=batch_size)
+                if items:
+                    await connection.hdel(self._key, *(field for field, _ in items))
+                    await sleep(delay_seconds)
+        elif key_type == 'set':
+            while await connection.spop(self._key, count=batch_size):
+                await sleep(delay_seconds)
+        elif key_type == 'zset':
+            while await connection.zremrangebyrank(self._key, 0, batch_size - 1):
+                await sleep(delay_seconds)
+        elif key_type == 'list':
+            while await connection.llen(self._key):
+                await connection.ltrim(self._key, 0, -batch_size - 1)
+                await sleep(delay_seconds)
+        await connection.delete(self._key)
+
+    def copy_to(self, destination_key: str, replace: bool=False) -> Awaitable[int]:
+        """
+        Copies the value of the key to another key on the server, using the COPY command. Requires
+        Redis 6.2 or later.
+
+        Args:
+            destination_key (str): The key to copy the value to.
+            replace (bool, optional): Whether to replace the value of the destination key if it
+                exists. Defaults to `False`.
+
+        Returns:
+            Awaitable[int]: 1 if the value was copied, 0 if the key does not exist or the
+                destination key exists and `replace` is `False`.
+        """
+
+        args = [b'REPLACE'] if replace else []
+        return self._redis.execute(b'COPY', self._key, destination_key, *args)
+
+    @asynccontextmanager
+    async def rebuild(self) -> AsyncIterator['RedisKey']:
+        """
+        Rebuilds the value of the key without readers ever seeing a partially built value. Returns
+        an async context manager giving a copy of this model that uses a temporary key, which
+        should be filled with bulk writes. When the context exits, the temporary key atomically
+        replaces the key, and the previous value is freed in the background with UNLINK. If the
+        context exits with an exception, the temporary key is deleted and the key is left
+        unchanged. The timeout of the key is not kept; set one on the copy if needed. This
+        operation cannot be performed transactionally, although the copy can be filled in
+        transactions.
+
+        Returns:
+            AsyncIterator[RedisKey]: An async context manager giving the model to build the new
+                value with.
+        """
+
+        staging = copy(self)
+        staging._key = f'{self._key}:rebuild:{uuid4().hex}'  # pylint:disable=protected-access
+        try:
+            yield staging
+        except BaseException:
+            await staging.unlink()
+            raise
+
+        old_key = f'{self._key}:old:{uuid4().hex}'
+        await self.get_connection().eval(
+            self._SWAP_SCRIPT, keys=[staging.key, self._key, old_key]
+        )
+        await self.get_connection().unlink(old_key)
+
     async def exists(self) -> Awaitable[bool]:
         """
         Checks if the key exists in Redis or not. This operation cannot be performed
@@ -52,3 +177,124 @@ class RedisKey(RedisModel):
         """
 
         return await self.get_connection().exists(self._key) > 0
+
+    def expire(
+        self,
+        timeout_seconds: Union[int, float]  # pylint:disable=unsubscriptable-object
+    ) -> Awaitable[bool]:
+        """
+        Sets the key to expire after the given amount of time, with millisecond precision.
+
+        Args:
+            timeout_seconds (Union[int, float]): The amount of time in seconds after which the key
+                should expire.
+
+        Returns:
+            Awaitable[bool]: Whether the timeout was set, `False` if the key does not exist.
+        """
+
+        return self.get_connection().pexpire(self._key, round(timeout_seconds * 1000))
+
+    def expire_at(
+        self,
+        timestamp: Union[int, float, datetime]  # pylint:disable=unsubscriptable-object
+    ) -> Awaitable[bool]:
+        """
+        Sets the key to expire at the given time, with millisecond precision.
+
+        Args:
+            timestamp (Union[int, float, datetime]): The time at which the key should expire,
+                either as a `datetime` or as a Unix timestamp in seconds.
+
+        Returns:
+            Awaitable[bool]: Whether the timeout was set, `False` if the key does not exist.
+        """
+
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.timestamp()
+        return self.get_connection().pexpireat(self._key, round(timestamp * 1000))
+
+    def persist(self) -> Awaitable[bool]:
+        """
+        Removes the timeout of the key so that it does not expire.
+
+        Returns:
+            Awaitable[bool]: Whether the timeout was removed, `False` if the key does not exist or
+                has no timeout.
+        """
+
+        return self.get_connection().persist(self._key)
+
+    async def ttl(self) -> Optional[float]:  # pylint:disable=unsubscriptable-object
+        """
+        Gets the remaining time to live of the key, with millisecond precision. This operation
+        cannot be performed transactionally.
+
+        Returns:
+            Optional[float]: The remaining time in seconds, or `None` if the key does not exist or
+                has no timeout.
+        """
+
+        milliseconds = await self.get_connection().pttl(self._key)
+        return None if milliseconds < 0 else milliseconds / 1000
+
+    @staticmethod
+    async def expire_many(
+        keys: List['RedisKey'],
+        timeout_seconds: Union[int, float, dict]  # pylint:disable=unsubscriptable-object
+    ) -> List[bool]:
+        """
+        Sets the timeouts of the given keys in a single transaction. A timeout of `None` removes
+        the timeout of a key. The keys must be stored on the same Redis server and the connection
+        of the first key is used.
+
+        Args:
+            keys (List[RedisKey]): The keys to set the timeouts of.
+            timeout_seconds (Union[int, float, dict]): The amount of time in seconds after which
+                the keys should expire, either for all keys or as a `dict` mapping Redis keys to
+                their own timeout. Keys missing from the `dict` are left untouched.
+
+        Returns:
+            List[bool]: Whether the timeout of each key was changed, in the same order as the keys.
+        """
+
+        if not isinstance(timeout_seconds, dict):
+            timeout_seconds = dict.fromkeys((key.key for key in keys), timeout_seconds)
+        updated_keys = [key for key in keys if key.key in timeout_seconds]
+        if not updated_keys:
+            return [False] * len(keys)
+
+        async with keys[0].begin_transaction() as transaction:
+            connection = keys[0].get_connection()
+            operations = [
+                connection.persist(key.key) if timeout_seconds[key.key] is None
+                else connection.pexpire(key.key, round(timeout_seconds[key.key] * 1000))
+                for key in updated_keys
+            ]
+            transaction.add_operation(*operations)
+        results = iter(await gather(*operations))
+        return [bool(next(results)) if key.key in timeout_seconds else False for key in keys]
+
+    @staticmethod
+    async def unlink_many(keys: List['RedisKey'], batch_size: int=1000) -> int:
+        """
+        Deletes the given keys without blocking the server, using one UNLINK command per batch so
+        that each command stays short. The keys must be stored on the same Redis server and the
+        connection of the first key is used. This operation is not atomic and cannot be performed
+        transactionally.
+
+        Args:
+            keys (List[RedisKey]): The keys to delete.
+            batch_size (int, optional): The number of keys to delete with each command. Defaults
+                to 1000.
+
+        Returns:
+            int: The number of keys that were deleted.
+        """
+
+        deleted = 0
+        for index in range(0, len(keys), batch_size):
+            deleted += await keys[0].get_connection().unlink(
+                *(key.key for key in keys[index:index + batch_size])
+            )
+        return deleted
@@ -0,0 +1,137 @@
+"""
+This module contains the following classes:
+- RedisKeyspaceScanner: Iterates over the keys stored in Redis as typed models.
+"""
+
+from asyncio import Semaphore, gather, sleep
+from time import monotonic
+from typing import AsyncIterator, List, Optional, Union
+from aioredis import Redis
+from .redis_model import RedisModel
+from .redis_client import RedisClient
+from .redis_hash import RedisHash
+from .redis_list import RedisList
+from .redis_set import RedisSet
+from .redis_string import RedisString
+from .redis_key import RedisKey
+
+
+class RedisKeyspaceScanner(RedisModel):
+    """
+    Iterates over the keys stored in Redis using the incremental SCAN command, yielding each key as
+    an instance of the model matching its type: `RedisHash`, `RedisList`, `RedisSet` or
+    `RedisString`, and `RedisKey` for other types. Scans can be throttled to protect the server and
+    resumed from the `cursor` of an earlier scan, which makes the scanner suitable for long
+    maintenance jobs.
+    """
+
+    _MODELS = {
+        'hash': RedisHash,
+        'list': RedisList,
+        'set': RedisSet,
+        'string': RedisString
+    }
+
+    _cursor: Optional[int] = 0  # pylint:disable=unsubscriptable-object
+    _next_scan_at: float = 0
+
+    def __init__(
+        self,
+        redis: Union[Redis, RedisClient],  # pylint:disable=unsubscriptable-object
+        batch_size: int=None,
+        max_scans_per_second: Union[int, float]=None,  # pylint:disable=unsubscriptable-object
+        max_concurrency: int=10
+    ):
+        """
+        Creates an instance of `RedisKeyspaceScanner`.
+
+        Args:
+            redis (Union[Redis, RedisClient]): The Redis instance to use to connect to Redis.
+                This can be an instance of `RedisClient` to allow controlling transactions
+                externally.
+            batch_size (int, optional): The approximate number of keys to get with each scan.
+                Defaults to `None`, which uses the server default.
+            max_scans_per_second (Union[int, float], optional): The maximum number of SCAN
+                commands to send per second. Defaults to `None`, which does not throttle.
+            max_concurrency (int, optional): The maximum number of TYPE commands in flight at
+                once when scanning keys of all types. Defaults to 10.
+        """
+
+        super().__init__(redis)
+        self._batch_size = batch_size
+        self._max_scans_per_second = max_scans_per_second
+        self._max_concurrency = max_concurrency
+
+    @property
+    def cursor(self) -> Optional[int]:  # pylint:disable=unsubscriptable-object
+        """
+        Gets the cursor to pass to `scan` to resume the last scan. The cursor only advances once
+        all keys of a batch have been yielded, so resuming may yield some keys again but never
+        skips keys.
+
+        Returns:
+            Optional[int]: The cursor, or `None` if the last scan completed.
+        """
+
+        return self._cursor
+
+    async def scan(
+        self,
+        pattern: str=None,
+        key_type: str=None,
+        cursor: int=0
+    ) -> AsyncIterator[RedisKey]:
+        """
+        Enumerates over the keys stored in Redis. SCAN guarantees that every key present for the
+        whole scan is returned, but a key may be returned more than once. This operation is not
+        atomic and cannot be performed transactionally.
+
+        Args:
+            pattern (str, optional): A glob-style pattern to filter keys with. Defaults to `None`.
+            key_type (str, optional): The type of keys to return, such as 'hash', 'list', 'set' or
+                'string', filtered on the server. Requires Redis 6.0 or later. Defaults to `None`,
+                which returns keys of all types and looks up the type of each key.
+            cursor (int, optional): The cursor to start from, such as the `cursor` of an
+                interrupted scan. Defaults to 0, which starts a new scan.
+
+        Returns:
+            AsyncIterator[RedisKey]: An iterator over the keys as models.
+        """
+
+        self._cursor = cursor
+        while self._cursor is not None:
+            next_cursor, keys = await self._scan(self._cursor, pattern, key_type)
+            if key_type is not None:
+                types = [key_type] * len(keys)
+            else:
+                types = await self._get_types(keys)
+            for key, current_type in zip(keys, types):
+                if current_type != 'none':
+                    yield self._MODELS.get(current_type, RedisKey)(self._redis, key)
+            self._cursor = next_cursor or None
+
+    async def _scan(self, cursor: int, pattern: str, key_type: str):
+        if self._max_scans_per_second:
+            delay = self._next_scan_at - monotonic()
+            if delay > 0:
+                await sleep(delay)
+            self._next_scan_at = monotonic() + 1 / self._max_scans_per_second
+
+        args = [cursor]
+        if pattern is not None:
+            args.extend((b'MATCH', pattern))
+        if self._batch_size is not None:
+            args.extend((b'COUNT', self._batch_size))
+        if key_type is not None:
+            args.extend((b'TYPE', key_type))
+        next_cursor, keys = await self.get_connection().execute(b'SCAN', *args, encoding='utf-8')
+        return int(next_cursor), keys
+
+    async def _get_types(self, keys: List[str]) -> List[str]:
+        semaphore = Semaphore(self._max_concurrency)
+
+        async def get_type(key):
+            async with semaphore:
+                return await self.get_connection().execute(b'TYPE', key, encoding='utf-8')
+
+        return await gather(*(get_type(key) for key in keys))
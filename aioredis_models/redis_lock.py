@@ -0,0 +1,242 @@
+"""
+This module contains the following classes:
+- RedisLock: Represents a distributed lock stored in Redis.
+"""
+
+from asyncio import CancelledError, Task, ensure_future, sleep
+from math import ceil
+from time import monotonic
+from typing import Optional, Union
+from uuid import uuid4
+from aioredis import Redis
+from .redis_key import RedisKey
+from .redis_client import RedisClient
+from .redis_list import RedisList
+
+
+class RedisLock(RedisKey):
+    """
+    Represents a distributed lock stored in Redis. The lock is held for a lease that expires
+    automatically, so a crashed holder cannot block others forever. Release and extension are
+    atomic check-and-act Lua scripts that only affect the lock if it is still held by this
+    instance. Every acquisition increments a counter atomically with the lock, giving a fencing
+    token that can be passed to other systems to reject writes from holders whose lease has
+    expired. Waiting for the lock blocks on a signal list that is pushed to on release instead of
+    polling, which wakes one waiter per release. Blocking waits hold a connection, so a connection
+    pool should be used when waiting. When the lease is renewed automatically and a renewal fails,
+    `lost` is set, since the lock may have expired and been acquired by another holder. Can be
+    used as an async context manager.
+    """
+
+    _ACQUIRE_SCRIPT = """
+        if redis.call('set', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2]) then
+            return redis.call('incr', KEYS[2])
+        end
+        return 0
+    """
+    _RELEASE_SCRIPT = """
+        if redis.call('get', KEYS[1]) == ARGV[1] then
+            redis.call('del', KEYS[1], KEYS[2])
+            redis.call('rpush', KEYS[2], 1)
+            redis.call('pexpire', KEYS[2], ARGV[2])
+            return 1
+        end
+        return 0
+    """
+    _EXTEND_SCRIPT = """
+        if redis.call('get', KEYS[1]) == ARGV[1] then
+            return redis.call('pexpire', KEYS[1], ARGV[2])
+        end
+        return 0
+    """
+
+    _token: Optional[str] = None  # pylint:disable=unsubscriptable-object
+    _fencing_token: Optional[int] = None  # pylint:disable=unsubscriptable-object
+    _renew_task: Optional[Task] = None  # pylint:disable=unsubscriptable-object
+    _lost: bool = False
+
+    def __init__(
+        self,
+        redis: Union[Redis, RedisClient],  # pylint:disable=unsubscriptable-object
+        key: str,
+        lease_seconds: Union[int, float]=10,  # pylint:disable=unsubscriptable-object
+        auto_renew: bool=False
+    ):
+        """
+        Creates an instance of `RedisLock`.
+
+        Args:
+            redis (Union[Redis, RedisClient]): The Redis instance to use to connect to Redis.
+                This can be an instance of `RedisClient` to allow controlling transactions
+                externally.
+            key (str): The Redis key to use.
+            lease_seconds (Union[int, float], optional): The amount of time in seconds after which
+                the lock expires unless it is extended. Defaults to 10.
+            auto_renew (bool, optional): Whether to extend the lease in the background every third
+                of the lease while the lock is held, for long critical sections. Defaults to
+                `False`.
+        """
+
+        super().__init__(redis, key)
+        self._lease_seconds = lease_seconds
+        self._auto_renew = auto_renew
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.release()
+
+    @property
+    def fencing_token(self) -> Optional[int]:  # pylint:disable=unsubscriptable-object
+        """
+        Gets the fencing token of the current acquisition. Tokens increase with every acquisition
+        of the lock by any holder.
+
+        Returns:
+            Optional[int]: The fencing token, `None` if the lock has not been acquired.
+        """
+
+        return self._fencing_token
+
+    @property
+    def lost(self) -> bool:
+        """
+        Gets a value indicating whether an automatic renewal of the current acquisition failed, in
+        which case the lock may no longer be held by this instance.
+
+        Returns:
+            bool: Whether the lock was lost while held.
+        """
+
+        return self._lost
+
+    async def acquire(
+        self,
+        blocking: bool=True,
+        timeout_seconds: Union[int, float]=None  # pylint:disable=unsubscriptable-object
+    ) -> bool:
+        """
+        Acquires the lock. This operation cannot be performed transactionally.
+
+        Args:
+            blocking (bool, optional): Whether to wait until the lock is available. Defaults to
+                `True`.
+            timeout_seconds (Union[int, float], optional): The maximum amount of time in seconds to
+                wait for the lock. Defaults to `None`, which waits indefinitely.
+
+        Returns:
+            bool: Whether the lock was acquired.
+        """
+
+        deadline = None if timeout_seconds is None else monotonic() + timeout_seconds
+        token = uuid4().hex
+        while True:
+            fencing_token = await self.get_connection().eval(
+                self._ACQUIRE_SCRIPT,
+                keys=[self._key, self._get_fence_key()],
+                args=[token, self._get_lease_milliseconds()]
+            )
+            if fencing_token:
+                self._token = token
+                self._fencing_token = fencing_token
+                self._lost = False
+                if self._auto_renew:
+                    self._renew_task = ensure_future(self._renew_periodically())
+                return True
+            if not blocking:
+                return False
+
+            # Wake up on release, or when the lease of a holder that did not release expires.
+            milliseconds = await self.get_connection().pttl(self._key)
+            wait_seconds = milliseconds / 1000
+            if milliseconds < 0 and milliseconds != -2:
+                # The lock has no lease, so only a release wakes up waiters.
+                wait_seconds = self._lease_seconds
+            if deadline is not None:
+                remaining_seconds = deadline - monotonic()
+                if remaining_seconds <= 0:
+                    return False
+                wait_seconds = min(wait_seconds, remaining_seconds)
+            if wait_seconds > 0:
+                await RedisList(self._redis, self._get_signal_key()).pop(
+                    block=True,
+                    timeout_seconds=max(ceil(wait_seconds), 1)
+                )
+
+    async def release(self) -> bool:
+        """
+        Releases the lock if it is still held by this instance and wakes up one waiter.
+
+        Returns:
+            bool: Whether the lock was released, `False` if it had expired or was not acquired.
+        """
+
+        await self._stop_renewing()
+        if self._token is None:
+            return False
+        token, self._token = self._token, None
+        self._fencing_token = None
+        return bool(await self.get_connection().eval(
+            self._RELEASE_SCRIPT,
+            keys=[self._key, self._get_signal_key()],
+            args=[token, self._get_lease_milliseconds()]
+        ))
+
+    async def extend(
+        self,
+        lease_seconds: Union[int, float]=None  # pylint:disable=unsubscriptable-object
+    ) -> bool:
+        """
+        Resets the lease of the lock if it is still held by this instance.
+
+        Args:
+            lease_seconds (Union[int, float], optional): The new lease in seconds. Defaults to
+                `None`, which uses the lease given when the instance was created.
+
+        Returns:
+            bool: Whether the lease was extended, `False` if the lock had expired or was not
+                acquired.
+        """
+
+        if self._token is None:
+            return False
+        return bool(await self.get_connection().eval(
+            self._EXTEND_SCRIPT,
+            keys=[self._key],
+            args=[self._token, self._get_lease_milliseconds(lease_seconds)]
+        ))
+
+    async def _renew_periodically(self):
+        try:
+            while True:
+                await sleep(self._lease_seconds / 3)
+                if not await self.extend():
+                    self._lost = True
+                    return
+        except Exception:
+            self._lost = True
+            raise
+
+    async def _stop_renewing(self):
+        if self._renew_task is not None:
+            self._renew_task.cancel()
+            try:
+                await self._renew_task
+            except (CancelledError, Exception):  # pylint:disable=broad-except
+                # A failed renewal is reported through `lost`; the lock must still be released.
+                pass
+            self._renew_task = None
+
+    def _get_lease_milliseconds(
+        self,
+        lease_seconds: Union[int, float]=None  # pylint:disable=unsubscriptable-object
+    ) -> int:
+        return round((lease_seconds or self._lease_seconds) * 1000)
+
+    def _get_fence_key(self) -> str:
+        return f'{self._key}:fence'
+
+    def _get_signal_key(self) -> str:
+        return f'{self._key}:signal'
@@ -0,0 +1,207 @@
+"""
+This module contains the following classes:
+- RedisMemoryReport: Reports the memory used by keys stored in Redis.
+"""
+
+import json
+from asyncio import gather
+from typing import Any, Dict, List, Union
+from aioredis import Redis
+from .redis_model import RedisModel
+from .redis_client import RedisClient
+from .redis_key import RedisKey
+from .redis_keyspace_scanner import RedisKeyspaceScanner
+
+
+class RedisMemoryReport(RedisModel):
+    """
+    Reports the memory used by keys stored in Redis, to help choose between data layouts. Each key
+    is inspected with MEMORY USAGE, OBJECT ENCODING, PTTL and the command giving its length, and
+    keys are aggregated by prefix. Hash maps, sets and sorted sets that grew out of their compact
+    encodings, which use several times more memory per item, are listed separately. Keys are found
+    with the throttled SCAN of `RedisKeyspaceScanner`, and the report is a `dict` that can be
+    serialized to JSON.
+    """
+
+    _LENGTH_COMMANDS = {
+        'string': b'STRLEN',
+        'hash': b'HLEN',
+        'list': b'LLEN',
+        'set': b'SCARD',
+        'zset': b'ZCARD',
+        'stream': b'XLEN'
+    }
+    _NON_COMPACT_ENCODINGS = {'hashtable', 'skiplist'}
+    _DEFAULT_BATCH_SIZE = 10
+
+    def __init__(
+        self,
+        redis: Union[Redis, RedisClient],  # pylint:disable=unsubscriptable-object
+        batch_size: int=None,
+        max_scans_per_second: Union[int, float]=None,  # pylint:disable=unsubscriptable-object
+        prefix_separator: str=':'
+    ):
+        """
+        Creates an instance of `RedisMemoryReport`.
+
+        Args:
+            redis (Union[Redis, RedisClient]): The Redis instance to use to connect to Redis.
+                This can be an instance of `RedisClient` to allow controlling transactions
+                externally.
+            batch_size (int, optional): The approximate number of keys to scan and inspect at
+                once. Defaults to `None`, which uses the server default for scanning.
+            max_scans_per_second (Union[int, float], optional): The maximum number of SCAN
+                commands to send per second. Defaults to `None`, which does not throttle.
+            prefix_separator (str, optional): The separator ending the prefix of a key, which is
+                used to aggregate keys. Defaults to ':'.
+        """
+
+        super().__init__(redis)
+        self._batch_size = batch_size
+        self._max_scans_per_second = max_scans_per_second
+        self._prefix_separator = prefix_separator
+
+    async def inspect(
+        self,
+        key: Union[RedisKey, str]  # pylint:disable=unsubscriptable-object
+    ) -> Dict[str, Any]:
+        """
+        Gets the memory usage, encoding, length and time to live of a key. This operation cannot be
+        performed transactionally.
+
+        Args:
+            key (Union[RedisKey, str]): The model or Redis key to inspect.
+
+        Returns:
+            Dict[str, Any]: A `dict` with the key, its type, encoding, memory usage in bytes,
+                length, remaining time to live in seconds (`None` if it does not expire) and
+                whether its encoding is compact. `None` if the key does not exist.
+        """
+
+        if isinstance(key, RedisKey):
+            key = key.key
+        connection = self.get_connection()
+        key_type, memory, encoding, ttl = await gather(
+            connection.execute(b'TYPE', key, encoding='utf-8'),
+            connection.execute(b'MEMORY', b'USAGE', key),
+            connection.object_encoding(key),
+            connection.pttl(key)
+        )
+        if key_type == 'none':
+            return None
+        length_command = self._LENGTH_COMMANDS.get(key_type)
+        return {
+            'key': key,
+            'type': key_type,
+            'encoding': encoding,
+            'memory_bytes': memory,
+            'length': await connection.execute(length_command, key) if length_command else None,
+            'ttl_seconds': ttl / 1000 if ttl >= 0 else None,
+            'compact': encoding not in self._NON_COMPACT_ENCODINGS
+        }
+
+    async def report(
+        self,
+        pattern: str=None,
+        key_type: str=None,
+        max_keys: int=None
+    ) -> Dict[str, Any]:
+        """
+        Inspects the keys matching a pattern and aggregates them by prefix. This operation is not
+        atomic and cannot be performed transactionally.
+
+        Args:
+            pattern (str, optional): A glob-style pattern to filter keys with, such as the key of
+                a model followed by '*'. Defaults to `None`, which inspects all keys.
+            key_type (str, optional): The type of keys to inspect, such as 'hash'. Requires Redis
+                6.0 or later. Defaults to `None`, which inspects keys of all types.
+            max_keys (int, optional): The maximum number of keys to inspect, to report on a sample
+                of a large keyspace. Defaults to `None`, which inspects all matching keys.
+
+        Returns:
+            Dict[str, Any]: A `dict` with the totals over all inspected keys under 'total', the
+                totals per prefix under 'prefixes', and the inspection results of keys with a
+                non-compact encoding under 'non_compact_keys'.
+        """
+
+        total = self._create_totals()
+        prefixes = {}
+        non_compact_keys = []
+        batch = []
+        scanner = RedisKeyspaceScanner(
+            self._redis, self._batch_size, self._max_scans_per_second
+        )
+        scanned = 0
+        async for redis_key in scanner.scan(pattern, key_type):
+            if max_keys is not None and scanned >= max_keys:
+                break
+            scanned += 1
+            batch.append(redis_key.key)
+            if len(batch) >= (self._batch_size or self._DEFAULT_BATCH_SIZE):
+                await self._add_batch(batch, total, prefixes, non_compact_keys)
+                batch = []
+        await self._add_batch(batch, total, prefixes, non_compact_keys)
+        return {
+            'total': total,
+            'prefixes': prefixes,
+            'non_compact_keys': non_compact_keys
+        }
+
+    async def report_json(
+        self,
+        pattern: str=None,
+        key_type: str=None,
+        max_keys: int=None
+    ) -> str:
+        """
+        Inspects the keys matching a pattern and aggregates them by prefix like `report`, and
+        serializes the result to JSON. This operation is not atomic and cannot be performed
+        transactionally.
+
+        Args:
+            pattern (str, optional): A glob-style pattern to filter keys with. Defaults to `None`,
+                which inspects all keys.
+            key_type (str, optional): The type of keys to inspect. Defaults to `None`, which
+                inspects keys of all types.
+            max_keys (int, optional): The maximum number of keys to inspect. Defaults to `None`,
+                which inspects all matching keys.
+
+        Returns:
+            str: The report as JSON.
+        """
+
+        return json.dumps(await self.report(pattern, key_type, max_keys))
+
+    async def _add_batch(
+        self,
+        keys: List[str],
+        total: Dict[str, Any],
+        prefixes: Dict[str, Dict[str, Any]],
+        non_compact_keys: List[Dict[str, Any]]
+    ):
+        results = await gather(*(self.inspect(key) for key in keys))
+        for result in results:
+            if result is None:
+                continue
+            prefix = result['key'].split(self._prefix_separator, 1)[0]
+            for totals in (total, prefixes.setdefault(prefix, self._create_totals())):
+                totals['keys'] += 1
+                totals['memory_bytes'] += result['memory_bytes'] or 0
+                totals['length'] += result['length'] or 0
+                totals['keys_without_ttl'] += result['ttl_seconds'] is None
+                totals['non_compact_keys'] += not result['compact']
+                encodings = totals['encodings']
+                encodings[result['encoding']] = encodings.get(result['encoding'], 0) + 1
+            if not result['compact']:
+                non_compact_keys.append(result)
+
+    @staticmethod
+    def _create_totals() -> Dict[str, Any]:
+        return {
+            'keys': 0,
+            'memory_bytes': 0,
+            'length': 0,
+            'keys_without_ttl': 0,
+            'non_compact_keys': 0,
+            'encodings': {}
+        }
@@ -0,0 +1,249 @@
+"""
+This module contains the following classes:
+- RedisPackedArray: Represents an array of fixed-width numbers packed into a Redis string.
+"""
+
+import sys
+from array import array
+from typing import Any, Awaitable, Iterable, List, Union
+from aioredis import Redis
+from .redis_key import RedisKey
+from .redis_client import RedisClient
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class RedisPackedArray(RedisKey):
+    """
+    Represents an array of fixed-width numbers packed into a Redis string in little-endian byte
+    order, with the layout of the standard `array` module. Elements and slices are read and written
+    in place with GETRANGE and SETRANGE, and whole arrays are decoded straight from the stored bytes
+    without any parsing. Values are returned as `array.array` instances, or as read-only NumPy
+    arrays that are views over the received bytes if NumPy is used.
+    """
+
+    def __init__(
+        self,
+        redis: Union[Redis, RedisClient],  # pylint:disable=unsubscriptable-object
+        key: str,
+        typecode: str='d',
+        use_numpy: bool=False
+    ):
+        """
+        Creates an instance of `RedisPackedArray`.
+
+        Args:
+            redis (Union[Redis, RedisClient]): The Redis instance to use to connect to Redis.
+                This can be an instance of `RedisClient` to allow controlling transactions
+                externally.
+            key (str): The Redis key to use.
+            typecode (str, optional): The type of the elements, as an `array` module typecode
+                other than 'u' or 'w'. Defaults to 'd', a double precision float.
+            use_numpy (bool, optional): Whether to return NumPy arrays instead of `array.array`
+                instances. Requires NumPy to be installed. Defaults to `False`.
+        """
+
+        if use_numpy and numpy is None:
+            raise ImportError('NumPy is required when use_numpy is True.')
+        super().__init__(redis, key)
+        self._typecode = typecode
+        self._item_size = array(typecode).itemsize
+        self._use_numpy = use_numpy
+
+    @property
+    def item_size(self) -> int:
+        """
+        Gets the size in bytes of each element.
+
+        Returns:
+            int: The size of each element.
+        """
+
+        return self._item_size
+
+    async def length(self) -> int:
+        """
+        Gets the number of elements in the array.
+
+        Returns:
+            int: The number of elements.
+        """
+
+        return await self.get_connection().strlen(self._key) // self._item_size
+
+    async def get(self) -> Any:
+        """
+        Gets all elements of the array.
+
+        Returns:
+            Any: The elements as an `array.array` or a NumPy array, or `None` if the key does not
+                exist.
+        """
+
+        data = await self.get_connection().get(self._key, encoding=None)
+        return None if data is None else self._unpack(data)
+
+    def set(
+        self,
+        values: Iterable,
+        timeout_seconds: Union[int, float]=None  # pylint:disable=unsubscriptable-object
+    ) -> Awaitable:
+        """
+        Replaces all elements of the array.
+
+        Args:
+            values (Iterable): The elements, such as an `array.array`, a NumPy array or a list of
+                numbers.
+            timeout_seconds (Union[int, float], optional): The amount of time in seconds after which
+                the key should expire. Defaults to `None`.
+
+        Returns:
+            Awaitable: The result of the operation.
+        """
+
+        return self.get_connection().set(
+            self._key,
+            self._pack(values),
+            pexpire=round(timeout_seconds * 1000) if timeout_seconds else None
+        )
+
+    async def get_item(
+        self,
+        index: int
+    ) -> Union[int, float]:  # pylint:disable=unsubscriptable-object
+        """
+        Gets the element at the given index.
+
+        Args:
+            index (int): The non-negative index of the element.
+
+        Returns:
+            Union[int, float]: The element.
+
+        Raises:
+            IndexError: If the index is beyond the end of the array.
+        """
+
+        values = await self.get_slice(index, index + 1)
+        if len(values) == 0:
+            raise IndexError('RedisPackedArray index out of range')
+        return values[0]
+
+    async def get_slice(self, start: int, stop: int) -> Any:
+        """
+        Gets the elements from `start` up to, but not including, `stop`, reading only their bytes.
+
+        Args:
+            start (int): The non-negative index of the first element.
+            stop (int): The non-negative index after the last element.
+
+        Returns:
+            Any: The elements as an `array.array` or a NumPy array. Shorter than requested if the
+                array ends before `stop`.
+        """
+
+        if stop <= start:
+            return self._unpack(b'')
+        data = await self.get_connection().getrange(
+            self._key, start * self._item_size, stop * self._item_size - 1, encoding=None
+        )
+        return self._unpack(data)
+
+    def set_item(
+        self,
+        index: int,
+        value: Union[int, float]  # pylint:disable=unsubscriptable-object
+    ) -> Awaitable[int]:
+        """
+        Sets the element at the given index. The array is padded with zeros if needed.
+
+        Args:
+            index (int): The non-negative index of the element.
+            value (Union[int, float]): The value of the element.
+
+        Returns:
+            Awaitable[int]: The length of the string in bytes after the operation.
+        """
+
+        return self.set_slice(index, [value])
+
+    def set_slice(self, start: int, values: Iterable) -> Awaitable[int]:
+        """
+        Overwrites the elements starting at the given index, writing only their bytes. The array
+        is padded with zeros or extended if needed.
+
+        Args:
+            start (int): The non-negative index of the first element to overwrite.
+            values (Iterable): The new elements.
+
+        Returns:
+            Awaitable[int]: The length of the string in bytes after the operation.
+        """
+
+        return self.get_connection().setrange(
+            self._key, start * self._item_size, self._pack(values)
+        )
+
+    def extend(self, values: Iterable) -> Awaitable[int]:
+        """
+        Appends elements to the end of the array, creating it if it does not exist.
+
+        Args:
+            values (Iterable): The elements to append.
+
+        Returns:
+            Awaitable[int]: The length of the string in bytes after the operation.
+        """
+
+        return self.get_connection().append(self._key, self._pack(values))
+
+    @staticmethod
+    async def get_many(arrays: List['RedisPackedArray']) -> List[Any]:
+        """
+        Gets all elements of each of the given arrays with a single MGET command. The arrays must
+        be stored on the same Redis server and the connection of the first array is used.
+
+        Args:
+            arrays (List[RedisPackedArray]): The arrays to get.
+
+        Returns:
+            List[Any]: The elements of each array, in the same order as the arrays, with `None`
+                for arrays that do not exist.
+        """
+
+        if not arrays:
+            return []
+        values = await arrays[0].get_connection().mget(
+            *(packed_array.key for packed_array in arrays), encoding=None
+        )
+        return [
+            None if data is None else packed_array._unpack(data)  # pylint:disable=protected-access
+            for packed_array, data in zip(arrays, values)
+        ]
+
+    def _pack(self, values: Iterable) -> bytes:
+        if self._use_numpy:
+            return numpy.asarray(values, dtype=self._get_dtype()).tobytes()
+        if not isinstance(values, array) or values.typecode != self._typecode \
+                or sys.byteorder == 'big':
+            values = array(self._typecode, values)
+            if sys.byteorder == 'big':
+                values.byteswap()
+        return values.tobytes()
+
+    def _unpack(self, data: bytes) -> Any:
+        # Ignore a trailing partial element, e.g. from a slice that ends beyond the array.
+        end = len(data) - len(data) % self._item_size
+        if self._use_numpy:
+            return numpy.frombuffer(data, dtype=self._get_dtype(), count=end // self._item_size)
+        values = array(self._typecode)
+        values.frombytes(memoryview(data)[:end])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values
+
+    def _get_dtype(self) -> Any:
+        return numpy.dtype(self._typecode).newbyteorder('<')
@@ -0,0 +1,11 @@
+"""
+Provides Lua snippets shared by the scripts of several models.
+"""
+
+# Sets the local `now` to the server time in milliseconds. Scripts that read the time must be
+# replicated by their effects, which is the default from Redis 5 onwards.
+SERVER_TIME_MILLISECONDS = """
+    redis.replicate_commands()
+    local time = redis.call('time')
+    local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+"""
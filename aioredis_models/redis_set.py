@@ -3,8 +3,11 @@ This module contains the following classes:
 - RedisSet: Represents a set stored in Redis.
 """
 
-from typing import Awaitable, List
+from asyncio import ensure_future, gather
+from typing import Any, AsyncIterator, Awaitable, List, Tuple
+from aioredis import ReplyError
 from .redis_key import RedisKey
+from .bloom_filter import BloomFilter
 from .asyncio_utils import noop
 
 
@@ -13,6 +16,27 @@ class RedisSet(RedisKey):
     Represents a set stored in Redis.
     """
 
+    _multi_contains_supported: bool = True
+    _INTERSECTION_CARDINALITY_SCRIPT = """
+        local command = {'sintercard', #KEYS}
+        for _, key in ipairs(KEYS) do
+            command[#command + 1] = key
+        end
+        command[#command + 1] = 'LIMIT'
+        command[#command + 1] = ARGV[1]
+        local count = redis.pcall(unpack(command))
+        if type(count) == 'number' then
+            return count
+        end
+        -- SINTERCARD is unknown before Redis 7.0.
+        count = #redis.call('sinter', unpack(KEYS))
+        local limit = tonumber(ARGV[1])
+        if limit > 0 and count > limit then
+            return limit
+        end
+        return count
+    """
+
     def size(self) -> Awaitable[int]:
         """
         Gets the size of the set.
@@ -37,28 +61,315 @@ class RedisSet(RedisKey):
 
         return self.get_connection().smembers(self._key, encoding=encoding)
 
-    def add(self, value: str) -> Awaitable[int]:
+    async def enumerate(
+        self,
+        pattern: str=None,
+        batch_size: int=None,
+        encoding: str='utf-8',
+        unique: bool=False
+    ) -> AsyncIterator[Any]:
+        """
+        Enumerates over the members of the set using the SSCAN command. The next batch is requested
+        while the current one is being consumed, so at most two batches are held in memory. SSCAN
+        guarantees that every member present for the whole enumeration is returned, but a member
+        may be returned more than once. This operation is not atomic and cannot be performed
+        transactionally.
+
+        Args:
+            pattern (str, optional): A string to filter members with, if needed. Defaults to None.
+            batch_size (int, optional): The approximate number of members to get with each scan.
+                Defaults to None.
+            encoding (str, optional): The encoding to use for decoding members. Defaults to
+                'utf-8'.
+            unique (bool, optional): Whether to remember returned members to skip duplicates. This
+                uses memory proportional to the size of the set, so it should be left off for
+                very large sets. Defaults to `False`.
+
+        Returns:
+            AsyncIterator[Any]: An iterator that can be used to iterate over the result.
+        """
+
+        def scan(cursor):
+            return self.get_connection().sscan(
+                self._key, cursor=cursor, match=pattern, count=batch_size
+            )
+
+        seen = set() if unique else None
+        next_scan = None
+        try:
+            cursor, data = await scan(0)
+            while True:
+                next_scan = ensure_future(scan(cursor)) if cursor != 0 else None
+                for member in data:
+                    if seen is not None:
+                        if member in seen:
+                            continue
+                        seen.add(member)
+                    yield member.decode(encoding) if encoding else member
+                if next_scan is None:
+                    break
+                cursor, data = await next_scan
+        finally:
+            if next_scan is not None:
+                next_scan.cancel()
+
+    def contains(self, value: str) -> Awaitable[bool]:
+        """
+        Checks whether the given value is a member of the set.
+
+        Args:
+            value (str): The value to check.
+
+        Returns:
+            Awaitable[bool]: Whether the value is a member of the set.
+        """
+
+        return self.get_connection().sismember(self._key, value)
+
+    async def contains_many(self, values: List[str], bloom_filter: BloomFilter=None) -> List[bool]:
+        """
+        Checks whether each of the given values is a member of the set in one round trip. Uses
+        SMISMEMBER on Redis 6.2 or later and falls back to concurrent SISMEMBER commands on older
+        servers. This operation cannot be performed transactionally.
+
+        Args:
+            values (List[str]): The values to check.
+            bloom_filter (BloomFilter, optional): A filter built with `build_bloom_filter`. Values
+                that the filter rules out are reported as non-members without querying Redis.
+                The filter must include all members added since it was built. Defaults to `None`.
+
+        Returns:
+            List[bool]: Whether each value is a member of the set, in the same order as the values.
+        """
+
+        result = [False] * len(values)
+        indices = [
+            index for index, value in enumerate(values)
+            if bloom_filter is None or value in bloom_filter
+        ]
+        if not indices:
+            return result
+
+        candidates = [values[index] for index in indices]
+        found = None
+        if self._multi_contains_supported:
+            try:
+                found = await self.get_connection().execute(b'SMISMEMBER', self._key, *candidates)
+            except ReplyError as error:
+                if 'unknown command' not in str(error).lower():
+                    raise
+                self._multi_contains_supported = False
+        if found is None:
+            found = await gather(*(self.contains(value) for value in candidates))
+
+        for index, is_member in zip(indices, found):
+            result[index] = bool(is_member)
+        return result
+
+    async def build_bloom_filter(
+        self,
+        false_positive_rate: float=0.01,
+        batch_size: int=None
+    ) -> BloomFilter:
         """
-        Adds an item to the set.
+        Builds a client-side Bloom filter from the current members of the set using SSCAN, to be
+        passed to `contains_many`. This operation is not atomic and cannot be performed
+        transactionally.
+
+        Args:
+            false_positive_rate (float, optional): The target false positive rate of the filter.
+                Defaults to 0.01.
+            batch_size (int, optional): The approximate number of members to get with each scan.
+                Defaults to None.
+
+        Returns:
+            BloomFilter: A filter containing all members of the set.
+        """
+
+        bloom_filter = BloomFilter(await self.size(), false_positive_rate=false_positive_rate)
+        async for member in self.enumerate(batch_size=batch_size, encoding=None):
+            bloom_filter.add(member)
+        return bloom_filter
+
+    def add(self, value: str, *values: Tuple) -> Awaitable[int]:
+        """
+        Adds one or more items to the set with a single command.
 
         Args:
             value (str): The item to add.
+            values (Tuple): More items to add.
 
         Returns:
             Awaitable[int]: The number of items that were added to the set.
         """
 
-        return noop() if value is None else self.get_connection().sadd(self._key, value)
+        if value is None:
+            return noop()
+        return self.get_connection().sadd(self._key, value, *values)
+
+    def sample(
+        self,
+        count: int,
+        allow_duplicates: bool=False,
+        encoding='utf-8'
+    ) -> Awaitable[List]:
+        """
+        Gets random members of the set without removing them.
+
+        Args:
+            count (int): The number of members to get.
+            allow_duplicates (bool, optional): Whether members are sampled with replacement. If
+                `False`, the members are distinct and fewer than `count` members are returned when
+                the set is smaller. If `True`, exactly `count` members are returned unless the set
+                is empty. Defaults to `False`.
+            encoding (str, optional): The encoding to use when decoding set members. Defaults to
+                'utf-8'.
+
+        Returns:
+            Awaitable[List]: The sampled members.
+        """
+
+        return self.get_connection().srandmember(
+            self._key,
+            -count if allow_duplicates else count,
+            encoding=encoding
+        )
 
-    def remove(self, value: str) -> Awaitable[int]:
+    def pop_many(self, count: int, encoding='utf-8') -> Awaitable[List]:
         """
-        Removes an item from the set.
+        Atomically removes and returns up to the given number of random members of the set.
+
+        Args:
+            count (int): The maximum number of members to pop.
+            encoding (str, optional): The encoding to use when decoding set members. Defaults to
+                'utf-8'.
+
+        Returns:
+            Awaitable[List]: The popped members.
+        """
+
+        return self.get_connection().spop(self._key, count, encoding=encoding)
+
+    def remove(self, value: str, *values: Tuple) -> Awaitable[int]:
+        """
+        Removes one or more items from the set with a single command.
 
         Args:
             value (str): The item to remove.
+            values (Tuple): More items to remove.
 
         Returns:
             Awaitable[int]: The number of elements that were removed from the set.
         """
 
-        return self.get_connection().srem(self._key, value)
+        return self.get_connection().srem(self._key, value, *values)
+
+    def union(self, *keys: Tuple, encoding='utf-8') -> Awaitable[List]:
+        """
+        Gets the members of the union of this set and the sets stored at the given keys.
+
+        Args:
+            keys (Tuple): The keys of the other sets.
+            encoding (str, optional): The encoding to use when decoding set members. Defaults to
+                'utf-8'.
+
+        Returns:
+            Awaitable[List]: The members of the union.
+        """
+
+        return self._redis.execute(b'SUNION', self._key, *keys, encoding=encoding)
+
+    def intersection(self, *keys: Tuple, encoding='utf-8') -> Awaitable[List]:
+        """
+        Gets the members of the intersection of this set and the sets stored at the given keys.
+
+        Args:
+            keys (Tuple): The keys of the other sets.
+            encoding (str, optional): The encoding to use when decoding set members. Defaults to
+                'utf-8'.
+
+        Returns:
+            Awaitable[List]: The members of the intersection.
+        """
+
+        return self._redis.execute(b'SINTER', self._key, *keys, encoding=encoding)
+
+    def difference(self, *keys: Tuple, encoding='utf-8') -> Awaitable[List]:
+        """
+        Gets the members of this set that are not members of any of the sets stored at the given
+        keys.
+
+        Args:
+            keys (Tuple): The keys of the other sets.
+            encoding (str, optional): The encoding to use when decoding set members. Defaults to
+                'utf-8'.
+
+        Returns:
+            Awaitable[List]: The members of the difference.
+        """
+
+        return self._redis.execute(b'SDIFF', self._key, *keys, encoding=encoding)
+
+    def union_store(self, destination_key: str, *keys: Tuple) -> Awaitable[int]:
+        """
+        Stores the union of this set and the sets stored at the given keys in the destination key,
+        overwriting it if it exists.
+
+        Args:
+            destination_key (str): The key to store the result in.
+            keys (Tuple): The keys of the other sets.
+
+        Returns:
+            Awaitable[int]: The number of members in the resulting set.
+        """
+
+        return self.get_connection().sunionstore(destination_key, self._key, *keys)
+
+    def intersection_store(self, destination_key: str, *keys: Tuple) -> Awaitable[int]:
+        """
+        Stores the intersection of this set and the sets stored at the given keys in the
+        destination key, overwriting it if it exists.
+
+        Args:
+            destination_key (str): The key to store the result in.
+            keys (Tuple): The keys of the other sets.
+
+        Returns:
+            Awaitable[int]: The number of members in the resulting set.
+        """
+
+        return self.get_connection().sinterstore(destination_key, self._key, *keys)
+
+    def difference_store(self, destination_key: str, *keys: Tuple) -> Awaitable[int]:
+        """
+        Stores the members of this set that are not members of any of the sets stored at the given
+        keys in the destination key, overwriting it if it exists.
+
+        Args:
+            destination_key (str): The key to store the result in.
+            keys (Tuple): The keys of the other sets.
+
+        Returns:
+            Awaitable[int]: The number of members in the resulting set.
+        """
+
+        return self.get_connection().sdiffstore(destination_key, self._key, *keys)
+
+    def intersection_cardinality(self, *keys: Tuple, limit: int=0) -> Awaitable[int]:
+        """
+        Gets the number of members in the intersection of this set and the sets stored at the given
+        keys without transferring the members. Uses SINTERCARD on Redis 7.0 or later and counts the
+        result of SINTER on the server otherwise.
+
+        Args:
+            keys (Tuple): The keys of the other sets.
+            limit (int, optional): The count at which to stop computing the intersection. Defaults
+                to 0, which indicates no limit.
+
+        Returns:
+            Awaitable[int]: The number of members in the intersection.
+        """
+
+        return self.get_connection().eval(
+            self._INTERSECTION_CARDINALITY_SCRIPT, keys=[self._key, *keys], args=[limit]
+        )
@@ -0,0 +1,108 @@
+"""
+This module contains the following classes:
+- RedisSlidingWindow: Represents a sliding window rate limiter stored in Redis as a sorted set.
+"""
+
+from typing import List, Union
+from uuid import uuid4
+from aioredis import Redis
+from .redis_key import RedisKey
+from .redis_client import RedisClient
+from .redis_scripts import SERVER_TIME_MILLISECONDS
+
+
+class RedisSlidingWindow(RedisKey):
+    """
+    Represents a sliding window rate limiter stored in Redis as a sorted set that logs the time of
+    every allowed request. A request is allowed if fewer than `limit` requests were allowed within
+    the last `window_seconds`. Unlike fixed windows, this does not allow bursts of twice the limit
+    around window boundaries. Each decision is made atomically by a Lua script in a single round
+    trip using the server clock, so concurrent clients on different hosts share the same limit.
+    """
+
+    _ACQUIRE_SCRIPT = SERVER_TIME_MILLISECONDS + """
+        local requested = tonumber(ARGV[1])
+        for index, key in ipairs(KEYS) do
+            local limit = tonumber(ARGV[index * 2 + 1])
+            local window = tonumber(ARGV[index * 2 + 2])
+            redis.call('zremrangebyscore', key, '-inf', now - window)
+            if redis.call('zcard', key) + requested > limit then
+                return 0
+            end
+        end
+        for index, key in ipairs(KEYS) do
+            local window = tonumber(ARGV[index * 2 + 2])
+            for request = 1, requested do
+                redis.call('zadd', key, now, ARGV[2] .. ':' .. request)
+            end
+            redis.call('pexpire', key, window)
+        end
+        return 1
+    """
+
+    def __init__(
+        self,
+        redis: Union[Redis, RedisClient],  # pylint:disable=unsubscriptable-object
+        key: str,
+        limit: int,
+        window_seconds: Union[int, float]  # pylint:disable=unsubscriptable-object
+    ):
+        """
+        Creates an instance of `RedisSlidingWindow`.
+
+        Args:
+            redis (Union[Redis, RedisClient]): The Redis instance to use to connect to Redis.
+                This can be an instance of `RedisClient` to allow controlling transactions
+                externally.
+            key (str): The Redis key to use.
+            limit (int): The maximum number of requests allowed within the window.
+            window_seconds (Union[int, float]): The length of the window in seconds.
+        """
+
+        super().__init__(redis, key)
+        self._limit = limit
+        self._window_seconds = window_seconds
+
+    async def acquire(self, requests: int=1) -> bool:
+        """
+        Records the given number of requests if they fit within the limit.
+
+        Args:
+            requests (int, optional): The number of requests to record. Defaults to 1.
+
+        Returns:
+            bool: Whether the requests were recorded, i.e. whether they are allowed.
+        """
+
+        return await self.acquire_all([self], requests=requests)
+
+    @staticmethod
+    async def acquire_all(windows: List['RedisSlidingWindow'], requests: int=1) -> bool:
+        """
+        Records the given number of requests in every one of the given windows if they fit within
+        all of their limits, in a single round trip. If any limit would be exceeded, no requests
+        are recorded in any window. The windows must be stored on the same Redis server and the
+        connection of the first window is used.
+
+        Args:
+            windows (List[RedisSlidingWindow]): The windows to record requests in.
+            requests (int, optional): The number of requests to record in each window. Defaults
+                to 1.
+
+        Returns:
+            bool: Whether the requests were recorded, i.e. whether they are allowed by all limits.
+        """
+
+        if not windows:
+            return True
+        args = [requests, uuid4().hex]
+        for window in windows:
+            args.extend(window._get_limit())  # pylint:disable=protected-access
+        return bool(await windows[0].get_connection().eval(
+            RedisSlidingWindow._ACQUIRE_SCRIPT,
+            keys=[window.key for window in windows],
+            args=args
+        ))
+
+    def _get_limit(self) -> List[int]:
+        return [self._limit, round(self._window_seconds * 1000)]
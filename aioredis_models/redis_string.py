@@ -3,7 +3,7 @@ This module contains the following classes:
 - RedisString: Represents a string stored in Redis.
 """
 
-from typing import Awaitable, Union
+from typing import AsyncIterable, AsyncIterator, Awaitable, Union
 from .redis_key import RedisKey
 
 
@@ -67,3 +67,102 @@ class RedisString(RedisKey):
             pexpire=round(timeout_seconds * 1000) if timeout_seconds else None,
             exist=exist
         )
+
+    def increment(
+        self,
+        amount: Union[int, float]=1  # pylint:disable=unsubscriptable-object
+    ) -> Awaitable[Union[int, float]]:  # pylint:disable=unsubscriptable-object
+        """
+        Increments the numeric value of the string. Uses INCRBYFLOAT if `amount` is a float and
+        INCRBY otherwise. A key that does not exist is treated as 0.
+
+        Args:
+            amount (Union[int, float], optional): The amount to increment by. Can be negative.
+                Defaults to 1.
+
+        Returns:
+            Awaitable[Union[int, float]]: The value of the string after the increment.
+        """
+
+        if isinstance(amount, float):
+            return self.get_connection().incrbyfloat(self._key, amount)
+        return self.get_connection().incrby(self._key, amount)
+
+    async def read_chunks(self, chunk_size: int=65536) -> AsyncIterator[bytes]:
+        """
+        Reads the value of the string in chunks using the GETRANGE command, so that large values
+        never have to be held in memory at once and each command is short. This operation is not
+        atomic and cannot be performed transactionally.
+
+        Args:
+            chunk_size (int, optional): The number of bytes to read with each command. Defaults to
+                65536.
+
+        Returns:
+            AsyncIterator[bytes]: An iterator over the chunks of the value.
+
+        Raises:
+            ValueError: If `chunk_size` is not positive.
+        """
+
+        self._check_chunk_size(chunk_size)
+        offset = 0
+        while True:
+            chunk = await self.get_connection().getrange(
+                self._key, offset, offset + chunk_size - 1, encoding=None
+            )
+            if chunk:
+                yield chunk
+            if len(chunk) < chunk_size:
+                return
+            offset += chunk_size
+
+    async def write_from(
+        self,
+        source: Union[AsyncIterable, bytes],  # pylint:disable=unsubscriptable-object
+        chunk_size: int=65536
+    ):
+        """
+        Replaces the value of the string by writing it in chunks, the first with SET and the rest
+        with APPEND, so that large values never have to be held in memory at once and each command
+        is short. Readers may observe a partially written value while this is in progress. This
+        operation is not atomic and cannot be performed transactionally.
+
+        Args:
+            source (Union[AsyncIterable, bytes]): Either an async iterable of chunks or a
+                `bytes`, `bytearray` or `memoryview` object, which is sent in slices of
+                `chunk_size` bytes without copying it as a whole.
+            chunk_size (int, optional): The number of bytes to send with each command when `source`
+                is a bytes-like object. Defaults to 65536.
+
+        Raises:
+            ValueError: If `chunk_size` is not positive.
+        """
+
+        self._check_chunk_size(chunk_size)
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = self._slice(memoryview(source), chunk_size)
+
+        first = True
+        async for chunk in source:
+            if isinstance(chunk, memoryview):
+                # aioredis only sends bytes, bytearray or str values; this copies one chunk.
+                chunk = chunk.tobytes()
+            if first:
+                await self.set(chunk)
+                first = False
+            else:
+                await self.get_connection().append(self._key, chunk)
+        if first:
+            await self.set(b'')
+
+    @staticmethod
+    async def _slice(view: memoryview, chunk_size: int) -> AsyncIterator[memoryview]:
+        RedisString._check_chunk_size(chunk_size)
+        for offset in range(0, len(view), chunk_size):
+            yield view[offset:offset + chunk_size]
+
+    @staticmethod
+    def _check_chunk_size(chunk_size: int):
+        if chunk_size <= 0:
+            raise ValueError('chunk_size must be positive')
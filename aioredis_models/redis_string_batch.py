@@ -0,0 +1,143 @@
+"""
+This module contains the following classes:
+- RedisStringBatch: Gets and sets many strings stored in Redis with few commands.
+"""
+
+from asyncio import gather
+from itertools import chain
+from typing import Any, Awaitable, Dict, List, Union
+from aioredis import Redis
+from .redis_model import RedisModel
+from .redis_client import RedisClient
+from .redis_string import RedisString
+from .asyncio_utils import noop
+
+
+class RedisStringBatch(RedisModel):
+    """
+    Gets and sets many strings stored in Redis with MGET, MSET and MSETNX instead of one command per
+    key. Strings can be given either as `RedisString` instances or as keys. Large batches are split
+    into commands and transactions of bounded size so that none of them blocks the server for
+    long.
+    """
+
+    def __init__(
+        self,
+        redis: Union[Redis, RedisClient],  # pylint:disable=unsubscriptable-object
+        batch_size: int=500
+    ):
+        """
+        Creates an instance of `RedisStringBatch`.
+
+        Args:
+            redis (Union[Redis, RedisClient]): The Redis instance to use to connect to Redis.
+                This can be an instance of `RedisClient` to allow controlling transactions
+                externally.
+            batch_size (int, optional): The maximum number of keys in each command. Defaults to
+                500.
+        """
+
+        super().__init__(redis)
+        self._batch_size = batch_size
+
+    async def get_many(
+        self,
+        strings: List[Union[RedisString, str]],  # pylint:disable=unsubscriptable-object
+        encoding='utf-8'
+    ) -> List[Any]:
+        """
+        Gets the values of the given strings with one MGET command per batch. The commands are sent
+        concurrently and are pipelined by the connection. This operation is not atomic across
+        batches and cannot be performed transactionally.
+
+        Args:
+            strings (List[Union[RedisString, str]]): The strings or keys to get.
+            encoding (str, optional): The encoding to use for decoding the values. Defaults to
+                'utf-8'.
+
+        Returns:
+            List[Any]: The values in the same order as the strings, `None` for keys that do not
+                exist.
+        """
+
+        keys = [self._get_key(string) for string in strings]
+        results = await gather(*(
+            self.get_connection().mget(*batch, encoding=encoding)
+            for batch in self._split(keys)
+        ))
+        return list(chain.from_iterable(results))
+
+    async def set_many(
+        self,
+        values: Dict[Union[RedisString, str], Any],  # pylint:disable=unsubscriptable-object
+        timeout_seconds: Union[int, float, dict]=None  # pylint:disable=unsubscriptable-object
+    ):
+        """
+        Sets the values of the given strings with one transaction per batch, made of an MSET
+        command followed by one PEXPIRE command per key of the batch that should expire. Each
+        batch is written atomically and the next batch is only sent once it completes, so that the
+        server is never blocked for long. This operation is not atomic across batches.
+
+        Args:
+            values (Dict[Union[RedisString, str], Any]): A `dict` mapping strings or keys to the
+                values to set.
+            timeout_seconds (Union[int, float, dict], optional): The amount of time in seconds
+                after which the keys should expire, either for all keys or as a `dict` mapping keys
+                to their own timeout. Keys with a timeout of `None` or missing from the `dict` do
+                not expire, and keys with a timeout of 0 or less expire immediately, like with
+                `RedisKey.expire`. Defaults to `None`.
+        """
+
+        if not values:
+            return
+
+        items = {self._get_key(string): value for string, value in values.items()}
+        if isinstance(timeout_seconds, dict):
+            timeouts = {
+                self._get_key(string): timeout for string, timeout in timeout_seconds.items()
+            }
+        else:
+            timeouts = dict.fromkeys(items, timeout_seconds)
+
+        for batch in self._split(list(items)):
+            async with self.begin_transaction() as transaction:
+                transaction.add_operation(self.get_connection().mset(
+                    *chain.from_iterable((key, items[key]) for key in batch)
+                ))
+                transaction.add_operation(*(
+                    self.get_connection().pexpire(key, round(timeouts[key] * 1000))
+                    for key in batch if timeouts.get(key) is not None
+                ))
+
+    def set_many_if_not_exist(
+        self,
+        values: Dict[Union[RedisString, str], Any]  # pylint:disable=unsubscriptable-object
+    ) -> Awaitable[int]:
+        """
+        Sets the values of the given strings only if none of them exist, using a single MSETNX
+        command. The command is not split into batches so that it stays all-or-nothing.
+
+        Args:
+            values (Dict[Union[RedisString, str], Any]): A `dict` mapping strings or keys to the
+                values to set.
+
+        Returns:
+            Awaitable[int]: 1 if all values were set, 0 if none were set because at least one key
+                already exists.
+        """
+
+        if not values:
+            return noop()
+        return self.get_connection().msetnx(*chain.from_iterable(
+            (self._get_key(string), value) for string, value in values.items()
+        ))
+
+    def _split(self, keys: List[str]) -> List[List[str]]:
+        return [
+            keys[index:index + self._batch_size]
+            for index in range(0, len(keys), self._batch_size)
+        ]
+
+    @staticmethod
+    def _get_key(string: Union[RedisString, str]) -> str:  # pylint:disable=unsubscriptable-object
+        return string.key if isinstance(string, RedisString) else string
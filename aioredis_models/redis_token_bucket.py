@@ -0,0 +1,119 @@
+"""
+This module contains the following classes:
+- RedisTokenBucket: Represents a token bucket rate limiter stored in Redis as a hash map.
+"""
+
+from typing import List, Union
+from aioredis import Redis
+from .redis_key import RedisKey
+from .redis_client import RedisClient
+from .redis_scripts import SERVER_TIME_MILLISECONDS
+
+
+class RedisTokenBucket(RedisKey):
+    """
+    Represents a token bucket rate limiter stored in Redis as a hash map holding the number of
+    tokens left and the time they were last counted. The bucket holds up to `capacity` tokens and
+    is refilled continuously at a fixed rate. Each decision is made atomically by a Lua script in a
+    single round trip using the server clock, so concurrent clients on different hosts share the
+    same limit.
+    """
+
+    _ACQUIRE_SCRIPT = SERVER_TIME_MILLISECONDS + """
+        local requested = tonumber(ARGV[1])
+        local remaining = {}
+        for index, key in ipairs(KEYS) do
+            local capacity = tonumber(ARGV[index * 2])
+            local rate = tonumber(ARGV[index * 2 + 1])
+            local state = redis.call('hmget', key, 'tokens', 'timestamp')
+            local tokens = tonumber(state[1]) or capacity
+            local elapsed = math.max(0, now - (tonumber(state[2]) or now))
+            tokens = math.min(capacity, tokens + elapsed * rate)
+            if tokens < requested then
+                return 0
+            end
+            remaining[index] = tokens - requested
+        end
+        for index, key in ipairs(KEYS) do
+            local capacity = tonumber(ARGV[index * 2])
+            local rate = tonumber(ARGV[index * 2 + 1])
+            redis.call('hset', key, 'tokens', remaining[index], 'timestamp', now)
+            redis.call('pexpire', key, math.ceil((capacity - remaining[index]) / rate) + 1)
+        end
+        return 1
+    """
+
+    def __init__(
+        self,
+        redis: Union[Redis, RedisClient],  # pylint:disable=unsubscriptable-object
+        key: str,
+        capacity: Union[int, float],  # pylint:disable=unsubscriptable-object
+        refill_per_second: Union[int, float]  # pylint:disable=unsubscriptable-object
+    ):
+        """
+        Creates an instance of `RedisTokenBucket`.
+
+        Args:
+            redis (Union[Redis, RedisClient]): The Redis instance to use to connect to Redis.
+                This can be an instance of `RedisClient` to allow controlling transactions
+                externally.
+            key (str): The Redis key to use.
+            capacity (Union[int, float]): The maximum number of tokens in the bucket, i.e. the
+                largest allowed burst.
+            refill_per_second (Union[int, float]): The number of tokens added to the bucket every
+                second. Must be positive.
+        """
+
+        super().__init__(redis, key)
+        self._capacity = capacity
+        self._refill_per_second = refill_per_second
+
+    async def acquire(
+        self,
+        tokens: Union[int, float]=1  # pylint:disable=unsubscriptable-object
+    ) -> bool:
+        """
+        Takes the given number of tokens from the bucket if enough are available.
+
+        Args:
+            tokens (Union[int, float], optional): The number of tokens to take. Defaults to 1.
+
+        Returns:
+            bool: Whether the tokens were taken, i.e. whether the request is allowed.
+        """
+
+        return await self.acquire_all([self], tokens=tokens)
+
+    @staticmethod
+    async def acquire_all(
+        buckets: List['RedisTokenBucket'],
+        tokens: Union[int, float]=1  # pylint:disable=unsubscriptable-object
+    ) -> bool:
+        """
+        Takes the given number of tokens from every one of the given buckets if all of them have
+        enough available, in a single round trip. If any bucket does not have enough tokens, no
+        tokens are taken from any bucket. The buckets must be stored on the same Redis server and
+        the connection of the first bucket is used.
+
+        Args:
+            buckets (List[RedisTokenBucket]): The buckets to take tokens from.
+            tokens (Union[int, float], optional): The number of tokens to take from each bucket.
+                Defaults to 1.
+
+        Returns:
+            bool: Whether the tokens were taken, i.e. whether the request is allowed by all limits.
+        """
+
+        if not buckets:
+            return True
+        args = [tokens]
+        for bucket in buckets:
+            args.extend(bucket._get_limit())  # pylint:disable=protected-access
+        return bool(await buckets[0].get_connection().eval(
+            RedisTokenBucket._ACQUIRE_SCRIPT,
+            keys=[bucket.key for bucket in buckets],
+            args=args
+        ))
+
+    def _get_limit(self) -> List[float]:
+        return [self._capacity, self._refill_per_second / 1000]
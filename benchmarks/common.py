@@ -0,0 +1,136 @@
+"""
+Provides helpers shared by the benchmarks. Like the end-to-end tests, each benchmark connects to
+the Redis server at the `REDIS_URL` environment variable. Benchmarks only touch keys starting with
+`benchmark:` and delete them when done, but they do load the server, so they should not be run
+against a production server.
+"""
+
+import argparse
+from asyncio import gather, run
+from os import environ as env
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Iterable, List
+from aioredis import Redis, create_redis_pool
+from aioredis_models import RedisKey, RedisKeyspaceScanner
+
+
+def parse_args(description: str, **defaults: int) -> argparse.Namespace:
+    """
+    Parses the command line arguments of a benchmark, with one integer option per default.
+
+    Args:
+        description (str): The description of the benchmark.
+        defaults (int): The default values of the options, such as `entries=100000`.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+
+    parser = argparse.ArgumentParser(description=description)
+    for name, default in defaults.items():
+        parser.add_argument(f'--{name.replace("_", "-")}', type=int, default=default)
+    return parser.parse_args()
+
+
+def main(benchmark: Callable[[Redis], Awaitable[Any]]):
+    """
+    Runs a benchmark with a connection to the Redis server at `REDIS_URL`, deleting the keys it
+    created afterwards.
+
+    Args:
+        benchmark (Callable[[Redis], Awaitable[Any]]): The benchmark to run.
+    """
+
+    async def run_benchmark():
+        redis = await create_redis_pool(env['REDIS_URL'])
+        try:
+            await delete_keys(redis)
+            await benchmark(redis)
+        finally:
+            await delete_keys(redis)
+            redis.close()
+            await redis.wait_closed()
+
+    run(run_benchmark())
+
+
+async def delete_keys(redis: Redis, pattern: str='benchmark:*'):
+    """
+    Deletes the keys matching a pattern.
+
+    Args:
+        redis (Redis): The Redis instance to use.
+        pattern (str, optional): The pattern of the keys to delete. Defaults to 'benchmark:*'.
+    """
+
+    keys = [key async for key in RedisKeyspaceScanner(redis, batch_size=1000).scan(pattern)]
+    if keys:
+        await RedisKey.unlink_many(keys)
+
+
+async def used_memory(redis: Redis) -> int:
+    """
+    Gets the memory used by the Redis server, in bytes.
+
+    Args:
+        redis (Redis): The Redis instance to use.
+
+    Returns:
+        int: The `used_memory` reported by INFO.
+    """
+
+    info = await redis.info('memory')
+    return int(info['memory']['used_memory'])
+
+
+async def in_batches(operations: Iterable[Awaitable], batch_size: int=1000) -> List:
+    """
+    Awaits operations a batch at a time, so that the connection pipelines each batch without
+    holding every pending operation in memory.
+
+    Args:
+        operations (Iterable[Awaitable]): The operations to await, created lazily.
+        batch_size (int, optional): The number of operations to await at once. Defaults to 1000.
+
+    Returns:
+        List: The results of the operations.
+    """
+
+    results = []
+    batch = []
+    for operation in operations:
+        batch.append(operation)
+        if len(batch) >= batch_size:
+            results.extend(await gather(*batch))
+            batch = []
+    results.extend(await gather(*batch))
+    return results
+
+
+async def timed(operation: Awaitable) -> float:
+    """
+    Measures the time an operation takes.
+
+    Args:
+        operation (Awaitable): The operation to await.
+
+    Returns:
+        float: The elapsed time in seconds.
+    """
+
+    start = perf_counter()
+    await operation
+    return perf_counter() - start
+
+
+def report(name: str, value: float, unit: str=''):
+    """
+    Prints a measurement.
+
+    Args:
+        name (str): The name of the measurement.
+        value (float): The measured value.
+        unit (str, optional): The unit of the value. Defaults to ''.
+    """
+
+    print(f'{name:<48} {value:>16,.2f} {unit}')
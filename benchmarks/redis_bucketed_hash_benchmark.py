@@ -0,0 +1,53 @@
+"""
+Compares the memory used by many small values stored as `RedisString` keys and as fields of a
+`RedisBucketedHash`, reported per million entries.
+
+Usage: REDIS_URL=redis://localhost:6379/0 python -m benchmarks.redis_bucketed_hash_benchmark
+"""
+
+from itertools import islice
+from aioredis import Redis
+from aioredis_models import RedisBucketedHash, RedisString
+from .common import delete_keys, in_batches, main, parse_args, report, used_memory
+
+
+ARGS = parse_args(__doc__, entries=1000000, fields_per_bucket=100, batch_size=1000)
+
+
+def entries():
+    return ((f'object-{index}', f'value-{index}') for index in range(ARGS.entries))
+
+
+async def benchmark(redis: Redis):
+    per_million = 1000000 / ARGS.entries
+
+    before = await used_memory(redis)
+    await in_batches(
+        (RedisString(redis, f'benchmark:string:{field}').set(value) for field, value in entries()),
+        ARGS.batch_size
+    )
+    string_bytes = await used_memory(redis) - before
+    await delete_keys(redis)
+
+    bucket_count = max(1, ARGS.entries // ARGS.fields_per_bucket)
+    bucketed_hash = RedisBucketedHash(redis, 'benchmark:bucketed', bucket_count)
+    iterator = entries()
+    before = await used_memory(redis)
+    while True:
+        batch = dict(islice(iterator, ARGS.batch_size * 10))
+        if not batch:
+            break
+        await bucketed_hash.set_all(batch)
+    bucketed_bytes = await used_memory(redis) - before
+    encoding = await redis.object_encoding('benchmark:bucketed:0')
+
+    report('RedisString per million entries', string_bytes * per_million / 2 ** 20, 'MiB')
+    report(
+        f'RedisBucketedHash ({encoding}) per million entries',
+        bucketed_bytes * per_million / 2 ** 20, 'MiB'
+    )
+    report('Memory saved', 100 * (1 - bucketed_bytes / string_bytes), '%')
+
+
+if __name__ == '__main__':
+    main(benchmark)
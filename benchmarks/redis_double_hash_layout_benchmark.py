@@ -0,0 +1,57 @@
+"""
+Compares the memory used by a `RedisDoubleHash` stored with one Redis set per field and with the
+compact layout, along with the latency of `get` and `get_inverted` for each layout.
+
+Usage: REDIS_URL=redis://localhost:6379/0 python -m benchmarks.redis_double_hash_layout_benchmark
+"""
+
+from time import perf_counter
+from aioredis import Redis
+from aioredis_models import RedisDoubleHash
+from .common import delete_keys, main, parse_args, report, used_memory
+
+
+ARGS = parse_args(__doc__, fields=10000, values_per_field=5, values=20000, lookups=10000)
+
+
+def pairs():
+    for field in range(ARGS.fields):
+        for offset in range(ARGS.values_per_field):
+            value = (field * ARGS.values_per_field + offset) % ARGS.values
+            yield f'field-{field}', f'value-{value}'
+
+
+async def measure(redis: Redis, name: str, compact: bool) -> int:
+    redis_double_hash = RedisDoubleHash(
+        redis, 'benchmark:forward', 'benchmark:inverse', compact=compact
+    )
+    before = await used_memory(redis)
+    await redis_double_hash.set_many(pairs())
+    memory_bytes = await used_memory(redis) - before
+
+    start = perf_counter()
+    for index in range(ARGS.lookups):
+        await redis_double_hash.get(f'field-{index % ARGS.fields}')
+    get_seconds = perf_counter() - start
+
+    start = perf_counter()
+    for index in range(ARGS.lookups):
+        await redis_double_hash.get_inverted(f'value-{index % ARGS.values}')
+    get_inverted_seconds = perf_counter() - start
+    await delete_keys(redis)
+
+    report(f'{name} memory', memory_bytes / 2 ** 20, 'MiB')
+    report(f'{name} get latency', get_seconds * 1e6 / ARGS.lookups, 'us')
+    report(f'{name} get_inverted latency', get_inverted_seconds * 1e6 / ARGS.lookups, 'us')
+    return memory_bytes
+
+
+async def benchmark(redis: Redis):
+    sets_bytes = await measure(redis, 'Sets layout', compact=False)
+    compact_bytes = await measure(redis, 'Compact layout', compact=True)
+
+    report('Memory saved', 100 * (1 - compact_bytes / sets_bytes), '%')
+
+
+if __name__ == '__main__':
+    main(benchmark)
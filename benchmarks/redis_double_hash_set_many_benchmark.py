@@ -0,0 +1,40 @@
+"""
+Compares the throughput of writing pairs to a `RedisDoubleHash` one at a time with `set` and in
+batched transactions with `set_many`.
+
+Usage: REDIS_URL=redis://localhost:6379/0 python -m benchmarks.redis_double_hash_set_many_benchmark
+"""
+
+from time import perf_counter
+from aioredis import Redis
+from aioredis_models import RedisDoubleHash
+from .common import delete_keys, main, parse_args, report
+
+
+ARGS = parse_args(__doc__, pairs=20000, fields=1000, batch_size=1000)
+
+
+def pairs():
+    return ((f'field-{index % ARGS.fields}', f'value-{index}') for index in range(ARGS.pairs))
+
+
+async def benchmark(redis: Redis):
+    redis_double_hash = RedisDoubleHash(redis, 'benchmark:forward', 'benchmark:inverse')
+
+    start = perf_counter()
+    for field, value in pairs():
+        await redis_double_hash.set(field, value)
+    set_seconds = perf_counter() - start
+    await delete_keys(redis)
+
+    start = perf_counter()
+    await redis_double_hash.set_many(pairs(), batch_size=ARGS.batch_size)
+    set_many_seconds = perf_counter() - start
+
+    report('set in a loop', ARGS.pairs / set_seconds, 'pairs/s')
+    report('set_many', ARGS.pairs / set_many_seconds, 'pairs/s')
+    report('Speedup', set_seconds / set_many_seconds, 'x')
+
+
+if __name__ == '__main__':
+    main(benchmark)
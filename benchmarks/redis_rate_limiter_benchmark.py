@@ -0,0 +1,51 @@
+"""
+Measures the throughput of `RedisTokenBucket.acquire` and `RedisSlidingWindow.acquire` when many
+concurrent callers contend for a single key, along with the share of requests that were allowed.
+
+Usage: REDIS_URL=redis://localhost:6379/0 python -m benchmarks.redis_rate_limiter_benchmark
+"""
+
+from asyncio import gather
+from time import perf_counter
+from typing import Awaitable, Callable
+from aioredis import Redis
+from aioredis_models import RedisSlidingWindow, RedisTokenBucket
+from .common import main, parse_args, report
+
+
+ARGS = parse_args(__doc__, requests=100000, concurrency=200, limit_per_second=10000)
+
+
+async def contend(name: str, acquire: Callable[[], Awaitable[bool]]):
+    requests_per_caller = max(1, ARGS.requests // ARGS.concurrency)
+
+    async def caller():
+        allowed = 0
+        for _ in range(requests_per_caller):
+            allowed += await acquire()
+        return allowed
+
+    start = perf_counter()
+    allowed = sum(await gather(*(caller() for _ in range(ARGS.concurrency))))
+    seconds = perf_counter() - start
+    total = requests_per_caller * ARGS.concurrency
+
+    report(f'{name} throughput', total / seconds, 'requests/s')
+    report(f'{name} mean latency', seconds * 1e6 * ARGS.concurrency / total, 'us')
+    report(f'{name} allowed', 100 * allowed / total, '%')
+
+
+async def benchmark(redis: Redis):
+    token_bucket = RedisTokenBucket(
+        redis, 'benchmark:token-bucket', ARGS.limit_per_second, ARGS.limit_per_second
+    )
+    await contend('RedisTokenBucket', token_bucket.acquire)
+
+    sliding_window = RedisSlidingWindow(
+        redis, 'benchmark:sliding-window', ARGS.limit_per_second, 1
+    )
+    await contend('RedisSlidingWindow', sliding_window.acquire)
+
+
+if __name__ == '__main__':
+    main(benchmark)
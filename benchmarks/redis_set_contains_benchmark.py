@@ -0,0 +1,54 @@
+"""
+Measures the false positive rate of the Bloom filter built by `RedisSet.build_bloom_filter` and
+the latency of `RedisSet.contains_many` with and without it, for lookups that are mostly misses.
+
+Usage: REDIS_URL=redis://localhost:6379/0 python -m benchmarks.redis_set_contains_benchmark
+"""
+
+from time import perf_counter
+from aioredis import Redis
+from aioredis_models import RedisSet
+from .common import in_batches, main, parse_args, report
+
+
+ARGS = parse_args(__doc__, members=100000, lookups=100000, hit_percent=10, batch_size=100)
+
+
+async def benchmark(redis: Redis):
+    redis_set = RedisSet(redis, 'benchmark:set')
+    members = [f'member-{index}' for index in range(ARGS.members)]
+    await in_batches(
+        redis_set.add(*members[index:index + 1000]) for index in range(0, len(members), 1000)
+    )
+    hits = ARGS.lookups * ARGS.hit_percent // 100
+    misses = [f'missing-{index}' for index in range(ARGS.lookups - hits)]
+    lookups = [members[index % ARGS.members] for index in range(hits)] + misses
+    batches = [
+        lookups[index:index + ARGS.batch_size] for index in range(0, len(lookups), ARGS.batch_size)
+    ]
+
+    start = perf_counter()
+    bloom_filter = await redis_set.build_bloom_filter()
+    build_seconds = perf_counter() - start
+    false_positives = sum(value in bloom_filter for value in misses)
+
+    start = perf_counter()
+    for batch in batches:
+        await redis_set.contains_many(batch)
+    plain_seconds = perf_counter() - start
+
+    start = perf_counter()
+    for batch in batches:
+        await redis_set.contains_many(batch, bloom_filter)
+    filtered_seconds = perf_counter() - start
+
+    report('Bloom filter build time', build_seconds * 1000, 'ms')
+    report('Estimated false positive rate', 100 * bloom_filter.false_positive_rate(), '%')
+    report('Measured false positive rate', 100 * false_positives / max(len(misses), 1), '%')
+    report('contains_many latency per batch', plain_seconds * 1e6 / len(batches), 'us')
+    report('With Bloom filter', filtered_seconds * 1e6 / len(batches), 'us')
+    report('Latency saved', 100 * (1 - filtered_seconds / plain_seconds), '%')
+
+
+if __name__ == '__main__':
+    main(benchmark)
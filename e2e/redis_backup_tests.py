@@ -0,0 +1,87 @@
+from io import StringIO
+from aioredis_models import (
+    RedisBackup, RedisDoubleHash, RedisHash, RedisKey, RedisKeyspaceScanner, RedisList, RedisString
+)
+from .redis_tests import RedisTests
+
+
+class RedisBackupTests(RedisTests):
+    _key = 'test-backup-forward'
+    _inverse_key = 'test-backup-inverse'
+    _redis_double_hash: RedisDoubleHash = None
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        self._redis_double_hash = RedisDoubleHash(self._redis, self._key, self._inverse_key)
+        await self._redis_double_hash.delete()
+
+    async def asyncTearDown(self):
+        await self._redis_double_hash.delete()
+        await super().asyncTearDown()
+
+    async def _export(self, redis_backup):
+        output = StringIO()
+        scanner = RedisKeyspaceScanner(self._redis)
+        for pattern in (f'{self._key}:*', f'{self._inverse_key}:*'):
+            await redis_backup.export(scanner.scan(pattern), output)
+        return output.getvalue().splitlines()
+
+    async def test_export_and_restore_double_hash(self):
+        for index in range(250):
+            await self._redis_double_hash.set('field', str(index))
+        redis_backup = RedisBackup(self._redis, batch_size=20)
+
+        lines = await self._export(redis_backup)
+        await self._redis_double_hash.delete()
+        restored = await redis_backup.restore(lines)
+
+        self.assertEqual(restored, 251)
+        self.assertEqual(len(await self._redis_double_hash.get('field')), 250)
+        self.assertEqual(await self._redis_double_hash.get_inverted('42'), ['field'])
+
+    async def test_export_and_restore_with_dump(self):
+        await self._redis_double_hash.set('field', 'value')
+        redis_backup = RedisBackup(self._redis, use_dump=True)
+
+        lines = await self._export(redis_backup)
+        await self._redis_double_hash.delete()
+        restored = await redis_backup.restore(lines)
+
+        self.assertEqual(restored, 2)
+        self.assertEqual(await self._redis_double_hash.get('field'), ['value'])
+
+    async def test_export_and_restore_hash_zset_and_list(self):
+        redis_hash = RedisHash(self._redis, f'{self._key}:hash')
+        redis_list = RedisList(self._redis, f'{self._key}:list')
+        zset_key = f'{self._key}:zset'
+        await redis_hash.set_all({'a': '1', 'b': '2', 'c': '3'})
+        await redis_list.push('x', 'y', 'z')
+        await self._redis.zadd(zset_key, 1.5, 'a', 2, 'b', 3, 'c')
+        redis_backup = RedisBackup(self._redis, batch_size=2)
+
+        lines = await self._export(redis_backup)
+        await RedisKey.unlink_many([redis_hash, redis_list, RedisKey(self._redis, zset_key)])
+        restored = await redis_backup.restore(lines)
+
+        self.assertEqual(restored, 3)
+        self.assertEqual(await redis_hash.get_all(), {'a': '1', 'b': '2', 'c': '3'})
+        self.assertEqual(await redis_list.get_range(), ['z', 'y', 'x'])
+        self.assertEqual(
+            await self._redis.zrange(zset_key, withscores=True, encoding='utf-8'),
+            [('a', 1.5), ('b', 2), ('c', 3)]
+        )
+
+    async def test_export_and_restore_large_string_in_chunks(self):
+        redis_string = RedisString(self._redis, f'{self._key}:string')
+        value = 'é' * 100000
+        await redis_string.set(value)
+        redis_backup = RedisBackup(self._redis)
+
+        lines = await self._export(redis_backup)
+        await redis_string.delete()
+        restored = await redis_backup.restore(lines)
+
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(restored, 1)
+        self.assertEqual(await redis_string.get(), value)
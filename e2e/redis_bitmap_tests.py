@@ -0,0 +1,33 @@
+from aioredis_models import RedisBitmap
+from .redis_tests import RedisTests
+
+
+class RedisBitmapTests(RedisTests):
+    _key = 'test-bitmap-key'
+    _redis_bitmap: RedisBitmap = None
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        self._redis_bitmap = RedisBitmap(self._redis, self._key)
+        await self._redis_bitmap.delete()
+
+    async def test_load_and_count(self):
+        await self._redis_bitmap.load(range(0, 10000, 3), batch_size=100)
+
+        count = await self._redis_bitmap.count()
+        bits = await self._redis_bitmap.get_bits([0, 1, 3, 9999])
+
+        self.assertEqual(count, 3334)
+        self.assertEqual(bits, [1, 0, 1, 1])
+
+    async def test_combine_stores_result(self):
+        other = RedisBitmap(self._redis, 'test-bitmap-other')
+        destination = RedisBitmap(self._redis, 'test-bitmap-destination')
+        await other.delete()
+        await self._redis_bitmap.set_bits([1, 2, 3])
+        await other.set_bits([2, 3, 4])
+
+        await self._redis_bitmap.combine('AND', destination.key, other.key)
+
+        self.assertEqual(await destination.count(), 2)
@@ -0,0 +1,36 @@
+from aioredis_models import RedisBucketedHash
+from .redis_tests import RedisTests
+
+
+class RedisBucketedHashTests(RedisTests):
+    _key = 'test-bucketed-key'
+    _redis_bucketed_hash: RedisBucketedHash = None
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        self._redis_bucketed_hash = RedisBucketedHash(self._redis, self._key, bucket_count=4)
+        await self._redis_bucketed_hash.delete()
+
+    async def test_set_all_and_get_many_round_trip(self):
+        values = {f'field-{index}': f'value-{index}' for index in range(20)}
+        await self._redis_bucketed_hash.set_all(values)
+
+        result = await self._redis_bucketed_hash.get_many(list(values) + ['missing'])
+
+        self.assertEqual(result, {**values, 'missing': None})
+
+    async def test_enumerate_gets_all_items(self):
+        values = {f'field-{index}': f'value-{index}' for index in range(20)}
+        await self._redis_bucketed_hash.set_all(values)
+
+        result = {item async for item in self._redis_bucketed_hash.enumerate(batch_size=3)}
+
+        self.assertEqual(result, set(values.items()))
+
+    async def test_remove_removes_field(self):
+        await self._redis_bucketed_hash.set('foo', 'bar')
+
+        await self._redis_bucketed_hash.remove('foo')
+
+        self.assertIsNone(await self._redis_bucketed_hash.get('foo'))
@@ -0,0 +1,51 @@
+import asyncio
+from aioredis_models import RedisDoubleHash, RedisDoubleHashMirror
+from .redis_tests import RedisTests
+
+
+class RedisDoubleHashMirrorTests(RedisTests):
+    _redis_double_hash: RedisDoubleHash = None
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        await self._redis.config_set('notify-keyspace-events', 'Kgsh')
+        self._redis_double_hash = RedisDoubleHash(self._redis, 'test-mirror', 'mirror-test')
+        await self._redis_double_hash.delete()
+
+    async def asyncTearDown(self):
+        await self._redis_double_hash.delete()
+        await super().asyncTearDown()
+
+    async def _wait_for(self, read, expected):
+        for _ in range(50):
+            result = await read()
+            if result == expected:
+                return result
+            await asyncio.sleep(0.01)
+        return result
+
+    async def test_get_reads_loaded_mappings(self):
+        await self._redis_double_hash.set('foo', 'bar')
+        await self._redis_double_hash.set('biz', 'bar')
+
+        async with RedisDoubleHashMirror(self._redis_double_hash) as mirror:
+            values = await mirror.get('foo')
+            fields = await mirror.get_inverted('bar')
+
+        self.assertEqual(values, ['bar'])
+        self.assertEqual(set(fields), {'foo', 'biz'})
+
+    async def test_get_sees_changes_after_start(self):
+        await self._redis_double_hash.set('foo', 'bar')
+
+        async with RedisDoubleHashMirror(self._redis_double_hash) as mirror:
+            await mirror.get('foo')
+            await self._redis_double_hash.set('foo', 'bat')
+            await self._redis_double_hash.remove_inverted('bar')
+
+            values = await self._wait_for(lambda: mirror.get('foo'), ['bat'])
+            fields = await mirror.get_inverted('bar')
+
+        self.assertEqual(values, ['bat'])
+        self.assertEqual(fields, [])
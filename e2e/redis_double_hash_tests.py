@@ -116,3 +116,45 @@ class RedisDoubleHashTests(RedisTests):
         self.assertFalse(foo)
         self.assertFalse(bar)
         self.assertFalse(bat)
+
+    async def test_set_many_and_unset_many(self):
+        await self._redis_double_hash.set_many(
+            [('foo', 'bar'), ('foo', 'bat'), ('biz', 'bar')],
+            batch_size=2
+        )
+        await self._redis_double_hash.unset_many([('foo', 'bat')])
+
+        forward = await self._redis_double_hash.get('foo')
+        inverted = await self._redis_double_hash.get_inverted('bar')
+
+        self.assertEqual(forward, ['bar'])
+        self.assertEqual(sorted(inverted), ['biz', 'foo'])
+
+    async def test_multi_field_queries(self):
+        await self._redis_double_hash.set_many(
+            [('foo', 'bar'), ('foo', 'bat'), ('biz', 'bar'), ('biz', 'boo')]
+        )
+
+        common = await self._redis_double_hash.get_all_of(['foo', 'biz'])
+        either = await self._redis_double_hash.get_any_of(['foo', 'biz'])
+        inverted_common = await self._redis_double_hash.get_inverted_all_of(['bar', 'boo'])
+        inverted_either = await self._redis_double_hash.get_inverted_any_of(['bat', 'boo'])
+        common_count = await self._redis_double_hash.count(['foo', 'biz'])
+        either_count = await self._redis_double_hash.count(['bar', 'missing'], False, True)
+
+        self.assertEqual(common, ['bar'])
+        self.assertEqual(sorted(either), ['bar', 'bat', 'boo'])
+        self.assertEqual(inverted_common, ['biz'])
+        self.assertEqual(sorted(inverted_either), ['biz', 'foo'])
+        self.assertEqual(common_count, 1)
+        self.assertEqual(either_count, 2)
+
+
+class RedisDoubleHashCompactTests(RedisDoubleHashTests):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        self._redis_double_hash = RedisDoubleHash(
+            self._redis, self._key, self._inverse_key, compact=True
+        )
+        await self._redis_double_hash.delete()
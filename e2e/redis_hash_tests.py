@@ -38,3 +38,18 @@ class RedisHashTests(RedisTests):
         result = await self._redis_hash.fields()
 
         self.assertEqual(result, list(values.keys()))
+
+    async def test_increment_increments_field(self):
+        await self._redis_hash.increment('foo', 2)
+        await self._redis_hash.increment('foo', 3)
+        result = await self._redis_hash.increment('bar', 1.5)
+
+        self.assertEqual(await self._redis_hash.get('foo'), '5')
+        self.assertEqual(result, 1.5)
+
+    async def test_sync_writes_changes(self):
+        snapshot = await self._redis_hash.sync({'foo': 'bar', 'baz': 'bat'})
+
+        await self._redis_hash.sync({'foo': 'boo', 'snow': 'ball'}, snapshot)
+
+        self.assertEqual(await self._redis_hash.get_all(), {'foo': 'boo', 'snow': 'ball'})
@@ -0,0 +1,90 @@
+from aioredis_models import RedisKey, RedisSet, RedisString
+from .redis_tests import RedisTests
+
+
+class RedisKeyTests(RedisTests):
+    _key = 'test-key-expiry'
+    _other_key = 'test-key-expiry-other'
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        await RedisKey(self._redis, self._key).delete()
+        await RedisKey(self._redis, self._other_key).delete()
+
+    async def test_expire_and_persist(self):
+        redis_string = RedisString(self._redis, self._key)
+        await redis_string.set('value')
+
+        no_ttl = await redis_string.ttl()
+        await redis_string.expire(100)
+        ttl = await redis_string.ttl()
+        await redis_string.persist()
+        persisted_ttl = await redis_string.ttl()
+
+        self.assertIsNone(no_ttl)
+        self.assertGreater(ttl, 99)
+        self.assertLessEqual(ttl, 100)
+        self.assertIsNone(persisted_ttl)
+
+    async def test_expire_many(self):
+        redis_string = RedisString(self._redis, self._key)
+        other = RedisString(self._redis, self._other_key)
+        await redis_string.set('value', timeout_seconds=100)
+        await other.set('value', timeout_seconds=100)
+
+        result = await RedisKey.expire_many([redis_string, other], {self._key: 50})
+        persisted = await RedisKey.expire_many([redis_string, other], {self._key: None})
+
+        self.assertEqual(result, [True, False])
+        self.assertEqual(persisted, [True, False])
+        self.assertIsNone(await redis_string.ttl())
+        self.assertGreater(await other.ttl(), 99)
+
+    async def test_unlink_many(self):
+        await RedisString(self._redis, self._key).set('value')
+        await RedisString(self._redis, self._other_key).set('value')
+
+        result = await RedisKey.unlink_many(
+            [RedisKey(self._redis, self._key), RedisKey(self._redis, self._other_key)],
+            batch_size=1
+        )
+
+        self.assertEqual(result, 2)
+        self.assertFalse(await RedisKey(self._redis, self._key).exists())
+
+    async def test_delete_incrementally_with_hash(self):
+        await self._redis.hmset_dict(self._key, {str(index): index for index in range(250)})
+        redis_key = RedisKey(self._redis, self._key)
+
+        await redis_key.delete_incrementally(batch_size=20)
+
+        self.assertFalse(await redis_key.exists())
+
+    async def test_delete_incrementally_with_list(self):
+        await self._redis.rpush(self._key, *range(250))
+        redis_key = RedisKey(self._redis, self._key)
+
+        await redis_key.delete_incrementally(batch_size=20)
+
+        self.assertFalse(await redis_key.exists())
+
+    async def test_rebuild_replaces_value(self):
+        await self._redis.sadd(self._key, 'old')
+        redis_set = RedisSet(self._redis, self._key)
+
+        async with redis_set.rebuild() as staging:
+            await staging.add('new1')
+            await staging.add('new2')
+            self.assertEqual(await redis_set.get_all(), ['old'])
+
+        self.assertEqual(sorted(await redis_set.get_all()), ['new1', 'new2'])
+
+    async def test_copy_to_copies_value(self):
+        redis_string = RedisString(self._redis, self._key)
+        await redis_string.set('value')
+
+        result = await redis_string.copy_to(self._other_key)
+
+        self.assertEqual(result, 1)
+        self.assertEqual(await RedisString(self._redis, self._other_key).get(), 'value')
@@ -0,0 +1,37 @@
+from aioredis_models import RedisKeyspaceScanner, RedisHash, RedisSet, RedisString
+from .redis_tests import RedisTests
+
+
+class RedisKeyspaceScannerTests(RedisTests):
+    _keys = ['test-scan:hash', 'test-scan:set', 'test-scan:string']
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        await self._redis.delete(*self._keys)
+        await RedisHash(self._redis, self._keys[0]).set('field', 'value')
+        await self._redis.sadd(self._keys[1], 'member')
+        await RedisString(self._redis, self._keys[2]).set('value')
+
+    async def asyncTearDown(self):
+        await self._redis.delete(*self._keys)
+        await super().asyncTearDown()
+
+    async def test_scan_returns_typed_models(self):
+        scanner = RedisKeyspaceScanner(self._redis, batch_size=10)
+
+        result = {key.key: type(key) async for key in scanner.scan('test-scan:*')}
+
+        self.assertEqual(result, {
+            self._keys[0]: RedisHash,
+            self._keys[1]: RedisSet,
+            self._keys[2]: RedisString
+        })
+        self.assertIsNone(scanner.cursor)
+
+    async def test_scan_with_key_type_filters_keys(self):
+        scanner = RedisKeyspaceScanner(self._redis, max_scans_per_second=100)
+
+        result = [key.key async for key in scanner.scan('test-scan:*', key_type='set')]
+
+        self.assertEqual(result, [self._keys[1]])
@@ -0,0 +1,48 @@
+import asyncio
+from aioredis_models import RedisLock
+from .redis_tests import RedisTests
+
+
+class RedisLockTests(RedisTests):
+    _key = 'test-lock-key'
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        await self._redis.delete(self._key, f'{self._key}:fence', f'{self._key}:signal')
+
+    async def test_acquire_is_exclusive_and_fenced(self):
+        first = RedisLock(self._redis, self._key)
+        second = RedisLock(self._redis, self._key)
+
+        self.assertTrue(await first.acquire())
+        self.assertFalse(await second.acquire(blocking=False))
+        self.assertTrue(await first.release())
+        self.assertTrue(await second.acquire(blocking=False))
+
+        self.assertEqual(first.fencing_token, None)
+        self.assertEqual(second.fencing_token, 2)
+        await second.release()
+
+    async def test_waiter_wakes_up_on_release(self):
+        first = RedisLock(self._redis, self._key, lease_seconds=30)
+        second = RedisLock(self._redis, self._key)
+        await first.acquire()
+
+        waiter = asyncio.ensure_future(second.acquire(timeout_seconds=5))
+        await asyncio.sleep(0.1)
+        await first.release()
+
+        self.assertTrue(await asyncio.wait_for(waiter, 2))
+        await second.release()
+
+    async def test_release_after_expiry_does_not_release_other_holder(self):
+        first = RedisLock(self._redis, self._key, lease_seconds=0.05)
+        second = RedisLock(self._redis, self._key)
+        await first.acquire()
+        await asyncio.sleep(0.1)
+        await second.acquire(blocking=False)
+
+        self.assertFalse(await first.release())
+        self.assertTrue(await second.extend())
+        await second.release()
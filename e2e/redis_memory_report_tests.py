@@ -0,0 +1,30 @@
+from aioredis_models import RedisMemoryReport, RedisHash
+from .redis_tests import RedisTests
+
+
+class RedisMemoryReportTests(RedisTests):
+    _small_key = 'test-memory:small'
+    _large_key = 'test-memory:large'
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        await self._redis.delete(self._small_key, self._large_key)
+        await RedisHash(self._redis, self._small_key).set('field', 'value')
+        await self._redis.hmset_dict(self._large_key, {str(index): index for index in range(1000)})
+
+    async def asyncTearDown(self):
+        await self._redis.delete(self._small_key, self._large_key)
+        await super().asyncTearDown()
+
+    async def test_report_flags_non_compact_keys(self):
+        redis_memory_report = RedisMemoryReport(self._redis, batch_size=10)
+
+        result = await redis_memory_report.report('test-memory:*')
+
+        self.assertEqual(result['prefixes']['test-memory']['keys'], 2)
+        self.assertEqual(result['total']['length'], 1001)
+        self.assertEqual(
+            [key['key'] for key in result['non_compact_keys']],
+            [self._large_key]
+        )
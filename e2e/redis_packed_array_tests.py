@@ -0,0 +1,40 @@
+from array import array
+from aioredis_models import RedisPackedArray
+from .redis_tests import RedisTests
+
+
+class RedisPackedArrayTests(RedisTests):
+    _key = 'test-packed-array-key'
+    _redis_packed_array: RedisPackedArray = None
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        self._redis_packed_array = RedisPackedArray(self._redis, self._key)
+        await self._redis_packed_array.delete()
+
+    async def test_set_and_get_elements(self):
+        await self._redis_packed_array.set([1.5, 2.5, 3.5])
+        await self._redis_packed_array.set_item(1, 4.5)
+        await self._redis_packed_array.extend([5.5])
+
+        values = await self._redis_packed_array.get()
+        item = await self._redis_packed_array.get_item(3)
+        values_slice = await self._redis_packed_array.get_slice(1, 10)
+        length = await self._redis_packed_array.length()
+
+        self.assertEqual(values, array('d', [1.5, 4.5, 3.5, 5.5]))
+        self.assertEqual(item, 5.5)
+        self.assertEqual(values_slice, array('d', [4.5, 3.5, 5.5]))
+        self.assertEqual(length, 4)
+
+    async def test_get_many(self):
+        other = RedisPackedArray(self._redis, 'test-packed-array-other', typecode='i')
+        await other.delete()
+        await self._redis_packed_array.set([1.0])
+        await other.set([2, 3])
+
+        result = await RedisPackedArray.get_many([self._redis_packed_array, other])
+
+        self.assertEqual(result, [array('d', [1.0]), array('i', [2, 3])])
+        await other.delete()
@@ -0,0 +1,36 @@
+from aioredis_models import RedisSlidingWindow, RedisTokenBucket
+from .redis_tests import RedisTests
+
+
+class RedisRateLimiterTests(RedisTests):
+    _keys = ['test-limit-1', 'test-limit-2']
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        await self._redis.delete(*self._keys)
+
+    async def test_token_bucket_allows_up_to_capacity(self):
+        bucket = RedisTokenBucket(self._redis, self._keys[0], 3, 0.001)
+
+        result = [await bucket.acquire() for _ in range(4)]
+
+        self.assertEqual(result, [True, True, True, False])
+
+    async def test_sliding_window_allows_up_to_limit(self):
+        window = RedisSlidingWindow(self._redis, self._keys[0], 2, 60)
+
+        result = [await window.acquire() for _ in range(3)]
+
+        self.assertEqual(result, [True, True, False])
+
+    async def test_acquire_all_is_all_or_nothing(self):
+        tight = RedisSlidingWindow(self._redis, self._keys[0], 1, 60)
+        loose = RedisSlidingWindow(self._redis, self._keys[1], 10, 60)
+
+        first = await RedisSlidingWindow.acquire_all([tight, loose])
+        second = await RedisSlidingWindow.acquire_all([tight, loose])
+
+        self.assertTrue(first)
+        self.assertFalse(second)
+        self.assertEqual(await self._redis.zcard(self._keys[1]), 1)
@@ -0,0 +1,96 @@
+from aioredis_models import RedisClient, RedisSet
+from .redis_tests import RedisTests
+
+
+class RedisSetTests(RedisTests):
+    _key = 'test-set-key'
+    _redis_set: RedisSet = None
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        self._redis_set = RedisSet(self._redis, self._key)
+        await self._redis_set.delete()
+
+    async def _add(self, *values):
+        for value in values:
+            await self._redis_set.add(value)
+
+    async def test_enumerate_gets_all_members(self):
+        values = {f'member-{index}' for index in range(300)}
+        await self._add(*values)
+
+        result = {item async for item in self._redis_set.enumerate(batch_size=10, unique=True)}
+
+        self.assertEqual(result, values)
+
+    async def test_enumerate_with_pattern_filters_members(self):
+        await self._add('foo', 'bar', 'food')
+
+        result = {item async for item in self._redis_set.enumerate(pattern='foo*')}
+
+        self.assertEqual(result, {'foo', 'food'})
+
+    async def test_set_algebra_works_on_server(self):
+        other_key = 'test-set-other-key'
+        destination_key = 'test-set-destination-key'
+        other_set = RedisSet(self._redis, other_key)
+        await other_set.delete()
+        await self._add('foo', 'bar', 'baz')
+        await other_set.add('bar')
+        await other_set.add('bin')
+
+        union = await self._redis_set.union(other_key)
+        intersection = await self._redis_set.intersection(other_key)
+        difference = await self._redis_set.difference(other_key)
+        stored = await self._redis_set.intersection_store(destination_key, other_key)
+
+        self.assertEqual(set(union), {'foo', 'bar', 'baz', 'bin'})
+        self.assertEqual(intersection, ['bar'])
+        self.assertEqual(set(difference), {'foo', 'baz'})
+        self.assertEqual(stored, 1)
+        self.assertEqual(await RedisSet(self._redis, destination_key).get_all(), ['bar'])
+
+    async def test_set_algebra_in_transaction(self):
+        other_key = 'test-set-other-key'
+        other_set = RedisSet(self._redis, other_key)
+        await other_set.delete()
+        await self._add('foo', 'bar', 'baz')
+        await other_set.add('bar', 'baz', 'bin')
+        redis_set = RedisSet(RedisClient(self._redis), self._key)
+        results = []
+
+        async with redis_set.begin_transaction() as transaction:
+            transaction.add_operation(
+                redis_set.union(other_key),
+                redis_set.intersection(other_key),
+                redis_set.difference(other_key),
+                redis_set.intersection_cardinality(other_key),
+                redis_set.intersection_cardinality(other_key, limit=1)
+            )
+            transaction.set_result_callback(lambda *result: results.extend(result))
+
+        self.assertEqual(set(results[0]), {'foo', 'bar', 'baz', 'bin'})
+        self.assertEqual(set(results[1]), {'bar', 'baz'})
+        self.assertEqual(results[2], ['foo'])
+        self.assertEqual(results[3:], [2, 1])
+
+    async def test_contains_many_checks_membership(self):
+        await self._add('foo', 'bar')
+        bloom_filter = await self._redis_set.build_bloom_filter()
+
+        result = await self._redis_set.contains_many(['foo', 'baz', 'bar'])
+        filtered = await self._redis_set.contains_many(['foo', 'baz', 'bar'], bloom_filter)
+
+        self.assertEqual(result, [True, False, True])
+        self.assertEqual(filtered, [True, False, True])
+
+    async def test_pop_many_claims_members(self):
+        await self._add('foo', 'bar', 'baz')
+
+        sample = await self._redis_set.sample(5, allow_duplicates=True)
+        popped = await self._redis_set.pop_many(2)
+
+        self.assertEqual(len(sample), 5)
+        self.assertEqual(len(popped), 2)
+        self.assertEqual(await self._redis_set.size(), 1)
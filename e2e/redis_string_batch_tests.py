@@ -0,0 +1,34 @@
+from aioredis_models import RedisString, RedisStringBatch
+from .redis_tests import RedisTests
+
+
+class RedisStringBatchTests(RedisTests):
+    _keys = [f'test-string-{index}' for index in range(5)]
+    _redis_string_batch: RedisStringBatch = None
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        self._redis_string_batch = RedisStringBatch(self._redis, batch_size=2)
+        await self._redis.delete(*self._keys)
+
+    async def test_set_many_and_get_many_round_trip(self):
+        values = {key: f'value-{index}' for index, key in enumerate(self._keys)}
+
+        await self._redis_string_batch.set_many(values, timeout_seconds=10)
+        result = await self._redis_string_batch.get_many(
+            [RedisString(self._redis, key) for key in self._keys] + ['missing']
+        )
+
+        self.assertEqual(result, list(values.values()) + [None])
+        self.assertGreater(await self._redis.pttl(self._keys[0]), 0)
+
+    async def test_set_many_if_not_exist_when_key_exists_sets_nothing(self):
+        await RedisString(self._redis, self._keys[0]).set('existing')
+
+        result = await self._redis_string_batch.set_many_if_not_exist(
+            {key: 'new' for key in self._keys}
+        )
+
+        self.assertEqual(result, 0)
+        self.assertIsNone(await RedisString(self._redis, self._keys[1]).get())
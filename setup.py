@@ -23,4 +23,5 @@ setup(
     keywords = ['redis', 'asyncio', 'data-structures', 'models'],
     packages=find_packages(exclude=("tests",)),
     install_requires=["aioredis==1.3.1"],
+    extras_require={"numpy": ["numpy"]},
 )
@@ -0,0 +1,43 @@
+import unittest
+from aioredis_models.bloom_filter import BloomFilter
+
+
+class BloomFilterTests(unittest.TestCase):
+    def test_init_succeeds(self):
+        bloom_filter = BloomFilter(100)
+
+        self.assertIsInstance(bloom_filter, BloomFilter)
+
+    def test_contains_with_added_values_returns_true(self):
+        bloom_filter = BloomFilter(1000)
+        values = [f'value-{index}' for index in range(1000)]
+
+        for value in values:
+            bloom_filter.add(value)
+
+        self.assertTrue(all(value in bloom_filter for value in values))
+        self.assertEqual(len(bloom_filter), 1000)
+
+    def test_contains_matches_str_and_bytes(self):
+        bloom_filter = BloomFilter(10)
+
+        bloom_filter.add(b'foo')
+        bloom_filter.add(5)
+
+        self.assertIn('foo', bloom_filter)
+        self.assertIn(b'5', bloom_filter)
+
+    def test_contains_with_other_values_stays_near_false_positive_rate(self):
+        bloom_filter = BloomFilter(1000, false_positive_rate=0.01)
+        for index in range(1000):
+            bloom_filter.add(f'value-{index}')
+
+        false_positives = sum(f'other-{index}' in bloom_filter for index in range(10000))
+
+        self.assertLess(false_positives, 300)
+        self.assertLess(bloom_filter.false_positive_rate(), 0.03)
+
+    def test_false_positive_rate_when_empty_is_zero(self):
+        bloom_filter = BloomFilter(10)
+
+        self.assertEqual(bloom_filter.false_positive_rate(), 0)
@@ -0,0 +1,190 @@
+import json
+import unittest
+from io import StringIO
+from unittest.mock import MagicMock, AsyncMock, call, patch
+from aioredis_models.redis_backup import RedisBackup
+from aioredis_models.redis_key import RedisKey
+
+
+def create_redis(types, ttl=-1):
+    redis = MagicMock()
+    redis.get_connection.return_value = redis
+    async def execute(command, key, **kwargs):
+        return types.get(key, 'none')
+    redis.execute = AsyncMock(side_effect=execute)
+    redis.pttl = AsyncMock(return_value=ttl)
+    return redis
+
+
+def create_transaction(redis):
+    transaction_ctx = AsyncMock()
+    transaction = MagicMock()
+    transaction_ctx.__aenter__.return_value = transaction
+    redis.begin_transaction.return_value = transaction_ctx
+    return transaction
+
+
+def read_lines(output):
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+class RedisBackupTests(unittest.IsolatedAsyncioTestCase):
+    def test_init_succeeds(self):
+        redis_backup = RedisBackup(MagicMock())
+
+        self.assertIsInstance(redis_backup, RedisBackup)
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_export_with_hash_writes_line_per_batch(self, isinstance_mock):
+        isinstance_mock.return_value = True
+        redis = create_redis({'foo': 'hash'}, ttl=5000)
+        redis.hscan = AsyncMock(side_effect=[
+            (7, [(b'a', b'1'), (b'b', b'\xff')]),
+            (0, [(b'c', b'3')])
+        ])
+        redis_backup = RedisBackup(redis, batch_size=2)
+        output = StringIO()
+
+        result = await redis_backup.export([RedisKey(redis, 'foo')], output)
+
+        self.assertEqual(result, 1)
+        self.assertEqual(read_lines(output), [
+            {'key': 'foo', 'type': 'hash', 'items': [['a', '1'], ['b', '\udcff']], 'ttl': 5000},
+            {'key': 'foo', 'type': 'hash', 'items': [['c', '3']]}
+        ])
+        redis.hscan.assert_has_awaits([call('foo', 0, count=2), call('foo', 7, count=2)])
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_export_with_list_reads_ranges(self, isinstance_mock):
+        isinstance_mock.return_value = True
+        redis = create_redis({'foo': 'list'})
+        redis.lrange = AsyncMock(side_effect=[[b'a', b'b'], [b'c']])
+        redis_backup = RedisBackup(redis, batch_size=2)
+        output = StringIO()
+
+        await redis_backup.export(['foo'], output)
+
+        self.assertEqual(read_lines(output), [
+            {'key': 'foo', 'type': 'list', 'items': ['a', 'b'], 'ttl': None},
+            {'key': 'foo', 'type': 'list', 'items': ['c']}
+        ])
+        redis.lrange.assert_has_awaits([
+            call('foo', 0, 1, encoding=None), call('foo', 2, 3, encoding=None)
+        ])
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_export_with_async_iterable_and_sorted_set_keeps_scores(self, isinstance_mock):
+        isinstance_mock.return_value = True
+        redis = create_redis({'foo': 'zset', 'bar': 'string'})
+        redis.zscan = AsyncMock(return_value=(0, [(b'a', 1.5)]))
+        redis.getrange = AsyncMock(return_value=b'value')
+        redis_backup = RedisBackup(redis)
+        output = StringIO()
+        async def keys():
+            yield 'foo'
+            yield 'bar'
+            yield 'missing'
+
+        result = await redis_backup.export(keys(), output)
+
+        self.assertEqual(result, 2)
+        self.assertEqual(read_lines(output), [
+            {'key': 'foo', 'type': 'zset', 'items': [['a', 1.5]], 'ttl': None},
+            {'key': 'bar', 'type': 'string', 'items': ['value'], 'ttl': None}
+        ])
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_export_with_string_writes_line_per_chunk(self, isinstance_mock):
+        isinstance_mock.return_value = True
+        redis = create_redis({'foo': 'string', 'empty': 'string'}, ttl=5000)
+        redis.getrange = AsyncMock(side_effect=[b'abcd', b'e\xff', b''])
+        redis.exists = AsyncMock(return_value=1)
+        redis_backup = RedisBackup(redis)
+        redis_backup._string_chunk_size = 4
+        output = StringIO()
+
+        result = await redis_backup.export(['foo', 'empty'], output)
+
+        self.assertEqual(result, 2)
+        self.assertEqual(read_lines(output), [
+            {'key': 'foo', 'type': 'string', 'items': ['abcd'], 'ttl': 5000},
+            {'key': 'foo', 'type': 'string', 'items': ['e\udcff']},
+            {'key': 'empty', 'type': 'string', 'items': [''], 'ttl': 5000}
+        ])
+        redis.getrange.assert_has_awaits([
+            call('foo', 0, 3, encoding=None),
+            call('foo', 4, 7, encoding=None),
+            call('empty', 0, 3, encoding=None)
+        ])
+        redis.exists.assert_awaited_once_with('empty')
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_export_with_dump_writes_serialized_keys(self, isinstance_mock):
+        isinstance_mock.return_value = True
+        redis = create_redis({'foo': 'hash', 'bar': 'stream'}, ttl=100)
+        redis.dump = AsyncMock(return_value=b'\x00serialized')
+        redis_backup = RedisBackup(redis, use_dump=True)
+        output = StringIO()
+
+        result = await redis_backup.export(['foo', 'bar'], output)
+
+        self.assertEqual(result, 2)
+        self.assertEqual(read_lines(output), [
+            {'key': 'foo', 'ttl': 100, 'dump': 'AHNlcmlhbGl6ZWQ='},
+            {'key': 'bar', 'ttl': 100, 'dump': 'AHNlcmlhbGl6ZWQ='}
+        ])
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_restore_writes_batches_in_transactions(self, isinstance_mock):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        redis.get_connection.return_value = redis
+        transaction = create_transaction(redis)
+        redis_backup = RedisBackup(redis)
+        lines = [
+            '{"key":"foo","type":"hash","items":[["a","1"],["b","\\udcff"]],"ttl":5000}\n',
+            '{"key":"foo","type":"hash","items":[["c","3"]]}\n',
+            '\n',
+            '{"key":"bar","type":"zset","items":[["a",1.5]],"ttl":null}\n',
+            '{"key":"baz","type":"list","items":["x","y"],"ttl":null}\n',
+            '{"key":"qux","type":"set","items":["m"],"ttl":null}\n',
+            '{"key":"str","type":"string","items":["v"],"ttl":null}\n',
+            '{"key":"str","type":"string","items":["w"]}\n'
+        ]
+
+        result = await redis_backup.restore(lines)
+
+        self.assertEqual(result, 5)
+        redis.delete.assert_has_calls([
+            call('foo'), call('bar'), call('baz'), call('qux'), call('str')
+        ])
+        redis.hmset.assert_has_calls([
+            call('foo', b'a', b'1', b'b', b'\xff'),
+            call('foo', b'c', b'3')
+        ])
+        redis.zadd.assert_called_once_with('bar', 1.5, b'a')
+        redis.rpush.assert_called_once_with('baz', b'x', b'y')
+        redis.sadd.assert_called_once_with('qux', b'm')
+        redis.append.assert_has_calls([call('str', b'v'), call('str', b'w')])
+        redis.pexpire.assert_called_once_with('foo', 5000)
+        self.assertEqual(transaction.add_operation.call_count, 13)
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_restore_with_dump_restores_in_batches(self, isinstance_mock):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        redis.get_connection.return_value = redis
+        redis.execute = AsyncMock()
+        redis_backup = RedisBackup(redis, batch_size=1)
+        lines = [
+            '{"key":"foo","ttl":100,"dump":"AHNlcmlhbGl6ZWQ="}\n',
+            '{"key":"bar","ttl":null,"dump":"AHNlcmlhbGl6ZWQ="}\n'
+        ]
+
+        result = await redis_backup.restore(lines)
+
+        self.assertEqual(result, 2)
+        redis.execute.assert_has_awaits([
+            call(b'RESTORE', 'foo', 100, b'\x00serialized', b'REPLACE'),
+            call(b'RESTORE', 'bar', 0, b'\x00serialized', b'REPLACE')
+        ])
@@ -0,0 +1,127 @@
+import unittest
+from unittest.mock import MagicMock, AsyncMock, call
+from aioredis.commands import Redis
+from aioredis_models.redis_client import RedisClient
+from aioredis_models.redis_bitmap import RedisBitmap
+
+
+class RedisBitmapTests(unittest.IsolatedAsyncioTestCase):
+    def test_init_succeeds(self):
+        redis_bitmap = RedisBitmap(MagicMock(), MagicMock())
+
+        self.assertIsInstance(redis_bitmap, RedisBitmap)
+
+    def test_get_bit_gets_bit(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_bitmap = RedisBitmap(redis, key)
+
+        result = redis_bitmap.get_bit(42)
+
+        redis.getbit.assert_called_once_with(key, 42)
+        self.assertEqual(result, redis.getbit.return_value)
+
+    def test_set_bit_sets_bit(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_bitmap = RedisBitmap(redis, key)
+
+        result = redis_bitmap.set_bit(42, 0)
+
+        redis.setbit.assert_called_once_with(key, 42, 0)
+        self.assertEqual(result, redis.setbit.return_value)
+
+    def test_get_bits_uses_bitfield(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_bitmap = RedisBitmap(redis, key)
+
+        result = redis_bitmap.get_bits([3, 7])
+
+        redis.execute.assert_called_once_with(
+            b'BITFIELD', key, b'GET', b'u1', 3, b'GET', b'u1', 7
+        )
+        self.assertEqual(result, redis.execute.return_value)
+
+    def test_set_bits_uses_bitfield(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_bitmap = RedisBitmap(redis, key)
+
+        result = redis_bitmap.set_bits([3, 7])
+
+        redis.execute.assert_called_once_with(
+            b'BITFIELD', key, b'SET', b'u1', 3, 1, b'SET', b'u1', 7, 1
+        )
+        self.assertEqual(result, redis.execute.return_value)
+
+    async def test_set_bits_with_no_offsets_returns_empty_list(self):
+        redis = MagicMock()
+        redis.execute = None
+        redis_bitmap = RedisBitmap(redis, MagicMock())
+
+        self.assertEqual(await redis_bitmap.set_bits([]), [])
+        self.assertEqual(await redis_bitmap.get_bits([]), [])
+
+    def test_count_counts_bits(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_bitmap = RedisBitmap(redis, key)
+
+        result = redis_bitmap.count(1, -1)
+
+        redis.bitcount.assert_called_once_with(key, 1, -1)
+        self.assertEqual(result, redis.bitcount.return_value)
+
+    def test_combine_uses_bitop(self):
+        redis = MagicMock()
+        key = MagicMock()
+        destination_key = MagicMock()
+        keys = [MagicMock(), MagicMock()]
+        redis_bitmap = RedisBitmap(redis, key)
+
+        result = redis_bitmap.combine('and', destination_key, *keys)
+
+        redis.bitop_and.assert_called_once_with(destination_key, key, *keys)
+        self.assertEqual(result, redis.bitop_and.return_value)
+
+    def test_combine_with_not_uses_bitop_not(self):
+        redis = MagicMock()
+        key = MagicMock()
+        destination_key = MagicMock()
+        redis_bitmap = RedisBitmap(redis, key)
+
+        result = redis_bitmap.combine('NOT', destination_key)
+
+        redis.bitop_not.assert_called_once_with(destination_key, key)
+        self.assertEqual(result, redis.bitop_not.return_value)
+
+    async def test_bit_operations_in_transaction_queue_commands(self):
+        client = RedisClient(Redis(MagicMock()))
+        redis_bitmap = RedisBitmap(client, 'foo')
+        client.begin_transaction()
+
+        results = [
+            redis_bitmap.get_bits([1, 2]),
+            redis_bitmap.set_bits([3]),
+            redis_bitmap.combine('OR', 'bar', 'baz')
+        ]
+
+        self.assertEqual(len(client.get_connection()._pipeline), 3)
+        self.assertFalse(any(result.done() for result in results))
+        client.discard_transaction()
+
+    async def test_load_sets_bits_in_batches(self):
+        redis = MagicMock()
+        redis.execute = AsyncMock()
+        key = MagicMock()
+        redis_bitmap = RedisBitmap(redis, key)
+
+        await redis_bitmap.load(iter(range(5)), batch_size=2)
+
+        redis.execute.assert_has_awaits([
+            call(b'BITFIELD', key, b'SET', b'u1', 0, 1, b'SET', b'u1', 1, 1),
+            call(b'BITFIELD', key, b'SET', b'u1', 2, 1, b'SET', b'u1', 3, 1),
+            call(b'BITFIELD', key, b'SET', b'u1', 4, 1)
+        ])
+        self.assertEqual(redis.execute.await_count, 3)
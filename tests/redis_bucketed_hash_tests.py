@@ -0,0 +1,161 @@
+import unittest
+from unittest.mock import MagicMock, AsyncMock, call, patch
+from zlib import crc32
+from aioredis_models.redis_bucketed_hash import RedisBucketedHash
+
+
+def bucket_key(key, field, bucket_count):
+    return f'{key}:{crc32(field.encode("utf-8")) % bucket_count}'
+
+
+class RedisBucketedHashTests(unittest.IsolatedAsyncioTestCase):
+    def test_init_succeeds(self):
+        redis_bucketed_hash = RedisBucketedHash(MagicMock(), MagicMock())
+
+        self.assertIsInstance(redis_bucketed_hash, RedisBucketedHash)
+
+    @patch('aioredis_models.redis_bucketed_hash.RedisHash')
+    @patch('aioredis_models.redis_model.isinstance')
+    def test_get_gets_from_bucket(self, isinstance_mock, redis_hash_init):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        key = 'some-key'
+        field = 'some-field'
+        encoding = MagicMock()
+        redis_bucketed_hash = RedisBucketedHash(redis, key, bucket_count=16)
+
+        result = redis_bucketed_hash.get(field, encoding=encoding)
+
+        redis_hash_init.assert_called_once_with(redis, bucket_key(key, field, 16))
+        redis_hash_init.return_value.get.assert_called_once_with(field, encoding=encoding)
+        self.assertEqual(result, redis_hash_init.return_value.get.return_value)
+
+    @patch('aioredis_models.redis_bucketed_hash.RedisHash')
+    @patch('aioredis_models.redis_model.isinstance')
+    def test_set_sets_in_bucket(self, isinstance_mock, redis_hash_init):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        key = 'some-key'
+        field = 'some-field'
+        value = MagicMock()
+        redis_bucketed_hash = RedisBucketedHash(redis, key, bucket_count=16)
+
+        result = redis_bucketed_hash.set(field, value)
+
+        redis_hash_init.assert_called_once_with(redis, bucket_key(key, field, 16))
+        redis_hash_init.return_value.set.assert_called_once_with(field, value)
+        self.assertEqual(result, redis_hash_init.return_value.set.return_value)
+
+    @patch('aioredis_models.redis_bucketed_hash.RedisHash')
+    @patch('aioredis_models.redis_model.isinstance')
+    def test_remove_removes_from_bucket(self, isinstance_mock, redis_hash_init):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        key = 'some-key'
+        field = 'some-field'
+        redis_bucketed_hash = RedisBucketedHash(redis, key, bucket_count=16)
+
+        result = redis_bucketed_hash.remove(field)
+
+        redis_hash_init.assert_called_once_with(redis, bucket_key(key, field, 16))
+        redis_hash_init.return_value.remove.assert_called_once_with(field)
+        self.assertEqual(result, redis_hash_init.return_value.remove.return_value)
+
+    @patch('aioredis_models.redis_bucketed_hash.RedisHash')
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_get_many_groups_fields_by_bucket(self, isinstance_mock, redis_hash_init):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        key = 'some-key'
+        fields = [f'field-{index}' for index in range(10)]
+        redis_hashes = {}
+        def create_redis_hash(_, bucket):
+            redis_hash = redis_hashes.setdefault(bucket, MagicMock())
+            redis_hash.get_many = AsyncMock(side_effect=lambda *fields, **_: [
+                f'value-of-{field}' for field in fields
+            ])
+            return redis_hash
+        redis_hash_init.side_effect = create_redis_hash
+        redis_bucketed_hash = RedisBucketedHash(redis, key, bucket_count=4)
+
+        result = await redis_bucketed_hash.get_many(fields)
+
+        self.assertEqual(result, {field: f'value-of-{field}' for field in fields})
+        self.assertEqual(
+            set(redis_hashes.keys()),
+            {bucket_key(key, field, 4) for field in fields}
+        )
+        for bucket, redis_hash in redis_hashes.items():
+            redis_hash.get_many.assert_awaited_once_with(*(
+                field for field in fields if bucket_key(key, field, 4) == bucket
+            ), encoding='utf-8')
+
+    @patch('aioredis_models.redis_bucketed_hash.RedisHash')
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_set_all_sets_each_bucket_in_transaction(self, isinstance_mock, redis_hash_init):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        transaction_ctx = AsyncMock()
+        transaction = MagicMock()
+        transaction_ctx.__aenter__.return_value = transaction
+        redis.begin_transaction.return_value = transaction_ctx
+        key = 'some-key'
+        values = {f'field-{index}': f'value-{index}' for index in range(10)}
+        redis_bucketed_hash = RedisBucketedHash(redis, key, bucket_count=4)
+
+        await redis_bucketed_hash.set_all(values)
+
+        buckets = {}
+        for field, value in values.items():
+            buckets.setdefault(bucket_key(key, field, 4), {})[field] = value
+        for bucket, bucket_values in buckets.items():
+            self.assertIn(call(redis, bucket), redis_hash_init.call_args_list)
+            self.assertIn(call(bucket_values), redis_hash_init.return_value.set_all.call_args_list)
+        transaction_ctx.__aexit__.assert_awaited_once()
+        transaction.add_operation.assert_called_once()
+
+    async def test_set_all_with_no_values_does_nothing(self):
+        redis = MagicMock()
+        redis.begin_transaction = None
+        redis_bucketed_hash = RedisBucketedHash(redis, 'some-key')
+
+        await redis_bucketed_hash.set_all({})
+
+    @patch('aioredis_models.redis_bucketed_hash.RedisKey')
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_delete_deletes_all_buckets(self, isinstance_mock, redis_key_init):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        transaction_ctx = AsyncMock()
+        transaction = MagicMock()
+        transaction_ctx.__aenter__.return_value = transaction
+        redis.begin_transaction.return_value = transaction_ctx
+        key = 'some-key'
+        redis_bucketed_hash = RedisBucketedHash(redis, key, bucket_count=3)
+
+        await redis_bucketed_hash.delete()
+
+        redis_key_init.assert_has_calls([
+            call(redis, f'{key}:{index}') for index in range(3)
+        ], any_order=True)
+        self.assertEqual(redis_key_init.return_value.delete.call_count, 3)
+        transaction_ctx.__aexit__.assert_awaited_once()
+
+    @patch('aioredis_models.redis_bucketed_hash.RedisHash')
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_enumerate_enumerates_all_buckets(self, isinstance_mock, redis_hash_init):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        key = 'some-key'
+        redis_hashes = [MagicMock() for _ in range(3)]
+        for index, redis_hash in enumerate(redis_hashes):
+            async def enumerate_bucket(index=index, **_):
+                yield (f'field-{index}', f'value-{index}')
+            redis_hash.enumerate = enumerate_bucket
+        redis_hash_init.side_effect = redis_hashes
+        redis_bucketed_hash = RedisBucketedHash(redis, key, bucket_count=3)
+
+        result = [item async for item in redis_bucketed_hash.enumerate(batch_size=5)]
+
+        redis_hash_init.assert_has_calls([call(redis, f'{key}:{index}') for index in range(3)])
+        self.assertEqual(result, [(f'field-{index}', f'value-{index}') for index in range(3)])
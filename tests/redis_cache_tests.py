@@ -0,0 +1,191 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, AsyncMock, patch
+from time import time
+from aioredis_models.redis_cache import RedisCache
+
+
+def create_redis_strings(redis_string_init, entry=None):
+    redis_strings = {}
+    def create_redis_string(_, key):
+        if key not in redis_strings:
+            redis_string = MagicMock()
+            redis_string.set = AsyncMock()
+            redis_string.get = AsyncMock(return_value=entry)
+            redis_strings[key] = redis_string
+        return redis_strings[key]
+    redis_string_init.side_effect = create_redis_string
+    return redis_strings
+
+
+def create_redis_lock(redis_lock_init, locked=False):
+    redis_lock = redis_lock_init.return_value
+    redis_lock.acquire = AsyncMock(return_value=not locked)
+    redis_lock.release = AsyncMock()
+    return redis_lock
+
+
+class RedisCacheTests(unittest.IsolatedAsyncioTestCase):
+    def test_init_succeeds(self):
+        redis_cache = RedisCache(MagicMock(), 10)
+
+        self.assertIsInstance(redis_cache, RedisCache)
+
+    @patch('aioredis_models.redis_cache.RedisString')
+    async def test_get_with_fresh_entry_returns_value(self, redis_string_init):
+        create_redis_strings(redis_string_init, entry=f'{time() + 60:.3f} 0.000 some value')
+        compute = AsyncMock()
+        redis_cache = RedisCache(MagicMock(), 60)
+
+        result = await redis_cache.get('some-key', compute)
+
+        self.assertEqual(result, 'some value')
+        compute.assert_not_awaited()
+        self.assertEqual(redis_cache.hits, 1)
+        self.assertEqual(redis_cache.hit_ratio(), 1)
+
+    @patch('aioredis_models.redis_cache.RedisLock')
+    @patch('aioredis_models.redis_cache.RedisString')
+    async def test_get_with_missing_entry_computes_and_stores(
+        self, redis_string_init, redis_lock_init
+    ):
+        redis_strings = create_redis_strings(redis_string_init)
+        redis_lock = create_redis_lock(redis_lock_init)
+        redis = MagicMock()
+        compute = AsyncMock(return_value='computed')
+        redis_cache = RedisCache(redis, 60, stale_seconds=30, lock_timeout_seconds=5)
+
+        result = await redis_cache.get('some-key', compute)
+
+        self.assertEqual(result, 'computed')
+        compute.assert_awaited_once_with()
+        stored, = redis_strings['some-key'].set.await_args.args
+        self.assertTrue(stored.endswith(' computed'))
+        self.assertEqual(redis_strings['some-key'].set.await_args.kwargs, {'timeout_seconds': 90})
+        redis_lock_init.assert_called_once_with(
+            redis_cache._redis, 'some-key:lock', lease_seconds=5
+        )
+        redis_lock.acquire.assert_awaited_once_with(blocking=False)
+        redis_lock.release.assert_awaited_once_with()
+        self.assertEqual(redis_cache.misses, 1)
+        self.assertEqual(redis_cache.recomputes, 1)
+        self.assertEqual(redis_cache.hit_ratio(), 0)
+
+    @patch('aioredis_models.redis_cache.RedisLock')
+    @patch('aioredis_models.redis_cache.RedisString')
+    async def test_get_with_concurrent_misses_computes_once(
+        self, redis_string_init, redis_lock_init
+    ):
+        create_redis_strings(redis_string_init)
+        create_redis_lock(redis_lock_init)
+        async def compute():
+            await asyncio.sleep(0.01)
+            return 'computed'
+        compute_mock = AsyncMock(side_effect=compute)
+        redis_cache = RedisCache(MagicMock(), 60)
+
+        result = await asyncio.gather(*(
+            redis_cache.get('some-key', compute_mock) for _ in range(5)
+        ))
+
+        self.assertEqual(result, ['computed'] * 5)
+        compute_mock.assert_awaited_once()
+        self.assertEqual(redis_cache.misses, 5)
+        self.assertEqual(redis_cache.recomputes, 1)
+
+    @patch('aioredis_models.redis_cache.RedisLock')
+    @patch('aioredis_models.redis_cache.RedisString')
+    async def test_get_with_stale_entry_returns_stale_value_and_refreshes(
+        self, redis_string_init, redis_lock_init
+    ):
+        redis_strings = create_redis_strings(
+            redis_string_init,
+            entry=f'{time() - 1:.3f} 0.000 stale value'
+        )
+        create_redis_lock(redis_lock_init)
+        compute = AsyncMock(return_value='computed')
+        redis_cache = RedisCache(MagicMock(), 60, stale_seconds=30)
+
+        result = await redis_cache.get('some-key', compute)
+        await asyncio.sleep(0)
+
+        self.assertEqual(result, 'stale value')
+        compute.assert_awaited_once_with()
+        redis_strings['some-key'].set.assert_awaited_once()
+        self.assertEqual(redis_cache.stale_hits, 1)
+
+    @patch('aioredis_models.redis_cache.RedisLock')
+    @patch('aioredis_models.redis_cache.RedisString')
+    async def test_get_when_locked_elsewhere_waits_for_value(
+        self, redis_string_init, redis_lock_init
+    ):
+        redis_strings = create_redis_strings(redis_string_init)
+        create_redis_lock(redis_lock_init, locked=True)
+        redis_string_init(None, 'some-key').get.side_effect = [
+            None, None, f'{time() + 60:.3f} 0.000 from elsewhere'
+        ]
+        compute = AsyncMock()
+        redis_cache = RedisCache(MagicMock(), 60)
+        redis_cache._lock_poll_seconds = 0
+
+        result = await redis_cache.get('some-key', compute)
+
+        self.assertEqual(result, 'from elsewhere')
+        compute.assert_not_awaited()
+        redis_strings['some-key'].set.assert_not_awaited()
+
+    @patch('aioredis_models.redis_cache.RedisLock')
+    @patch('aioredis_models.redis_cache.RedisString')
+    async def test_get_when_compute_fails_raises(self, redis_string_init, redis_lock_init):
+        redis_strings = create_redis_strings(redis_string_init)
+        redis_lock = create_redis_lock(redis_lock_init)
+        compute = AsyncMock(side_effect=ValueError())
+        redis_cache = RedisCache(MagicMock(), 60)
+
+        with self.assertRaises(ValueError):
+            await redis_cache.get('some-key', compute)
+
+        redis_lock.release.assert_awaited_once_with()
+        redis_strings['some-key'].set.assert_not_awaited()
+
+    @patch('aioredis_models.redis_cache.random', return_value=0.999999)
+    @patch('aioredis_models.redis_cache.RedisLock')
+    @patch('aioredis_models.redis_cache.RedisString')
+    async def test_get_with_early_refresh_counts_early_hit(
+        self, redis_string_init, redis_lock_init, _
+    ):
+        create_redis_strings(redis_string_init, entry=f'{time() + 30:.3f} 10.000 fresh value')
+        create_redis_lock(redis_lock_init)
+        compute = AsyncMock(return_value='computed')
+        redis_cache = RedisCache(MagicMock(), 60)
+
+        result = await redis_cache.get('some-key', compute)
+        await asyncio.sleep(0)
+
+        self.assertEqual(result, 'fresh value')
+        compute.assert_awaited_once_with()
+        self.assertEqual(redis_cache.early_hits, 1)
+        self.assertEqual(redis_cache.stale_hits, 0)
+        self.assertEqual(redis_cache.hit_ratio(), 1)
+
+    @patch('aioredis_models.redis_cache.RedisLock')
+    @patch('aioredis_models.redis_cache.RedisString')
+    async def test_get_with_miss_during_background_refresh_does_not_join_it(
+        self, redis_string_init, redis_lock_init
+    ):
+        redis_strings = create_redis_strings(redis_string_init)
+        redis_lock = create_redis_lock(redis_lock_init)
+        redis_lock.acquire.side_effect = [False, True]
+        redis_string_init(None, 'some-key').get.side_effect = [
+            f'{time() - 1:.3f} 0.000 stale value', None
+        ]
+        compute = AsyncMock(return_value='computed')
+        redis_cache = RedisCache(MagicMock(), 60, stale_seconds=30)
+
+        stale = await redis_cache.get('some-key', compute)
+        result = await redis_cache.get('some-key', compute)
+
+        self.assertEqual(stale, 'stale value')
+        self.assertEqual(result, 'computed')
+        compute.assert_awaited_once_with()
+        redis_strings['some-key'].set.assert_awaited_once()
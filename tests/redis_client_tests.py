@@ -1,9 +1,10 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+from aioredis.commands import Redis
 from aioredis_models.redis_client import RedisClient
 
 
-class RedisClientTests(unittest.TestCase):
+class RedisClientTests(unittest.IsolatedAsyncioTestCase):
     @staticmethod
     def test_init_succeeds():
         RedisClient(MagicMock())
@@ -93,3 +94,27 @@ class RedisClientTests(unittest.TestCase):
 
         self.assertEqual(result, redis.multi_exec.return_value.execute.return_value)
         redis.multi_exec.return_value.execute.assert_called_once_with()
+
+    async def test_execute_when_no_transaction_started_executes_command(self):
+        redis = MagicMock()
+        redis.execute = AsyncMock(return_value=['a'])
+        client = RedisClient(redis)
+
+        result = await client.execute(b'SINTER', 'foo', 'bar', encoding='utf-8')
+
+        self.assertEqual(result, ['a'])
+        redis.execute.assert_awaited_once_with(b'SINTER', 'foo', 'bar', encoding='utf-8')
+
+    @patch('aioredis_models.redis_client.RedisTransaction', MagicMock())
+    async def test_execute_when_transaction_started_queues_command(self):
+        connection = MagicMock()
+        client = RedisClient(Redis(connection))
+        client.begin_transaction()
+
+        result = client.execute(b'SINTER', 'foo', 'bar', encoding='utf-8')
+
+        self.assertFalse(result.done())
+        connection.execute.assert_not_called()
+        _, *command = client.get_connection()._pipeline[0]
+        self.assertEqual(command, [b'SINTER', ('foo', 'bar'), {'encoding': 'utf-8'}])
+        client.discard_transaction()
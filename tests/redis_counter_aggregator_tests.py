@@ -0,0 +1,165 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, AsyncMock, call, patch
+from aioredis import ConnectionClosedError, MultiExecError, ReplyError
+from aioredis_models.redis_counter_aggregator import RedisCounterAggregator
+
+
+def create_redis():
+    redis = MagicMock()
+    transaction_ctx = AsyncMock()
+    transaction = MagicMock()
+    transaction_ctx.__aenter__.return_value = transaction
+    redis.begin_transaction.return_value = transaction_ctx
+    return redis, transaction_ctx, transaction
+
+
+class RedisCounterAggregatorTests(unittest.IsolatedAsyncioTestCase):
+    def test_init_succeeds(self):
+        aggregator = RedisCounterAggregator(MagicMock())
+
+        self.assertIsInstance(aggregator, RedisCounterAggregator)
+
+    def test_increment_sums_pending_increments(self):
+        aggregator = RedisCounterAggregator(MagicMock())
+
+        aggregator.increment('some-key', 2)
+        aggregator.increment('some-key', 3)
+        aggregator.increment('some-key', 1, field='some-field')
+
+        self.assertEqual(aggregator.pending_count(), 2)
+
+    @patch('aioredis_models.redis_counter_aggregator.RedisString')
+    @patch('aioredis_models.redis_counter_aggregator.RedisHash')
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_flush_writes_totals_in_one_transaction(
+        self, isinstance_mock, redis_hash_init, redis_string_init
+    ):
+        isinstance_mock.return_value = True
+        redis, transaction_ctx, transaction = create_redis()
+        aggregator = RedisCounterAggregator(redis)
+        aggregator.increment('some-key', 2)
+        aggregator.increment('some-key', 3)
+        aggregator.increment('other-key', 1.5, field='some-field')
+
+        await aggregator.flush()
+
+        redis.begin_transaction.assert_called_once_with()
+        transaction_ctx.__aexit__.assert_awaited_once()
+        redis_string_init.assert_called_once_with(redis, 'some-key')
+        redis_string_init.return_value.increment.assert_called_once_with(5)
+        redis_hash_init.assert_called_once_with(redis, 'other-key')
+        redis_hash_init.return_value.increment.assert_called_once_with('some-field', 1.5)
+        transaction.add_operation.assert_called_once_with(
+            redis_string_init.return_value.increment.return_value,
+            redis_hash_init.return_value.increment.return_value
+        )
+        self.assertEqual(aggregator.pending_count(), 0)
+
+    async def test_flush_with_nothing_pending_does_nothing(self):
+        redis = MagicMock()
+        redis.begin_transaction = None
+        aggregator = RedisCounterAggregator(redis)
+
+        await aggregator.flush()
+
+    @patch('aioredis_models.redis_counter_aggregator.RedisString')
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_flush_when_transaction_fails_keeps_increments(
+        self, isinstance_mock, redis_string_init
+    ):
+        isinstance_mock.return_value = True
+        redis, transaction_ctx, _ = create_redis()
+        transaction_ctx.__aexit__.side_effect = ConnectionError()
+        aggregator = RedisCounterAggregator(redis)
+        aggregator.increment('some-key', 2)
+
+        with self.assertRaises(ConnectionError):
+            await aggregator.flush()
+        transaction_ctx.__aexit__.side_effect = None
+        aggregator.increment('some-key', 3)
+        await aggregator.flush()
+
+        redis_string_init.return_value.increment.assert_has_calls([call(2), call(5)])
+
+    @patch('aioredis_models.redis_counter_aggregator.RedisString')
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_flush_when_some_increments_fail_keeps_only_failed_increments(
+        self, isinstance_mock, redis_string_init
+    ):
+        isinstance_mock.return_value = True
+        redis, transaction_ctx, _ = create_redis()
+        errors = {2: ReplyError('WRONGTYPE'), 4: ConnectionClosedError()}
+        transaction_ctx.__aexit__.side_effect = MultiExecError(list(errors.values()))
+        def increment(amount):
+            result = asyncio.get_running_loop().create_future()
+            if amount in errors:
+                result.set_exception(errors[amount])
+            else:
+                result.set_result(amount)
+            return result
+        redis_string_init.return_value.increment.side_effect = increment
+        on_dropped = MagicMock()
+        aggregator = RedisCounterAggregator(redis, on_dropped=on_dropped)
+        aggregator.increment('poison-key', 2)
+        aggregator.increment('some-key', 3)
+        aggregator.increment('lost-key', 4)
+
+        with self.assertRaises(MultiExecError):
+            await aggregator.flush()
+
+        self.assertEqual(aggregator.pending_count(), 1)
+        on_dropped.assert_called_once_with('poison-key', None, 2, errors[2])
+        transaction_ctx.__aexit__.side_effect = None
+        redis_string_init.return_value.increment.side_effect = None
+        redis_string_init.reset_mock()
+        await aggregator.flush()
+        redis_string_init.assert_called_once_with(redis, 'lost-key')
+        redis_string_init.return_value.increment.assert_called_once_with(4)
+
+    @patch('aioredis_models.redis_counter_aggregator.RedisString')
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_increment_over_max_pending_flushes(self, isinstance_mock, redis_string_init):
+        isinstance_mock.return_value = True
+        redis, _, _ = create_redis()
+        aggregator = RedisCounterAggregator(redis, max_pending=2)
+
+        aggregator.increment('some-key')
+        aggregator.increment('other-key')
+        await aggregator.close()
+
+        self.assertEqual(redis.begin_transaction.call_count, 1)
+        redis_string_init.assert_has_calls([
+            call(redis, 'some-key'),
+            call(redis, 'other-key')
+        ], any_order=True)
+
+    @patch('aioredis_models.redis_counter_aggregator.RedisString')
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_increment_far_over_max_pending_schedules_one_flush(
+        self, isinstance_mock, _
+    ):
+        isinstance_mock.return_value = True
+        redis, _, _ = create_redis()
+        aggregator = RedisCounterAggregator(redis, max_pending=10)
+
+        for index in range(1000):
+            aggregator.increment(f'key-{index}')
+        flushes = len(aggregator._flushes)
+        await aggregator.close()
+
+        self.assertEqual(flushes, 1)
+        self.assertEqual(redis.begin_transaction.call_count, 1)
+        self.assertEqual(aggregator.pending_count(), 0)
+
+    @patch('aioredis_models.redis_counter_aggregator.RedisString')
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_context_manager_flushes_on_exit(self, isinstance_mock, redis_string_init):
+        isinstance_mock.return_value = True
+        redis, _, _ = create_redis()
+
+        async with RedisCounterAggregator(redis, flush_interval_seconds=60) as aggregator:
+            aggregator.increment('some-key', 7)
+
+        redis_string_init.return_value.increment.assert_called_once_with(7)
+        self.assertEqual(aggregator.pending_count(), 0)
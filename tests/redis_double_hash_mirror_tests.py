@@ -0,0 +1,169 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, AsyncMock
+from aioredis.pubsub import Channel
+from aioredis_models.redis_double_hash import RedisDoubleHash
+from aioredis_models.redis_double_hash_mirror import RedisDoubleHashMirror
+
+
+def create_redis(sets=None, hashes=None):
+    sets = {} if sets is None else sets
+    hashes = {} if hashes is None else hashes
+    redis = MagicMock()
+    redis.db = 0
+    channels = []
+    async def psubscribe(*patterns):
+        channels.extend(Channel(pattern, True) for pattern in patterns)
+        return channels
+    async def execute(command, cursor, match, pattern, *args, **kwargs):
+        prefix = pattern[:-1]
+        return ['0', [key for key in sets if key.startswith(prefix)]]
+    async def smembers(key, encoding=None):
+        return list(sets.get(key, []))
+    redis.psubscribe = AsyncMock(side_effect=psubscribe)
+    redis.punsubscribe = AsyncMock(side_effect=lambda *_: [channel.close() for channel in channels])
+    redis.execute = AsyncMock(side_effect=execute)
+    redis.smembers = AsyncMock(side_effect=smembers)
+    redis.hgetall = AsyncMock(side_effect=lambda key, encoding=None: hashes.get(key, {}))
+    redis.hget = AsyncMock(side_effect=lambda key, field, encoding=None: hashes[key].get(field))
+    redis.channels = channels
+    return redis
+
+
+async def notify(channel, redis_key, event='sadd'):
+    channel.put_nowait((f'__keyspace@0__:{redis_key}'.encode('utf-8'), event.encode('utf-8')))
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+class RedisDoubleHashMirrorTests(unittest.IsolatedAsyncioTestCase):
+    def test_init_succeeds(self):
+        redis_double_hash_mirror = RedisDoubleHashMirror(RedisDoubleHash(MagicMock(), 'key', 'inv'))
+
+        self.assertIsInstance(redis_double_hash_mirror, RedisDoubleHashMirror)
+        self.assertFalse(redis_double_hash_mirror.is_started())
+
+    async def test_start_subscribes_and_loads_both_sides(self):
+        redis = create_redis({'key:a': ['x', 'y'], 'inv:x': ['a'], 'inv:y': ['a']})
+        redis_double_hash_mirror = RedisDoubleHashMirror(RedisDoubleHash(redis, 'key', 'inv'))
+
+        async with redis_double_hash_mirror:
+            redis.smembers.reset_mock()
+            values = await redis_double_hash_mirror.get('a')
+            fields = await redis_double_hash_mirror.get_inverted('y')
+            missing = await redis_double_hash_mirror.get('b')
+
+            self.assertTrue(redis_double_hash_mirror.is_started())
+            self.assertEqual(values, ['x', 'y'])
+            self.assertEqual(fields, ['a'])
+            self.assertEqual(missing, [])
+            redis.smembers.assert_not_awaited()
+            redis.psubscribe.assert_awaited_once_with('__keyspace@0__:key:*', '__keyspace@0__:inv:*')
+
+        self.assertFalse(redis_double_hash_mirror.is_started())
+        redis.punsubscribe.assert_awaited_once_with('__keyspace@0__:key:*', '__keyspace@0__:inv:*')
+
+    async def test_get_after_notification_reads_field_again(self):
+        sets = {'key:a': ['x']}
+        redis = create_redis(sets)
+        redis_double_hash_mirror = RedisDoubleHashMirror(
+            RedisDoubleHash(redis, 'key', 'inv'), mirror_inverted_fields=False
+        )
+        await redis_double_hash_mirror.start()
+
+        sets['key:a'] = ['x', 'z']
+        sets['key:b'] = ['w']
+        await notify(redis.channels[0], 'key:a')
+        await notify(redis.channels[0], 'key:b')
+        first = await redis_double_hash_mirror.get('a')
+        second = await redis_double_hash_mirror.get('b')
+        redis.smembers.reset_mock()
+        cached = await redis_double_hash_mirror.get('a')
+
+        self.assertEqual(first, ['x', 'z'])
+        self.assertEqual(second, ['w'])
+        self.assertEqual(cached, ['x', 'z'])
+        redis.smembers.assert_not_awaited()
+        await redis_double_hash_mirror.stop()
+
+    async def test_load_when_field_changes_while_reading_drops_field(self):
+        sets = {'key:a': ['x']}
+        redis = create_redis(sets)
+        async def smembers(key, encoding=None):
+            values = list(sets[key])
+            sets[key] = ['changed']
+            await notify(redis.channels[0], key)
+            return values
+        redis.smembers.side_effect = smembers
+        redis_double_hash_mirror = RedisDoubleHashMirror(
+            RedisDoubleHash(redis, 'key', 'inv'), mirror_inverted_fields=False
+        )
+        await redis_double_hash_mirror.start()
+
+        redis.smembers.side_effect = lambda key, encoding=None: list(sets[key])
+        result = await redis_double_hash_mirror.get('a')
+
+        self.assertEqual(result, ['changed'])
+        await redis_double_hash_mirror.stop()
+
+    async def test_get_when_subscription_ends_reads_from_redis(self):
+        redis = create_redis({'key:a': ['x']})
+        redis_double_hash_mirror = RedisDoubleHashMirror(
+            RedisDoubleHash(redis, 'key', 'inv'), mirror_inverted_fields=False
+        )
+        await redis_double_hash_mirror.start()
+
+        redis.channels[0].close()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        redis.smembers.reset_mock()
+        result = await redis_double_hash_mirror.get('a')
+
+        self.assertFalse(redis_double_hash_mirror.is_started())
+        self.assertEqual(result, ['x'])
+        redis.smembers.assert_awaited_once_with('key:a', encoding='utf-8')
+        await redis_double_hash_mirror.stop()
+
+    async def test_get_inverted_when_side_not_mirrored_reads_from_redis(self):
+        redis = create_redis({'key:a': ['x'], 'inv:x': ['a']})
+        redis_double_hash_mirror = RedisDoubleHashMirror(
+            RedisDoubleHash(redis, 'key', 'inv'), mirror_inverted_fields=False
+        )
+        await redis_double_hash_mirror.start()
+        redis.smembers.reset_mock()
+
+        result = await redis_double_hash_mirror.get_inverted('x')
+
+        self.assertEqual(result, ['a'])
+        redis.smembers.assert_awaited_once_with('inv:x', encoding='utf-8')
+        await redis_double_hash_mirror.stop()
+
+    async def test_start_with_compact_layout_resets_side_on_change(self):
+        hashes = {'key': {'a': '["x"]'}, 'inv': {'x': '["a"]'}}
+        redis = create_redis(hashes=hashes)
+        redis_double_hash_mirror = RedisDoubleHashMirror(
+            RedisDoubleHash(redis, 'key', 'inv', compact=True)
+        )
+        await redis_double_hash_mirror.start()
+
+        before = await redis_double_hash_mirror.get('a')
+        hashes['key']['a'] = '["x", "y"]'
+        await notify(redis.channels[0], 'key', 'hset')
+        after = await redis_double_hash_mirror.get('a')
+
+        self.assertEqual(before, ['x'])
+        self.assertEqual(after, ['x', 'y'])
+        redis.psubscribe.assert_awaited_once_with('__keyspace@0__:key', '__keyspace@0__:inv')
+        redis.hget.assert_awaited_once_with('key', 'a', encoding='utf-8')
+        await redis_double_hash_mirror.stop()
+
+    async def test_start_escapes_glob_characters_in_keys(self):
+        redis = create_redis()
+        redis_double_hash_mirror = RedisDoubleHashMirror(
+            RedisDoubleHash(redis, 'k*y', 'inv'), mirror_inverted_fields=False
+        )
+
+        await redis_double_hash_mirror.start()
+
+        redis.psubscribe.assert_awaited_once_with('__keyspace@0__:k\\*y:*')
+        await redis_double_hash_mirror.stop()
@@ -297,48 +297,286 @@ class RedisDoubleHashTests(unittest.IsolatedAsyncioTestCase):
             call(redis_set.remove.return_value) for redis_set in redis_sets[1:]
         ])
 
-    @staticmethod
-    @patch('aioredis_models.redis_double_hash.RedisKey')
+    async def test_delete_unlinks_both_sides_in_batches(self):
+        scans = {
+            'key:*': [['3', ['key:a', 'key:b']], ['0', ['key:c']]],
+            'inverse:*': [['0', ['inverse:x', 'inverse:y']]]
+        }
+        redis = MagicMock()
+        async def execute(command, cursor, match, pattern, *args, **kwargs):
+            return scans[pattern].pop(0)
+        redis.execute = AsyncMock(side_effect=execute)
+        redis.unlink = AsyncMock(side_effect=lambda *keys: len(keys))
+        on_progress = MagicMock()
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse')
+
+        result = await redis_double_hash.delete(batch_size=2, on_progress=on_progress)
+
+        self.assertEqual(result, 5)
+        redis.execute.assert_has_awaits([
+            call(b'SCAN', 0, b'MATCH', 'key:*', b'COUNT', 2, b'TYPE', 'set', encoding='utf-8'),
+            call(b'SCAN', 3, b'MATCH', 'key:*', b'COUNT', 2, b'TYPE', 'set', encoding='utf-8'),
+            call(b'SCAN', 0, b'MATCH', 'inverse:*', b'COUNT', 2, b'TYPE', 'set', encoding='utf-8')
+        ])
+        redis.unlink.assert_has_awaits([
+            call('key:a', 'key:b'), call('key:c', 'inverse:x'), call('inverse:y')
+        ])
+        on_progress.assert_has_calls([call(2), call(4), call(5)])
+
+    async def test_delete_with_no_keys_returns_zero(self):
+        redis = MagicMock()
+        redis.execute = AsyncMock(return_value=['0', []])
+        redis.unlink = AsyncMock()
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse')
+
+        result = await redis_double_hash.delete()
+
+        self.assertEqual(result, 0)
+        redis.unlink.assert_not_awaited()
+
+    @patch('aioredis_models.redis_double_hash.RedisSet')
     @patch('aioredis_models.redis_model.isinstance')
-    async def test_delete_deletes_both_sides(isinstance_mock, redis_key_init):
-        fields = [MagicMock() for _ in range(12)]
-        values = [MagicMock() for _ in range(19)]
+    async def test_set_many_groups_by_sub_key_in_bounded_transactions(
+        self, isinstance_mock, redis_set_init
+    ):
         redis = MagicMock()
-        connections = [MagicMock(), MagicMock()] + ([MagicMock()] * len(fields + values))
-        transaction_ctxs = [AsyncMock(), AsyncMock()]
-        transactions = [MagicMock(), MagicMock()]
-        for index in range(len(transactions)):
-            transaction_ctxs[index].__aenter__.return_value = transactions[index]
-            transactions[index].add_operation.side_effect = partial(assert_transaction, transaction_ctxs[index], MagicMock())
-        transactions[0].set_result_callback.side_effect = \
-            lambda callback: assert_transaction(transaction_ctxs[0], True) and callback(fields, values)
-        transactions[1].set_result_callback = None
-        for connection in connections[:2]:
-            connection.keys.side_effect = partial(assert_transaction, transaction_ctxs[0], connection.keys.return_value)
-        redis.get_connection.side_effect = connections
-        redis.begin_transaction.side_effect = transaction_ctxs
         isinstance_mock.return_value = True
-        redis_keys = [MagicMock() for _ in range(len(fields + values))]
-        for redis_key in redis_keys:
-            redis_key.delete = MagicMock()
-            redis_key.delete.side_effect = partial(assert_transaction, transaction_ctxs[1], redis_key.delete.return_value)
-        redis_key_init.side_effect = redis_keys
-        key = 'some-key'
-        inverse_key = 'some-inverse-key'
-        redis_double_hash = RedisDoubleHash(redis, key, inverse_key)
+        transaction_ctx = AsyncMock()
+        transaction = MagicMock()
+        transaction_ctx.__aenter__.return_value = transaction
+        redis.begin_transaction.return_value = transaction_ctx
+        redis_sets = {}
+        def create_redis_set(_, name):
+            return redis_sets.setdefault(name, MagicMock())
+        redis_set_init.side_effect = create_redis_set
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse')
+
+        await redis_double_hash.set_many(
+            [('foo', 'a'), ('foo', 'b'), ('bar', 'a'), ('baz', None), ('bar', 'c')],
+            batch_size=4
+        )
+
+        self.assertEqual(transaction_ctx.__aexit__.await_count, 2)
+        self.assertEqual(redis_sets['key:foo'].add.call_args_list, [call('a', 'b')])
+        self.assertEqual(redis_sets['key:bar'].add.call_args_list, [call('a'), call('c')])
+        redis_sets['inverse:a'].add.assert_called_once_with('foo', 'bar')
+        redis_sets['inverse:b'].add.assert_called_once_with('foo')
+        redis_sets['inverse:c'].add.assert_called_once_with('bar')
+        self.assertNotIn('key:baz', redis_sets)
+        self.assertEqual(len(transaction.add_operation.call_args_list), 6)
+
+    @patch('aioredis_models.redis_double_hash.RedisSet')
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_unset_many_removes_grouped_by_sub_key(self, isinstance_mock, redis_set_init):
+        redis = MagicMock()
+        isinstance_mock.return_value = True
+        transaction_ctx = AsyncMock()
+        transaction = MagicMock()
+        transaction_ctx.__aenter__.return_value = transaction
+        redis.begin_transaction.return_value = transaction_ctx
+        redis_sets = {}
+        def create_redis_set(_, name):
+            return redis_sets.setdefault(name, MagicMock())
+        redis_set_init.side_effect = create_redis_set
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse')
+
+        await redis_double_hash.unset_many(iter([('foo', 'a'), ('foo', 'b')]))
+
+        transaction_ctx.__aexit__.assert_awaited_once()
+        redis_sets['key:foo'].remove.assert_called_once_with('a', 'b')
+        redis_sets['inverse:a'].remove.assert_called_once_with('foo')
+        redis_sets['inverse:b'].remove.assert_called_once_with('foo')
+        transaction.add_operation.assert_has_calls([
+            call(redis_sets['key:foo'].remove.return_value),
+            call(redis_sets['inverse:a'].remove.return_value),
+            call(redis_sets['inverse:b'].remove.return_value)
+        ])
+
+    async def test_set_many_with_no_values_does_nothing(self):
+        redis = MagicMock()
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse')
+
+        await redis_double_hash.set_many([('foo', None)])
+
+        redis.multi_exec.assert_not_called()
+
+    async def test_fields_with_compact_layout_gets_hash_fields(self):
+        redis = AsyncMock()
+        redis.hkeys.return_value = ['foo', 'bar']
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse', compact=True)
+
+        result = await redis_double_hash.fields()
+        result_inverted = await redis_double_hash.fields_inverted()
+
+        self.assertEqual(result, {'foo', 'bar'})
+        self.assertEqual(result_inverted, {'foo', 'bar'})
+        redis.hkeys.assert_has_awaits([
+            call('key', encoding='utf-8'), call('inverse', encoding='utf-8')
+        ])
+
+    async def test_get_with_compact_layout_unpacks_values(self):
+        redis = AsyncMock()
+        redis.hget.return_value = '["a","b"]'
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse', compact=True)
+
+        result = await redis_double_hash.get('foo')
+
+        self.assertEqual(result, ['a', 'b'])
+        redis.hget.assert_awaited_once_with('key', 'foo', encoding='utf-8')
+
+    async def test_get_inverted_with_compact_layout_and_missing_field_returns_empty_list(self):
+        redis = AsyncMock()
+        redis.hget.return_value = None
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse', compact=True)
+
+        result = await redis_double_hash.get_inverted('foo')
+
+        self.assertEqual(result, [])
+        redis.hget.assert_awaited_once_with('inverse', 'foo', encoding='utf-8')
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_set_with_compact_layout_adds_with_scripts(self, isinstance_mock):
+        redis = MagicMock()
+        isinstance_mock.return_value = True
+        transaction_ctx = AsyncMock()
+        transaction = MagicMock()
+        transaction_ctx.__aenter__.return_value = transaction
+        redis.begin_transaction.return_value = transaction_ctx
+        connection = redis.get_connection.return_value
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse', compact=True)
 
-        await redis_double_hash.delete()
-
-        connections[0].keys.assert_called_once_with(key + ':*', encoding='utf-8')
-        connections[1].keys.assert_called_once_with(inverse_key + ':*', encoding='utf-8')
-        redis_key_init.assert_has_calls([
-            call(connections[2], key) for key in fields + values
-        ], any_order=True)
-        for redis_key in redis_keys:
-            redis_key.delete.assert_called_once_with()
-        transactions[0].add_operation.assert_called_once_with(*(
-            connection.keys.return_value for connection in connections[:2]
-        ))
-        transactions[1].add_operation.assert_called_once_with(*(
-            redis_keys[index].delete.return_value for index in range(len(redis_keys))
-        ))
+        await redis_double_hash.set('foo', 'a')
+
+        connection.eval.assert_has_calls([
+            call(RedisDoubleHash._ADD_SCRIPT, keys=['key'], args=['foo', 'a']),
+            call(RedisDoubleHash._ADD_SCRIPT, keys=['inverse'], args=['a', 'foo'])
+        ])
+        transaction.add_operation.assert_called_once_with(
+            connection.eval.return_value, connection.eval.return_value
+        )
+        transaction_ctx.__aexit__.assert_awaited_once()
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_unset_many_with_compact_layout_removes_with_scripts(self, isinstance_mock):
+        redis = MagicMock()
+        isinstance_mock.return_value = True
+        transaction_ctx = AsyncMock()
+        transaction_ctx.__aenter__.return_value = MagicMock()
+        redis.begin_transaction.return_value = transaction_ctx
+        connection = redis.get_connection.return_value
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse', compact=True)
+
+        await redis_double_hash.unset_many([('foo', 'a'), ('foo', 'b')])
+
+        connection.eval.assert_has_calls([
+            call(RedisDoubleHash._REMOVE_SCRIPT, keys=['key'], args=['foo', 'a', 'b']),
+            call(RedisDoubleHash._REMOVE_SCRIPT, keys=['inverse'], args=['a', 'foo']),
+            call(RedisDoubleHash._REMOVE_SCRIPT, keys=['inverse'], args=['b', 'foo'])
+        ])
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_remove_with_compact_layout_removes_field_from_both_sides(
+        self, isinstance_mock
+    ):
+        redis = MagicMock()
+        isinstance_mock.return_value = True
+        transaction_ctx = AsyncMock()
+        transaction = MagicMock()
+        transaction_ctx.__aenter__.return_value = transaction
+        redis.begin_transaction.return_value = transaction_ctx
+        connection = redis.get_connection.return_value
+        connection.hget = AsyncMock(return_value='["a","b"]')
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse', compact=True)
+
+        await redis_double_hash.remove('foo')
+
+        connection.hget.assert_awaited_once_with('key', 'foo', encoding='utf-8')
+        connection.hdel.assert_called_once_with('key', 'foo')
+        connection.eval.assert_has_calls([
+            call(RedisDoubleHash._REMOVE_SCRIPT, keys=['inverse'], args=['a', 'foo']),
+            call(RedisDoubleHash._REMOVE_SCRIPT, keys=['inverse'], args=['b', 'foo'])
+        ])
+        self.assertEqual(transaction.add_operation.call_count, 3)
+
+    async def test_delete_with_compact_layout_unlinks_both_hashes(self):
+        redis = AsyncMock()
+        redis.unlink.return_value = 2
+        on_progress = MagicMock()
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse', compact=True)
+
+        result = await redis_double_hash.delete(on_progress=on_progress)
+
+        self.assertEqual(result, 2)
+        redis.unlink.assert_awaited_once_with('key', 'inverse')
+        on_progress.assert_called_once_with(2)
+
+    @patch('aioredis_models.redis_double_hash.RedisSet')
+    async def test_get_all_of_intersects_sets_of_fields(self, redis_set_init):
+        redis_set = redis_set_init.return_value
+        redis_set.intersection = AsyncMock(return_value=['x'])
+        redis = MagicMock()
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse')
+
+        result = await redis_double_hash.get_all_of(['a', 'b', 'a'])
+
+        self.assertEqual(result, ['x'])
+        redis_set_init.assert_called_once_with(redis_double_hash._redis, 'key:a')
+        redis_set.intersection.assert_awaited_once_with('key:b')
+
+    @patch('aioredis_models.redis_double_hash.RedisSet')
+    async def test_get_inverted_any_of_unions_sets_of_inverted_fields(self, redis_set_init):
+        redis_set = redis_set_init.return_value
+        redis_set.union = AsyncMock(return_value=['a', 'b'])
+        redis = MagicMock()
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse')
+
+        result = await redis_double_hash.get_inverted_any_of(['x', 'y', 'z'])
+
+        self.assertEqual(result, ['a', 'b'])
+        redis_set_init.assert_called_once_with(redis_double_hash._redis, 'inverse:x')
+        redis_set.union.assert_awaited_once_with('inverse:y', 'inverse:z')
+
+    async def test_get_any_of_with_no_fields_returns_empty_list(self):
+        redis = MagicMock()
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse')
+
+        result = await redis_double_hash.get_any_of([])
+
+        self.assertEqual(result, [])
+        redis.execute.assert_not_called()
+
+    async def test_count_counts_on_server(self):
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=3)
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse')
+
+        result = await redis_double_hash.count(['x', 'y'], match_all=False, inverted=True)
+
+        self.assertEqual(result, 3)
+        redis.eval.assert_awaited_once_with(
+            RedisDoubleHash._COUNT_SCRIPT, keys=['inverse:x', 'inverse:y'], args=[0]
+        )
+
+    async def test_get_inverted_all_of_with_compact_layout_runs_script(self):
+        redis = MagicMock()
+        redis.execute = AsyncMock(return_value=['a'])
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse', compact=True)
+
+        result = await redis_double_hash.get_inverted_all_of(['x', 'y'])
+
+        self.assertEqual(result, ['a'])
+        redis.execute.assert_awaited_once_with(
+            b'EVAL', RedisDoubleHash._QUERY_SCRIPT, 1, 'inverse', 1, 0, 'x', 'y', encoding='utf-8'
+        )
+
+    async def test_count_with_compact_layout_runs_script(self):
+        redis = MagicMock()
+        redis.execute = AsyncMock(return_value=2)
+        redis_double_hash = RedisDoubleHash(redis, 'key', 'inverse', compact=True)
+
+        result = await redis_double_hash.count(['a'])
+
+        self.assertEqual(result, 2)
+        redis.execute.assert_awaited_once_with(
+            b'EVAL', RedisDoubleHash._QUERY_SCRIPT, 1, 'key', 1, 1, 'a', encoding='utf-8'
+        )
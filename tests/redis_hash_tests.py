@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import MagicMock, AsyncMock, call
+from unittest.mock import MagicMock, AsyncMock, call, patch
 from aioredis_models.redis_hash import RedisHash
 
 
@@ -248,3 +248,129 @@ class RedisHashTests(unittest.IsolatedAsyncioTestCase):
 
         redis.hdel.assert_called_once_with(key, field)
         self.assertEqual(result, redis.hdel.return_value)
+
+    def test_increment_with_int_uses_hincrby(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_hash = RedisHash(redis, key)
+        field = MagicMock()
+
+        result = redis_hash.increment(field, 3)
+
+        redis.hincrby.assert_called_once_with(key, field, 3)
+        redis.hincrbyfloat.assert_not_called()
+        self.assertEqual(result, redis.hincrby.return_value)
+
+    def test_increment_with_float_uses_hincrbyfloat(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_hash = RedisHash(redis, key)
+        field = MagicMock()
+
+        result = redis_hash.increment(field, 1.5)
+
+        redis.hincrbyfloat.assert_called_once_with(key, field, 1.5)
+        redis.hincrby.assert_not_called()
+        self.assertEqual(result, redis.hincrbyfloat.return_value)
+
+    def test_increment_uses_correct_defaults(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_hash = RedisHash(redis, key)
+        field = MagicMock()
+
+        result = redis_hash.increment(field)
+
+        redis.hincrby.assert_called_once_with(key, field, 1)
+        self.assertEqual(result, redis.hincrby.return_value)
+
+    def test_get_many_gets_many(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_hash = RedisHash(redis, key)
+        fields = [MagicMock() for _ in range(3)]
+        encoding = MagicMock()
+
+        result = redis_hash.get_many(*fields, encoding=encoding)
+
+        redis.hmget.assert_called_once_with(key, *fields, encoding=encoding)
+        self.assertEqual(result, redis.hmget.return_value)
+
+    async def test_get_many_with_no_fields_returns_empty_list(self):
+        redis = MagicMock()
+        redis.hmget = None
+        redis_hash = RedisHash(redis, MagicMock())
+
+        result = await redis_hash.get_many()
+
+        self.assertEqual(result, [])
+
+    def test_remove_with_many_fields_removes_fields(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_hash = RedisHash(redis, key)
+        fields = [MagicMock() for _ in range(3)]
+
+        result = redis_hash.remove(*fields)
+
+        redis.hdel.assert_called_once_with(key, *fields)
+        self.assertEqual(result, redis.hdel.return_value)
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_sync_writes_only_changes(self, isinstance_mock):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        connection = redis.get_connection.return_value
+        transaction_ctx = AsyncMock()
+        transaction = MagicMock()
+        transaction_ctx.__aenter__.return_value = transaction
+        redis.begin_transaction.return_value = transaction_ctx
+        key = MagicMock()
+        redis_hash = RedisHash(redis, key)
+        snapshot = {'same': '1', 'changed': '2', 'removed': '3'}
+        values = {'same': '1', 'changed': '4', 'added': '5'}
+
+        result = await redis_hash.sync(values, snapshot)
+
+        connection.hmset_dict.assert_called_once_with(key, {'changed': '4', 'added': '5'})
+        connection.hdel.assert_called_once_with(key, 'removed')
+        transaction.add_operation.assert_has_calls([
+            call(connection.hmset_dict.return_value),
+            call(connection.hdel.return_value)
+        ])
+        transaction_ctx.__aexit__.assert_awaited_once()
+        self.assertEqual(result, values)
+        self.assertIsNot(result, values)
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_sync_without_changes_does_nothing(self, isinstance_mock):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        redis.begin_transaction = None
+        redis_hash = RedisHash(redis, MagicMock())
+        values = {'foo': 'bar'}
+
+        result = await redis_hash.sync(values, {'foo': 'bar'})
+
+        self.assertEqual(result, values)
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_sync_without_snapshot_reads_hash(self, isinstance_mock):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        connection = redis.get_connection.return_value
+        connection.hgetall = AsyncMock(return_value={'foo': 'bar', 'baz': 'bat'})
+        transaction_ctx = AsyncMock()
+        transaction = MagicMock()
+        transaction_ctx.__aenter__.return_value = transaction
+        redis.begin_transaction.return_value = transaction_ctx
+        key = MagicMock()
+        encoding = MagicMock()
+        redis_hash = RedisHash(redis, key)
+
+        await redis_hash.sync({'foo': 'bar'}, encoding=encoding)
+
+        connection.hgetall.assert_awaited_once_with(key, encoding=encoding)
+        connection.hmset_dict.assert_not_called()
+        connection.hdel.assert_called_once_with(key, 'baz')
+        transaction.add_operation.assert_called_once_with(connection.hdel.return_value)
@@ -1,6 +1,10 @@
 import unittest
-from unittest.mock import MagicMock, AsyncMock
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, AsyncMock, call, patch
+from aioredis.commands import Redis
+from aioredis_models.redis_client import RedisClient
 from aioredis_models.redis_key import RedisKey
+from aioredis_models.redis_string import RedisString
 
 
 class RedisKeyTests(unittest.IsolatedAsyncioTestCase):
@@ -40,3 +44,268 @@ class RedisKeyTests(unittest.IsolatedAsyncioTestCase):
 
         redis.exists.assert_awaited_once_with(key)
         self.assertFalse(result)
+
+    def test_key_returns_key(self):
+        key = MagicMock()
+        redis_key = RedisKey(MagicMock(), key)
+
+        self.assertEqual(redis_key.key, key)
+
+    def test_expire_sets_timeout_in_milliseconds(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_key = RedisKey(redis, key)
+
+        result = redis_key.expire(1.5)
+
+        redis.pexpire.assert_called_once_with(key, 1500)
+        self.assertEqual(result, redis.pexpire.return_value)
+
+    def test_expire_at_with_timestamp_sets_time_in_milliseconds(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_key = RedisKey(redis, key)
+
+        result = redis_key.expire_at(1600000000.25)
+
+        redis.pexpireat.assert_called_once_with(key, 1600000000250)
+        self.assertEqual(result, redis.pexpireat.return_value)
+
+    def test_expire_at_with_datetime_sets_time_in_milliseconds(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_key = RedisKey(redis, key)
+
+        redis_key.expire_at(datetime(2020, 9, 13, 12, 26, 40, 250000, tzinfo=timezone.utc))
+
+        redis.pexpireat.assert_called_once_with(key, 1600000000250)
+
+    def test_persist_removes_timeout(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_key = RedisKey(redis, key)
+
+        result = redis_key.persist()
+
+        redis.persist.assert_called_once_with(key)
+        self.assertEqual(result, redis.persist.return_value)
+
+    async def test_ttl_returns_seconds(self):
+        redis = AsyncMock()
+        redis.pttl.return_value = 1500
+        key = MagicMock()
+        redis_key = RedisKey(redis, key)
+
+        result = await redis_key.ttl()
+
+        redis.pttl.assert_awaited_once_with(key)
+        self.assertEqual(result, 1.5)
+
+    async def test_ttl_without_timeout_returns_none(self):
+        for milliseconds in (-1, -2):
+            redis = AsyncMock()
+            redis.pttl.return_value = milliseconds
+            redis_key = RedisKey(redis, MagicMock())
+
+            result = await redis_key.ttl()
+
+            self.assertIsNone(result)
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_expire_many_sets_timeouts_in_transaction(self, mock_isinstance):
+        mock_isinstance.return_value = True
+        redis = MagicMock()
+        redis.pexpire = AsyncMock(return_value=True)
+        redis.persist = AsyncMock(return_value=False)
+        redis.get_connection.return_value = redis
+        transaction_ctx = AsyncMock()
+        transaction = MagicMock()
+        transaction_ctx.__aenter__.return_value = transaction
+        redis.begin_transaction.return_value = transaction_ctx
+        keys = [RedisKey(redis, 'key1'), RedisKey(redis, 'key2'), RedisKey(redis, 'key3')]
+
+        result = await RedisKey.expire_many(keys, {'key1': 1.5, 'key2': None})
+
+        self.assertEqual(result, [True, False, False])
+        redis.pexpire.assert_called_once_with('key1', 1500)
+        redis.persist.assert_called_once_with('key2')
+        self.assertEqual(len(transaction.add_operation.call_args.args), 2)
+        transaction_ctx.__aexit__.assert_awaited_once()
+
+    async def test_expire_many_with_no_listed_keys_leaves_keys_untouched(self):
+        redis = MagicMock()
+        keys = [RedisKey(redis, 'key1'), RedisKey(redis, 'key2')]
+
+        result = await RedisKey.expire_many(keys, {'other': 10})
+
+        self.assertEqual(result, [False, False])
+        redis.begin_transaction.assert_not_called()
+        redis.pexpire.assert_not_called()
+        redis.persist.assert_not_called()
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_expire_many_with_single_timeout_sets_all(self, mock_isinstance):
+        mock_isinstance.return_value = True
+        redis = MagicMock()
+        redis.pexpire = AsyncMock(return_value=True)
+        redis.get_connection.return_value = redis
+        transaction_ctx = AsyncMock()
+        transaction_ctx.__aenter__.return_value = MagicMock()
+        redis.begin_transaction.return_value = transaction_ctx
+        keys = [RedisKey(redis, 'key1'), RedisKey(redis, 'key2')]
+
+        result = await RedisKey.expire_many(keys, 10)
+
+        self.assertEqual(result, [True, True])
+        redis.pexpire.assert_has_calls([call('key1', 10000), call('key2', 10000)])
+
+    async def test_expire_many_with_no_keys_returns_empty_list(self):
+        result = await RedisKey.expire_many([], 10)
+
+        self.assertEqual(result, [])
+
+    def test_unlink_unlinks(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_key = RedisKey(redis, key)
+
+        result = redis_key.unlink()
+
+        redis.unlink.assert_called_once_with(key)
+        self.assertEqual(result, redis.unlink.return_value)
+
+    async def test_unlink_many_unlinks_in_batches(self):
+        redis = MagicMock()
+        redis.unlink = AsyncMock(side_effect=[2, 1])
+        keys = [RedisKey(redis, 'key1'), RedisKey(redis, 'key2'), RedisKey(redis, 'key3')]
+
+        result = await RedisKey.unlink_many(keys, batch_size=2)
+
+        self.assertEqual(result, 3)
+        redis.unlink.assert_has_awaits([call('key1', 'key2'), call('key3')])
+
+    async def test_unlink_many_with_no_keys_does_nothing(self):
+        result = await RedisKey.unlink_many([])
+
+        self.assertEqual(result, 0)
+
+    async def test_delete_incrementally_with_hash_removes_fields_in_batches(self):
+        redis = AsyncMock()
+        redis.execute.return_value = 'hash'
+        redis.hscan.side_effect = [(5, [(b'a', b'1'), (b'b', b'2')]), (0, [(b'c', b'3')])]
+        key = MagicMock()
+        redis_key = RedisKey(redis, key)
+
+        await redis_key.delete_incrementally(batch_size=2)
+
+        redis.execute.assert_awaited_once_with(b'TYPE', key, encoding='utf-8')
+        redis.hscan.assert_has_awaits([call(key, 0, count=2), call(key, 5, count=2)])
+        redis.hdel.assert_has_awaits([call(key, b'a', b'b'), call(key, b'c')])
+        redis.delete.assert_awaited_once_with(key)
+
+    async def test_delete_incrementally_with_set_pops_members_in_batches(self):
+        redis = AsyncMock()
+        redis.execute.return_value = 'set'
+        redis.spop.side_effect = [[b'a', b'b'], [b'c'], []]
+        key = MagicMock()
+        redis_key = RedisKey(redis, key)
+
+        await redis_key.delete_incrementally(batch_size=2)
+
+        redis.spop.assert_has_awaits([call(key, count=2)] * 3)
+        redis.delete.assert_awaited_once_with(key)
+
+    async def test_delete_incrementally_with_sorted_set_removes_ranks_in_batches(self):
+        redis = AsyncMock()
+        redis.execute.return_value = 'zset'
+        redis.zremrangebyrank.side_effect = [2, 0]
+        key = MagicMock()
+        redis_key = RedisKey(redis, key)
+
+        await redis_key.delete_incrementally(batch_size=2)
+
+        redis.zremrangebyrank.assert_has_awaits([call(key, 0, 1)] * 2)
+        redis.delete.assert_awaited_once_with(key)
+
+    async def test_delete_incrementally_with_list_trims_in_batches(self):
+        redis = AsyncMock()
+        redis.execute.return_value = 'list'
+        redis.llen.side_effect = [3, 1, 0]
+        key = MagicMock()
+        redis_key = RedisKey(redis, key)
+
+        await redis_key.delete_incrementally(batch_size=2)
+
+        redis.ltrim.assert_has_awaits([call(key, 0, -3)] * 2)
+        redis.delete.assert_awaited_once_with(key)
+
+    async def test_delete_incrementally_with_string_deletes(self):
+        redis = AsyncMock()
+        redis.execute.return_value = 'string'
+        key = MagicMock()
+        redis_key = RedisKey(redis, key)
+
+        await redis_key.delete_incrementally()
+
+        redis.delete.assert_awaited_once_with(key)
+
+    def test_copy_to_copies(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_key = RedisKey(redis, key)
+
+        result = redis_key.copy_to('destination')
+
+        redis.execute.assert_called_once_with(b'COPY', key, 'destination')
+        self.assertEqual(result, redis.execute.return_value)
+
+    def test_copy_to_with_replace_replaces(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_key = RedisKey(redis, key)
+
+        redis_key.copy_to('destination', replace=True)
+
+        redis.execute.assert_called_once_with(b'COPY', key, 'destination', b'REPLACE')
+
+    async def test_copy_to_in_transaction_queues_command(self):
+        client = RedisClient(Redis(MagicMock()))
+        redis_key = RedisKey(client, 'source')
+        client.begin_transaction()
+
+        result = redis_key.copy_to('destination')
+
+        self.assertEqual(len(client.get_connection()._pipeline), 1)
+        self.assertFalse(result.done())
+        client.discard_transaction()
+
+    async def test_rebuild_swaps_in_staging_key(self):
+        redis = AsyncMock()
+        redis_key = RedisKey(redis, 'live')
+
+        async with redis_key.rebuild() as staging:
+            self.assertIsInstance(staging, RedisKey)
+            self.assertTrue(staging.key.startswith('live:rebuild:'))
+            self.assertEqual(redis_key.key, 'live')
+
+        keys = redis.eval.await_args.kwargs['keys']
+        self.assertEqual(keys[:2], [staging.key, 'live'])
+        self.assertTrue(keys[2].startswith('live:old:'))
+        redis.unlink.assert_awaited_once_with(keys[2])
+
+    async def test_rebuild_keeps_model_type(self):
+        redis_string = RedisString(AsyncMock(), 'live')
+
+        async with redis_string.rebuild() as staging:
+            self.assertIsInstance(staging, RedisString)
+
+    async def test_rebuild_when_failed_deletes_staging_key(self):
+        redis = AsyncMock()
+        redis_key = RedisKey(redis, 'live')
+
+        with self.assertRaises(ValueError):
+            async with redis_key.rebuild() as staging:
+                raise ValueError()
+
+        redis.unlink.assert_awaited_once_with(staging.key)
+        redis.eval.assert_not_awaited()
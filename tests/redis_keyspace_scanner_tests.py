@@ -0,0 +1,113 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, AsyncMock, call, patch
+from aioredis_models.redis_keyspace_scanner import RedisKeyspaceScanner
+from aioredis_models.redis_hash import RedisHash
+from aioredis_models.redis_key import RedisKey
+from aioredis_models.redis_list import RedisList
+from aioredis_models.redis_set import RedisSet
+from aioredis_models.redis_string import RedisString
+
+
+def create_redis(scans, types=None):
+    redis = MagicMock()
+    async def execute(command, *args, **kwargs):
+        if command == b'SCAN':
+            return scans.pop(0)
+        return types[args[0]]
+    redis.execute = AsyncMock(side_effect=execute)
+    return redis
+
+
+class RedisKeyspaceScannerTests(unittest.IsolatedAsyncioTestCase):
+    def test_init_succeeds(self):
+        redis_keyspace_scanner = RedisKeyspaceScanner(MagicMock())
+
+        self.assertIsInstance(redis_keyspace_scanner, RedisKeyspaceScanner)
+        self.assertEqual(redis_keyspace_scanner.cursor, 0)
+
+    async def test_scan_with_key_type_filters_on_server(self):
+        redis = create_redis([['5', ['foo', 'bar']], ['0', ['baz']]])
+        redis_keyspace_scanner = RedisKeyspaceScanner(redis, batch_size=100)
+
+        result = [key async for key in redis_keyspace_scanner.scan('ba*', key_type='hash')]
+
+        self.assertEqual([key.key for key in result], ['foo', 'bar', 'baz'])
+        self.assertTrue(all(isinstance(key, RedisHash) for key in result))
+        redis.execute.assert_has_awaits([
+            call(b'SCAN', 0, b'MATCH', 'ba*', b'COUNT', 100, b'TYPE', 'hash', encoding='utf-8'),
+            call(b'SCAN', 5, b'MATCH', 'ba*', b'COUNT', 100, b'TYPE', 'hash', encoding='utf-8')
+        ])
+        self.assertIsNone(redis_keyspace_scanner.cursor)
+
+    async def test_scan_without_key_type_returns_typed_models(self):
+        redis = create_redis(
+            [['0', ['h', 'l', 's', 'str', 'z', 'gone']]],
+            {'h': 'hash', 'l': 'list', 's': 'set', 'str': 'string', 'z': 'zset', 'gone': 'none'}
+        )
+        redis_keyspace_scanner = RedisKeyspaceScanner(redis)
+
+        result = [key async for key in redis_keyspace_scanner.scan()]
+
+        self.assertEqual(
+            [(type(key), key.key) for key in result],
+            [
+                (RedisHash, 'h'), (RedisList, 'l'), (RedisSet, 's'), (RedisString, 'str'),
+                (RedisKey, 'z')
+            ]
+        )
+        redis.execute.assert_any_await(b'SCAN', 0, encoding='utf-8')
+        redis.execute.assert_any_await(b'TYPE', 'h', encoding='utf-8')
+
+    async def test_scan_with_cursor_resumes(self):
+        redis = create_redis([['0', ['foo']]])
+        redis_keyspace_scanner = RedisKeyspaceScanner(redis)
+
+        result = [key.key async for key in redis_keyspace_scanner.scan(key_type='set', cursor=42)]
+
+        self.assertEqual(result, ['foo'])
+        redis.execute.assert_awaited_once_with(b'SCAN', 42, b'TYPE', 'set', encoding='utf-8')
+
+    async def test_scan_when_interrupted_keeps_cursor_of_current_batch(self):
+        redis = create_redis([['5', ['foo', 'bar']], ['7', ['baz']]])
+        redis_keyspace_scanner = RedisKeyspaceScanner(redis)
+
+        async for key in redis_keyspace_scanner.scan(key_type='set'):
+            if key.key == 'baz':
+                break
+
+        self.assertEqual(redis_keyspace_scanner.cursor, 5)
+
+    @patch('aioredis_models.redis_keyspace_scanner.sleep')
+    @patch('aioredis_models.redis_keyspace_scanner.monotonic')
+    async def test_scan_with_max_scans_per_second_throttles(self, monotonic_mock, sleep_mock):
+        monotonic_mock.return_value = 100
+        redis = create_redis([['5', []], ['0', []]])
+        redis_keyspace_scanner = RedisKeyspaceScanner(redis, max_scans_per_second=4)
+
+        result = [key async for key in redis_keyspace_scanner.scan(key_type='set')]
+
+        self.assertEqual(result, [])
+        sleep_mock.assert_awaited_once_with(0.25)
+
+    async def test_scan_limits_concurrent_type_lookups(self):
+        in_flight = 0
+        max_in_flight = 0
+        redis = MagicMock()
+        async def execute(command, *args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            if command == b'SCAN':
+                return ['0', [str(index) for index in range(10)]]
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return 'string'
+        redis.execute = AsyncMock(side_effect=execute)
+        redis_keyspace_scanner = RedisKeyspaceScanner(redis, max_concurrency=3)
+
+        result = [key async for key in redis_keyspace_scanner.scan()]
+
+        self.assertEqual(len(result), 10)
+        self.assertEqual(max_in_flight, 3)
+
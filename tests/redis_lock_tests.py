@@ -0,0 +1,178 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, AsyncMock, ANY, patch
+from aioredis_models.redis_lock import RedisLock
+
+
+class RedisLockTests(unittest.IsolatedAsyncioTestCase):
+    def test_init_succeeds(self):
+        redis_lock = RedisLock(MagicMock(), MagicMock())
+
+        self.assertIsInstance(redis_lock, RedisLock)
+
+    async def test_acquire_when_free_acquires_with_fencing_token(self):
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=7)
+        key = 'some-key'
+        redis_lock = RedisLock(redis, key, lease_seconds=1.5)
+
+        result = await redis_lock.acquire()
+
+        self.assertTrue(result)
+        self.assertEqual(redis_lock.fencing_token, 7)
+        redis.eval.assert_awaited_once_with(
+            RedisLock._ACQUIRE_SCRIPT,
+            keys=[key, f'{key}:fence'],
+            args=[ANY, 1500]
+        )
+
+    async def test_acquire_when_held_without_blocking_returns_false(self):
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=0)
+        redis.pttl = None
+        redis_lock = RedisLock(redis, 'some-key')
+
+        result = await redis_lock.acquire(blocking=False)
+
+        self.assertFalse(result)
+        self.assertIsNone(redis_lock.fencing_token)
+
+    @patch('aioredis_models.redis_lock.RedisList')
+    async def test_acquire_when_held_waits_for_release(self, redis_list_init):
+        redis = MagicMock()
+        redis.eval = AsyncMock(side_effect=[0, 3])
+        redis.pttl = AsyncMock(return_value=2500)
+        redis_list_init.return_value.pop = AsyncMock()
+        key = 'some-key'
+        redis_lock = RedisLock(redis, key)
+
+        result = await redis_lock.acquire()
+
+        self.assertTrue(result)
+        redis.pttl.assert_awaited_once_with(key)
+        redis_list_init.assert_called_once_with(redis_lock._redis, f'{key}:signal')
+        redis_list_init.return_value.pop.assert_awaited_once_with(block=True, timeout_seconds=3)
+
+    @patch('aioredis_models.redis_lock.RedisList')
+    async def test_acquire_when_held_without_lease_waits_for_lease(self, redis_list_init):
+        redis = MagicMock()
+        redis.eval = AsyncMock(side_effect=[0, 3])
+        redis.pttl = AsyncMock(return_value=-1)
+        redis_list_init.return_value.pop = AsyncMock()
+        redis_lock = RedisLock(redis, 'some-key', lease_seconds=5)
+
+        result = await redis_lock.acquire()
+
+        self.assertTrue(result)
+        redis_list_init.return_value.pop.assert_awaited_once_with(block=True, timeout_seconds=5)
+
+    @patch('aioredis_models.redis_lock.RedisList')
+    async def test_acquire_with_timeout_gives_up(self, redis_list_init):
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=0)
+        redis.pttl = AsyncMock(return_value=10000)
+        async def pop(**_):
+            await asyncio.sleep(0.01)
+        redis_list_init.return_value.pop = AsyncMock(side_effect=pop)
+        redis_lock = RedisLock(redis, 'some-key')
+
+        result = await redis_lock.acquire(timeout_seconds=0.005)
+
+        self.assertFalse(result)
+        redis_list_init.return_value.pop.assert_awaited_once_with(block=True, timeout_seconds=1)
+
+    async def test_release_when_held_releases(self):
+        redis = MagicMock()
+        redis.eval = AsyncMock(side_effect=[5, 1])
+        key = 'some-key'
+        redis_lock = RedisLock(redis, key, lease_seconds=2)
+        await redis_lock.acquire()
+        token = redis.eval.await_args.kwargs['args'][0]
+
+        result = await redis_lock.release()
+
+        self.assertTrue(result)
+        self.assertIsNone(redis_lock.fencing_token)
+        redis.eval.assert_awaited_with(
+            RedisLock._RELEASE_SCRIPT,
+            keys=[key, f'{key}:signal'],
+            args=[token, 2000]
+        )
+
+    async def test_release_when_not_acquired_returns_false(self):
+        redis = MagicMock()
+        redis.eval = None
+        redis_lock = RedisLock(redis, 'some-key')
+
+        result = await redis_lock.release()
+
+        self.assertFalse(result)
+
+    async def test_extend_when_held_extends(self):
+        redis = MagicMock()
+        redis.eval = AsyncMock(side_effect=[5, 1])
+        key = 'some-key'
+        redis_lock = RedisLock(redis, key)
+        await redis_lock.acquire()
+        token = redis.eval.await_args.kwargs['args'][0]
+
+        result = await redis_lock.extend(30)
+
+        self.assertTrue(result)
+        redis.eval.assert_awaited_with(
+            RedisLock._EXTEND_SCRIPT,
+            keys=[key],
+            args=[token, 30000]
+        )
+
+    async def test_extend_when_not_acquired_returns_false(self):
+        redis = MagicMock()
+        redis.eval = None
+        redis_lock = RedisLock(redis, 'some-key')
+
+        result = await redis_lock.extend()
+
+        self.assertFalse(result)
+
+    async def test_auto_renew_extends_until_released(self):
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=1)
+        redis_lock = RedisLock(redis, 'some-key', lease_seconds=0.03, auto_renew=True)
+
+        async with redis_lock:
+            await asyncio.sleep(0.035)
+
+        scripts = [call.args[0] for call in redis.eval.await_args_list]
+        self.assertEqual(scripts[0], RedisLock._ACQUIRE_SCRIPT)
+        self.assertGreaterEqual(scripts.count(RedisLock._EXTEND_SCRIPT), 2)
+        self.assertEqual(scripts[-1], RedisLock._RELEASE_SCRIPT)
+
+    async def test_auto_renew_when_renewal_fails_marks_lost_and_releases(self):
+        redis = MagicMock()
+        async def eval_script(script, **_):
+            if script == RedisLock._EXTEND_SCRIPT:
+                raise ConnectionError('boom')
+            return 1
+        redis.eval = AsyncMock(side_effect=eval_script)
+        redis_lock = RedisLock(redis, 'some-key', lease_seconds=0.03, auto_renew=True)
+
+        await redis_lock.acquire()
+        await asyncio.sleep(0.02)
+        lost = redis_lock.lost
+        result = await redis_lock.release()
+
+        self.assertTrue(lost)
+        self.assertTrue(result)
+        self.assertEqual(redis.eval.await_args_list[-1].args[0], RedisLock._RELEASE_SCRIPT)
+        self.assertIsNone(redis_lock._token)
+
+    async def test_auto_renew_when_lock_expired_marks_lost(self):
+        redis = MagicMock()
+        redis.eval = AsyncMock(side_effect=[1, 0, 0])
+        redis_lock = RedisLock(redis, 'some-key', lease_seconds=0.03, auto_renew=True)
+
+        await redis_lock.acquire()
+        await asyncio.sleep(0.02)
+
+        self.assertTrue(redis_lock.lost)
+        self.assertFalse(await redis_lock.release())
@@ -0,0 +1,114 @@
+import json
+import unittest
+from unittest.mock import MagicMock, AsyncMock
+from aioredis_models.redis_memory_report import RedisMemoryReport
+from aioredis_models.redis_string import RedisString
+
+
+KEYS = {
+    'user:1': ('hash', 'listpack', 100, 5, -1),
+    'user:2': ('hash', 'hashtable', 5000, 600, 1500),
+    'session:1': ('string', 'embstr', 60, 10, 30000)
+}
+
+
+def create_redis(keys=None):
+    keys = KEYS if keys is None else keys
+    redis = MagicMock()
+    async def execute(command, *args, **kwargs):
+        if command == b'SCAN':
+            return ['0', list(keys)]
+        key = args[-1]
+        if key not in keys:
+            return 'none' if command == b'TYPE' else None
+        key_type, _, memory, length, _ = keys[key]
+        if command == b'TYPE':
+            return key_type
+        if command == b'MEMORY':
+            return memory
+        return length
+    async def object_encoding(key):
+        return keys[key][1] if key in keys else None
+    async def pttl(key):
+        return keys[key][4] if key in keys else -2
+    redis.execute = AsyncMock(side_effect=execute)
+    redis.object_encoding = AsyncMock(side_effect=object_encoding)
+    redis.pttl = AsyncMock(side_effect=pttl)
+    return redis
+
+
+class RedisMemoryReportTests(unittest.IsolatedAsyncioTestCase):
+    def test_init_succeeds(self):
+        redis_memory_report = RedisMemoryReport(MagicMock())
+
+        self.assertIsInstance(redis_memory_report, RedisMemoryReport)
+
+    async def test_inspect_returns_key_details(self):
+        redis = create_redis()
+        redis_memory_report = RedisMemoryReport(redis)
+
+        result = await redis_memory_report.inspect('user:2')
+
+        self.assertEqual(result, {
+            'key': 'user:2',
+            'type': 'hash',
+            'encoding': 'hashtable',
+            'memory_bytes': 5000,
+            'length': 600,
+            'ttl_seconds': 1.5,
+            'compact': False
+        })
+        redis.execute.assert_any_await(b'MEMORY', b'USAGE', 'user:2')
+        redis.execute.assert_any_await(b'HLEN', 'user:2')
+
+    async def test_inspect_with_model_inspects_its_key(self):
+        redis = create_redis()
+        redis_memory_report = RedisMemoryReport(redis)
+
+        result = await redis_memory_report.inspect(RedisString(redis, 'session:1'))
+
+        self.assertEqual(result['type'], 'string')
+        self.assertIsNotNone(result['ttl_seconds'])
+        self.assertTrue(result['compact'])
+        redis.execute.assert_any_await(b'STRLEN', 'session:1')
+
+    async def test_inspect_with_missing_key_returns_none(self):
+        redis_memory_report = RedisMemoryReport(create_redis())
+
+        result = await redis_memory_report.inspect('missing')
+
+        self.assertIsNone(result)
+
+    async def test_report_aggregates_by_prefix(self):
+        redis = create_redis()
+        redis_memory_report = RedisMemoryReport(redis, batch_size=2)
+
+        result = await redis_memory_report.report('*')
+
+        self.assertEqual(result['total'], {
+            'keys': 3,
+            'memory_bytes': 5160,
+            'length': 615,
+            'keys_without_ttl': 1,
+            'non_compact_keys': 1,
+            'encodings': {'listpack': 1, 'hashtable': 1, 'embstr': 1}
+        })
+        self.assertEqual(result['prefixes']['user']['keys'], 2)
+        self.assertEqual(result['prefixes']['user']['memory_bytes'], 5100)
+        self.assertEqual(result['prefixes']['session']['keys'], 1)
+        self.assertEqual([key['key'] for key in result['non_compact_keys']], ['user:2'])
+        redis.execute.assert_any_await(b'SCAN', 0, b'MATCH', '*', b'COUNT', 2, encoding='utf-8')
+
+    async def test_report_with_max_keys_inspects_sample(self):
+        redis_memory_report = RedisMemoryReport(create_redis())
+
+        result = await redis_memory_report.report(max_keys=2)
+
+        self.assertEqual(result['total']['keys'], 2)
+
+    async def test_report_json_returns_json(self):
+        redis_memory_report = RedisMemoryReport(create_redis())
+
+        result = await redis_memory_report.report_json()
+
+        self.assertEqual(json.loads(result)['total']['keys'], 3)
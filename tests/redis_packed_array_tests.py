@@ -0,0 +1,181 @@
+import unittest
+from array import array
+from unittest.mock import MagicMock, AsyncMock, patch
+from aioredis_models.redis_packed_array import RedisPackedArray, numpy
+
+
+class RedisPackedArrayTests(unittest.IsolatedAsyncioTestCase):
+    def test_init_succeeds(self):
+        redis_packed_array = RedisPackedArray(MagicMock(), MagicMock())
+
+        self.assertIsInstance(redis_packed_array, RedisPackedArray)
+        self.assertEqual(redis_packed_array.item_size, 8)
+
+    @patch('aioredis_models.redis_packed_array.numpy', None)
+    def test_init_with_numpy_when_not_installed_raises(self):
+        with self.assertRaises(ImportError):
+            RedisPackedArray(MagicMock(), MagicMock(), use_numpy=True)
+
+    async def test_length_returns_number_of_elements(self):
+        redis = MagicMock()
+        redis.strlen = AsyncMock(return_value=24)
+        key = MagicMock()
+        redis_packed_array = RedisPackedArray(redis, key, typecode='i')
+
+        result = await redis_packed_array.length()
+
+        self.assertEqual(result, 6)
+        redis.strlen.assert_awaited_once_with(key)
+
+    async def test_get_returns_array(self):
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=array('d', [1.5, 2.5]).tobytes())
+        key = MagicMock()
+        redis_packed_array = RedisPackedArray(redis, key)
+
+        result = await redis_packed_array.get()
+
+        self.assertEqual(result, array('d', [1.5, 2.5]))
+        redis.get.assert_awaited_once_with(key, encoding=None)
+
+    async def test_get_with_missing_key_returns_none(self):
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=None)
+        redis_packed_array = RedisPackedArray(redis, MagicMock())
+
+        result = await redis_packed_array.get()
+
+        self.assertIsNone(result)
+
+    def test_set_sets_packed_values(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_packed_array = RedisPackedArray(redis, key, typecode='h')
+
+        result = redis_packed_array.set([1, 2, 3], timeout_seconds=1.5)
+
+        self.assertEqual(result, redis.set.return_value)
+        redis.set.assert_called_once_with(
+            key, array('h', [1, 2, 3]).tobytes(), pexpire=1500
+        )
+
+    def test_set_with_array_of_other_type_converts(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_packed_array = RedisPackedArray(redis, key, typecode='d')
+
+        redis_packed_array.set(array('i', [1, 2]))
+
+        redis.set.assert_called_once_with(key, array('d', [1, 2]).tobytes(), pexpire=None)
+
+    async def test_get_item_gets_range_of_element(self):
+        redis = MagicMock()
+        redis.getrange = AsyncMock(return_value=array('i', [7]).tobytes())
+        key = MagicMock()
+        redis_packed_array = RedisPackedArray(redis, key, typecode='i')
+
+        result = await redis_packed_array.get_item(3)
+
+        self.assertEqual(result, 7)
+        redis.getrange.assert_awaited_once_with(key, 12, 15, encoding=None)
+
+    async def test_get_item_beyond_end_raises(self):
+        redis = MagicMock()
+        redis.getrange = AsyncMock(return_value=b'')
+        redis_packed_array = RedisPackedArray(redis, MagicMock())
+
+        with self.assertRaises(IndexError):
+            await redis_packed_array.get_item(3)
+
+    async def test_get_slice_gets_range_of_elements(self):
+        redis = MagicMock()
+        redis.getrange = AsyncMock(return_value=array('d', [1, 2]).tobytes())
+        key = MagicMock()
+        redis_packed_array = RedisPackedArray(redis, key)
+
+        result = await redis_packed_array.get_slice(2, 5)
+
+        self.assertEqual(result, array('d', [1, 2]))
+        redis.getrange.assert_awaited_once_with(key, 16, 39, encoding=None)
+
+    async def test_get_slice_with_empty_range_returns_empty_array(self):
+        redis = MagicMock()
+        redis.getrange = AsyncMock()
+        redis_packed_array = RedisPackedArray(redis, MagicMock())
+
+        result = await redis_packed_array.get_slice(5, 5)
+
+        self.assertEqual(result, array('d'))
+        redis.getrange.assert_not_awaited()
+
+    def test_set_item_sets_range_of_element(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_packed_array = RedisPackedArray(redis, key, typecode='q')
+
+        result = redis_packed_array.set_item(2, 9)
+
+        self.assertEqual(result, redis.setrange.return_value)
+        redis.setrange.assert_called_once_with(key, 16, array('q', [9]).tobytes())
+
+    def test_set_slice_sets_range_of_elements(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_packed_array = RedisPackedArray(redis, key, typecode='f')
+
+        result = redis_packed_array.set_slice(1, array('f', [1, 2]))
+
+        self.assertEqual(result, redis.setrange.return_value)
+        redis.setrange.assert_called_once_with(key, 4, array('f', [1, 2]).tobytes())
+
+    def test_extend_appends_elements(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_packed_array = RedisPackedArray(redis, key)
+
+        result = redis_packed_array.extend([3.0])
+
+        self.assertEqual(result, redis.append.return_value)
+        redis.append.assert_called_once_with(key, array('d', [3.0]).tobytes())
+
+    async def test_get_many_gets_all_arrays_with_single_command(self):
+        redis = MagicMock()
+        redis.mget = AsyncMock(return_value=[
+            array('d', [1, 2]).tobytes(), None, array('i', [3]).tobytes()
+        ])
+        arrays = [
+            RedisPackedArray(redis, 'key1'),
+            RedisPackedArray(redis, 'key2'),
+            RedisPackedArray(redis, 'key3', typecode='i')
+        ]
+
+        result = await RedisPackedArray.get_many(arrays)
+
+        self.assertEqual(result, [array('d', [1, 2]), None, array('i', [3])])
+        redis.mget.assert_awaited_once_with('key1', 'key2', 'key3', encoding=None)
+
+    async def test_get_many_with_no_arrays_returns_empty_list(self):
+        result = await RedisPackedArray.get_many([])
+
+        self.assertEqual(result, [])
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    async def test_get_with_numpy_returns_view_over_bytes(self):
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=array('d', [1.5, 2.5]).tobytes())
+        redis_packed_array = RedisPackedArray(redis, MagicMock(), use_numpy=True)
+
+        result = await redis_packed_array.get()
+
+        self.assertEqual(result.tolist(), [1.5, 2.5])
+        self.assertFalse(result.flags.writeable)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_set_with_numpy_sets_packed_values(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_packed_array = RedisPackedArray(redis, key, use_numpy=True)
+
+        redis_packed_array.set(numpy.array([1, 2], dtype='int32'))
+
+        redis.set.assert_called_once_with(key, array('d', [1, 2]).tobytes(), pexpire=None)
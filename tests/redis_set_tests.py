@@ -1,6 +1,10 @@
 import unittest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, call
+from aioredis import ReplyError
+from aioredis.commands import Redis
+from aioredis_models.redis_client import RedisClient
 from aioredis_models.redis_set import RedisSet
+from aioredis_models.bloom_filter import BloomFilter
 
 
 class RedisSetTests(unittest.IsolatedAsyncioTestCase):
@@ -71,3 +75,306 @@ class RedisSetTests(unittest.IsolatedAsyncioTestCase):
 
         redis.srem.assert_called_once_with(key, value)
         self.assertEqual(result, redis.srem.return_value)
+
+    def test_add_with_many_values_adds_with_one_command(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_set = RedisSet(redis, key)
+
+        result = redis_set.add('foo', 'bar', 'baz')
+
+        redis.sadd.assert_called_once_with(key, 'foo', 'bar', 'baz')
+        self.assertEqual(result, redis.sadd.return_value)
+
+    def test_remove_with_many_values_removes_with_one_command(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_set = RedisSet(redis, key)
+
+        result = redis_set.remove('foo', 'bar')
+
+        redis.srem.assert_called_once_with(key, 'foo', 'bar')
+        self.assertEqual(result, redis.srem.return_value)
+
+    async def test_enumerate_scans_all_batches(self):
+        redis = MagicMock()
+        redis.sscan = AsyncMock(side_effect=[
+            (12, [b'foo', b'bar']),
+            (5, [b'baz']),
+            (0, [b'bar', b'bin'])
+        ])
+        key = MagicMock()
+        pattern = MagicMock()
+        redis_set = RedisSet(redis, key)
+
+        result = [item async for item in redis_set.enumerate(pattern=pattern, batch_size=2)]
+
+        self.assertEqual(result, ['foo', 'bar', 'baz', 'bar', 'bin'])
+        redis.sscan.assert_has_awaits([
+            call(key, cursor=0, match=pattern, count=2),
+            call(key, cursor=12, match=pattern, count=2),
+            call(key, cursor=5, match=pattern, count=2)
+        ])
+
+    async def test_enumerate_with_unique_skips_duplicates(self):
+        redis = MagicMock()
+        redis.sscan = AsyncMock(side_effect=[
+            (3, [b'foo', b'bar']),
+            (0, [b'bar', b'bin'])
+        ])
+        redis_set = RedisSet(redis, MagicMock())
+
+        result = [item async for item in redis_set.enumerate(unique=True)]
+
+        self.assertEqual(result, ['foo', 'bar', 'bin'])
+
+    async def test_enumerate_without_encoding_returns_bytes(self):
+        redis = MagicMock()
+        redis.sscan = AsyncMock(return_value=(0, [b'foo']))
+        redis_set = RedisSet(redis, MagicMock())
+
+        result = [item async for item in redis_set.enumerate(encoding=None)]
+
+        self.assertEqual(result, [b'foo'])
+
+    async def test_enumerate_when_stopped_early_cancels_prefetch(self):
+        redis = MagicMock()
+        redis.sscan = AsyncMock(side_effect=[
+            (3, [b'foo', b'bar']),
+            (0, [b'baz'])
+        ])
+        redis_set = RedisSet(redis, MagicMock())
+        iterator = redis_set.enumerate()
+
+        result = await iterator.__anext__()
+        await iterator.aclose()
+
+        self.assertEqual(result, 'foo')
+
+    def test_union_gets_union(self):
+        redis = MagicMock()
+        key = MagicMock()
+        keys = [MagicMock(), MagicMock()]
+        encoding = MagicMock()
+        redis_set = RedisSet(redis, key)
+
+        result = redis_set.union(*keys, encoding=encoding)
+
+        redis.execute.assert_called_once_with(b'SUNION', key, *keys, encoding=encoding)
+        self.assertEqual(result, redis.execute.return_value)
+
+    def test_intersection_gets_intersection(self):
+        redis = MagicMock()
+        key = MagicMock()
+        keys = [MagicMock(), MagicMock()]
+        redis_set = RedisSet(redis, key)
+
+        result = redis_set.intersection(*keys)
+
+        redis.execute.assert_called_once_with(b'SINTER', key, *keys, encoding='utf-8')
+        self.assertEqual(result, redis.execute.return_value)
+
+    def test_difference_gets_difference(self):
+        redis = MagicMock()
+        key = MagicMock()
+        keys = [MagicMock(), MagicMock()]
+        redis_set = RedisSet(redis, key)
+
+        result = redis_set.difference(*keys)
+
+        redis.execute.assert_called_once_with(b'SDIFF', key, *keys, encoding='utf-8')
+        self.assertEqual(result, redis.execute.return_value)
+
+    async def test_set_algebra_in_transaction_queues_commands(self):
+        client = RedisClient(Redis(MagicMock()))
+        redis_set = RedisSet(client, 'foo')
+        client.begin_transaction()
+
+        results = [
+            redis_set.union('bar'),
+            redis_set.intersection('bar'),
+            redis_set.difference('bar'),
+            redis_set.intersection_cardinality('bar')
+        ]
+
+        self.assertEqual(len(client.get_connection()._pipeline), 4)
+        self.assertFalse(any(result.done() for result in results))
+        client.discard_transaction()
+
+    def test_union_store_stores_union(self):
+        redis = MagicMock()
+        key = MagicMock()
+        destination_key = MagicMock()
+        keys = [MagicMock(), MagicMock()]
+        redis_set = RedisSet(redis, key)
+
+        result = redis_set.union_store(destination_key, *keys)
+
+        redis.sunionstore.assert_called_once_with(destination_key, key, *keys)
+        self.assertEqual(result, redis.sunionstore.return_value)
+
+    def test_intersection_store_stores_intersection(self):
+        redis = MagicMock()
+        key = MagicMock()
+        destination_key = MagicMock()
+        keys = [MagicMock(), MagicMock()]
+        redis_set = RedisSet(redis, key)
+
+        result = redis_set.intersection_store(destination_key, *keys)
+
+        redis.sinterstore.assert_called_once_with(destination_key, key, *keys)
+        self.assertEqual(result, redis.sinterstore.return_value)
+
+    def test_difference_store_stores_difference(self):
+        redis = MagicMock()
+        key = MagicMock()
+        destination_key = MagicMock()
+        keys = [MagicMock(), MagicMock()]
+        redis_set = RedisSet(redis, key)
+
+        result = redis_set.difference_store(destination_key, *keys)
+
+        redis.sdiffstore.assert_called_once_with(destination_key, key, *keys)
+        self.assertEqual(result, redis.sdiffstore.return_value)
+
+    def test_intersection_cardinality_gets_cardinality(self):
+        redis = MagicMock()
+        key = MagicMock()
+        keys = [MagicMock(), MagicMock()]
+        redis_set = RedisSet(redis, key)
+
+        result = redis_set.intersection_cardinality(*keys)
+
+        redis.eval.assert_called_once_with(
+            RedisSet._INTERSECTION_CARDINALITY_SCRIPT, keys=[key, *keys], args=[0]
+        )
+        self.assertEqual(result, redis.eval.return_value)
+
+    def test_intersection_cardinality_with_limit_uses_limit(self):
+        redis = MagicMock()
+        key = MagicMock()
+        keys = [MagicMock()]
+        redis_set = RedisSet(redis, key)
+
+        result = redis_set.intersection_cardinality(*keys, limit=10)
+
+        redis.eval.assert_called_once_with(
+            RedisSet._INTERSECTION_CARDINALITY_SCRIPT, keys=[key, *keys], args=[10]
+        )
+        self.assertEqual(result, redis.eval.return_value)
+
+    def test_contains_checks_membership(self):
+        redis = MagicMock()
+        key = MagicMock()
+        value = MagicMock()
+        redis_set = RedisSet(redis, key)
+
+        result = redis_set.contains(value)
+
+        redis.sismember.assert_called_once_with(key, value)
+        self.assertEqual(result, redis.sismember.return_value)
+
+    async def test_contains_many_uses_smismember(self):
+        redis = MagicMock()
+        redis.execute = AsyncMock(return_value=[1, 0, 1])
+        key = MagicMock()
+        redis_set = RedisSet(redis, key)
+
+        result = await redis_set.contains_many(['foo', 'bar', 'baz'])
+
+        redis.execute.assert_awaited_once_with(b'SMISMEMBER', key, 'foo', 'bar', 'baz')
+        self.assertEqual(result, [True, False, True])
+
+    async def test_contains_many_without_smismember_falls_back_to_sismember(self):
+        redis = MagicMock()
+        redis.execute = AsyncMock(side_effect=ReplyError("ERR unknown command 'SMISMEMBER'"))
+        redis.sismember = AsyncMock(side_effect=[0, 1, 1, 0])
+        key = MagicMock()
+        redis_set = RedisSet(redis, key)
+
+        first = await redis_set.contains_many(['foo', 'bar'])
+        second = await redis_set.contains_many(['baz', 'bin'])
+
+        redis.execute.assert_awaited_once()
+        redis.sismember.assert_has_calls([
+            call(key, 'foo'), call(key, 'bar'), call(key, 'baz'), call(key, 'bin')
+        ])
+        self.assertEqual(first, [False, True])
+        self.assertEqual(second, [True, False])
+
+    async def test_contains_many_with_other_error_raises(self):
+        redis = MagicMock()
+        redis.execute = AsyncMock(side_effect=ReplyError('WRONGTYPE'))
+        redis_set = RedisSet(redis, MagicMock())
+
+        with self.assertRaises(ReplyError):
+            await redis_set.contains_many(['foo'])
+
+    async def test_contains_many_with_bloom_filter_skips_definite_misses(self):
+        redis = MagicMock()
+        redis.execute = AsyncMock(return_value=[1])
+        key = MagicMock()
+        bloom_filter = BloomFilter(10)
+        bloom_filter.add('bar')
+        redis_set = RedisSet(redis, key)
+
+        result = await redis_set.contains_many(['foo', 'bar', 'baz'], bloom_filter=bloom_filter)
+
+        redis.execute.assert_awaited_once_with(b'SMISMEMBER', key, 'bar')
+        self.assertEqual(result, [False, True, False])
+
+    async def test_contains_many_when_all_filtered_does_not_query(self):
+        redis = MagicMock()
+        redis.execute = None
+        redis_set = RedisSet(redis, MagicMock())
+
+        result = await redis_set.contains_many(['foo'], bloom_filter=BloomFilter(10))
+
+        self.assertEqual(result, [False])
+
+    async def test_build_bloom_filter_adds_all_members(self):
+        redis = MagicMock()
+        redis.scard = AsyncMock(return_value=3)
+        redis.sscan = AsyncMock(side_effect=[
+            (7, [b'foo', b'bar']),
+            (0, [b'baz'])
+        ])
+        redis_set = RedisSet(redis, MagicMock())
+
+        result = await redis_set.build_bloom_filter(false_positive_rate=0.001)
+
+        self.assertIsInstance(result, BloomFilter)
+        self.assertEqual(len(result), 3)
+        for member in ['foo', 'bar', 'baz']:
+            self.assertIn(member, result)
+
+    def test_sample_gets_distinct_members(self):
+        redis = MagicMock()
+        key = MagicMock()
+        encoding = MagicMock()
+        redis_set = RedisSet(redis, key)
+
+        result = redis_set.sample(5, encoding=encoding)
+
+        redis.srandmember.assert_called_once_with(key, 5, encoding=encoding)
+        self.assertEqual(result, redis.srandmember.return_value)
+
+    def test_sample_with_duplicates_uses_negative_count(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_set = RedisSet(redis, key)
+
+        result = redis_set.sample(5, allow_duplicates=True)
+
+        redis.srandmember.assert_called_once_with(key, -5, encoding='utf-8')
+        self.assertEqual(result, redis.srandmember.return_value)
+
+    def test_pop_many_pops_members(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_set = RedisSet(redis, key)
+
+        result = redis_set.pop_many(3)
+
+        redis.spop.assert_called_once_with(key, 3, encoding='utf-8')
+        self.assertEqual(result, redis.spop.return_value)
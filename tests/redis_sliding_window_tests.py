@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import MagicMock, AsyncMock, ANY
+from aioredis_models.redis_sliding_window import RedisSlidingWindow
+
+
+class RedisSlidingWindowTests(unittest.IsolatedAsyncioTestCase):
+    def test_init_succeeds(self):
+        redis_sliding_window = RedisSlidingWindow(MagicMock(), MagicMock(), 10, 1)
+
+        self.assertIsInstance(redis_sliding_window, RedisSlidingWindow)
+
+    async def test_acquire_when_allowed_returns_true(self):
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=1)
+        key = MagicMock()
+        redis_sliding_window = RedisSlidingWindow(redis, key, 10, 1.5)
+
+        result = await redis_sliding_window.acquire()
+
+        self.assertTrue(result)
+        redis.eval.assert_awaited_once_with(
+            RedisSlidingWindow._ACQUIRE_SCRIPT,
+            keys=[key],
+            args=[1, ANY, 10, 1500]
+        )
+
+    async def test_acquire_when_denied_returns_false(self):
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=0)
+        redis_sliding_window = RedisSlidingWindow(redis, MagicMock(), 10, 1)
+
+        result = await redis_sliding_window.acquire(4)
+
+        self.assertFalse(result)
+        self.assertEqual(redis.eval.await_args.kwargs['args'][0], 4)
+
+    async def test_acquire_all_checks_all_windows_in_one_call(self):
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=1)
+        keys = [MagicMock(), MagicMock()]
+        windows = [
+            RedisSlidingWindow(redis, keys[0], 10, 1),
+            RedisSlidingWindow(redis, keys[1], 1000, 60)
+        ]
+
+        result = await RedisSlidingWindow.acquire_all(windows)
+
+        self.assertTrue(result)
+        redis.eval.assert_awaited_once_with(
+            RedisSlidingWindow._ACQUIRE_SCRIPT,
+            keys=keys,
+            args=[1, ANY, 10, 1000, 1000, 60000]
+        )
+
+    async def test_acquire_all_uses_unique_request_ids(self):
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=1)
+        redis_sliding_window = RedisSlidingWindow(redis, MagicMock(), 10, 1)
+
+        await redis_sliding_window.acquire()
+        await redis_sliding_window.acquire()
+
+        first, second = (call.kwargs['args'][1] for call in redis.eval.await_args_list)
+        self.assertNotEqual(first, second)
@@ -0,0 +1,121 @@
+import unittest
+from unittest.mock import MagicMock, AsyncMock, call, patch
+from aioredis_models.redis_string import RedisString
+from aioredis_models.redis_string_batch import RedisStringBatch
+
+
+class RedisStringBatchTests(unittest.IsolatedAsyncioTestCase):
+    def test_init_succeeds(self):
+        redis_string_batch = RedisStringBatch(MagicMock())
+
+        self.assertIsInstance(redis_string_batch, RedisStringBatch)
+
+    async def test_get_many_splits_into_batches(self):
+        redis = MagicMock()
+        redis.mget = AsyncMock(side_effect=lambda *keys, **_: [f'value-of-{key}' for key in keys])
+        encoding = MagicMock()
+        redis_string_batch = RedisStringBatch(redis, batch_size=2)
+        strings = ['foo', RedisString(redis, 'bar'), 'baz']
+
+        result = await redis_string_batch.get_many(strings, encoding=encoding)
+
+        redis.mget.assert_has_awaits([
+            call('foo', 'bar', encoding=encoding),
+            call('baz', encoding=encoding)
+        ])
+        self.assertEqual(result, ['value-of-foo', 'value-of-bar', 'value-of-baz'])
+
+    async def test_get_many_with_no_strings_returns_empty(self):
+        redis = MagicMock()
+        redis.mget = None
+        redis_string_batch = RedisStringBatch(redis)
+
+        result = await redis_string_batch.get_many([])
+
+        self.assertEqual(result, [])
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_set_many_sets_each_batch_in_own_transaction(self, isinstance_mock):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        connection = redis.get_connection.return_value
+        transaction_ctxs = [AsyncMock(), AsyncMock()]
+        transactions = [MagicMock(), MagicMock()]
+        for transaction_ctx, transaction in zip(transaction_ctxs, transactions):
+            transaction_ctx.__aenter__.return_value = transaction
+        redis.begin_transaction.side_effect = transaction_ctxs
+        redis_string_batch = RedisStringBatch(redis, batch_size=2)
+
+        await redis_string_batch.set_many({'foo': 1, 'bar': 2, 'baz': 3}, timeout_seconds=1.5)
+
+        connection.mset.assert_has_calls([call('foo', 1, 'bar', 2), call('baz', 3)])
+        connection.pexpire.assert_has_calls([
+            call('foo', 1500), call('bar', 1500), call('baz', 1500)
+        ])
+        for transaction_ctx in transaction_ctxs:
+            transaction_ctx.__aexit__.assert_awaited_once()
+        self.assertEqual(transactions[0].add_operation.call_args_list, [
+            call(connection.mset.return_value),
+            call(connection.pexpire.return_value, connection.pexpire.return_value)
+        ])
+        self.assertEqual(transactions[1].add_operation.call_args_list, [
+            call(connection.mset.return_value),
+            call(connection.pexpire.return_value)
+        ])
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_set_many_with_per_key_timeouts_expires_each_key(self, isinstance_mock):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        connection = redis.get_connection.return_value
+        transaction_ctx = AsyncMock()
+        transaction_ctx.__aenter__.return_value = MagicMock()
+        redis.begin_transaction.return_value = transaction_ctx
+        redis_string_batch = RedisStringBatch(redis)
+
+        await redis_string_batch.set_many(
+            {'foo': 1, 'bar': 2},
+            timeout_seconds={'foo': 2, 'other': 3}
+        )
+
+        connection.mset.assert_called_once_with('foo', 1, 'bar', 2)
+        connection.pexpire.assert_called_once_with('foo', 2000)
+
+    @patch('aioredis_models.redis_model.isinstance')
+    async def test_set_many_with_zero_timeout_expires_immediately(self, isinstance_mock):
+        isinstance_mock.return_value = True
+        redis = MagicMock()
+        connection = redis.get_connection.return_value
+        transaction_ctx = AsyncMock()
+        transaction_ctx.__aenter__.return_value = MagicMock()
+        redis.begin_transaction.return_value = transaction_ctx
+        redis_string_batch = RedisStringBatch(redis)
+
+        await redis_string_batch.set_many({'foo': 1, 'bar': 2}, timeout_seconds={'foo': 0})
+
+        connection.pexpire.assert_called_once_with('foo', 0)
+
+    async def test_set_many_with_no_values_does_nothing(self):
+        redis = MagicMock()
+        redis.begin_transaction = None
+        redis_string_batch = RedisStringBatch(redis)
+
+        await redis_string_batch.set_many({})
+
+    def test_set_many_if_not_exist_uses_msetnx(self):
+        redis = MagicMock()
+        redis_string_batch = RedisStringBatch(redis, batch_size=1)
+
+        result = redis_string_batch.set_many_if_not_exist({'foo': 1, 'bar': 2})
+
+        redis.msetnx.assert_called_once_with('foo', 1, 'bar', 2)
+        self.assertEqual(result, redis.msetnx.return_value)
+
+    async def test_set_many_if_not_exist_with_no_values_does_nothing(self):
+        redis = MagicMock()
+        redis.msetnx = None
+        redis_string_batch = RedisStringBatch(redis)
+
+        result = await redis_string_batch.set_many_if_not_exist({})
+
+        self.assertIsNone(result)
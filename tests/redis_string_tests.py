@@ -1,9 +1,9 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, AsyncMock, call
 from aioredis_models.redis_string import RedisString
 
 
-class RedisStringTests(unittest.TestCase):
+class RedisStringTests(unittest.IsolatedAsyncioTestCase):
     def test_init_succeeds(self):
         redis_string = RedisString(MagicMock(), MagicMock())
 
@@ -98,3 +98,118 @@ class RedisStringTests(unittest.TestCase):
 
         self.assertEqual(result, redis.set.return_value)
         redis.set.assert_called_once_with(key, value, pexpire=None, exist=None)
+
+    def test_increment_with_int_uses_incrby(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_string = RedisString(redis, key)
+
+        result = redis_string.increment(-4)
+
+        redis.incrby.assert_called_once_with(key, -4)
+        redis.incrbyfloat.assert_not_called()
+        self.assertEqual(result, redis.incrby.return_value)
+
+    def test_increment_with_float_uses_incrbyfloat(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_string = RedisString(redis, key)
+
+        result = redis_string.increment(0.25)
+
+        redis.incrbyfloat.assert_called_once_with(key, 0.25)
+        redis.incrby.assert_not_called()
+        self.assertEqual(result, redis.incrbyfloat.return_value)
+
+    def test_increment_uses_correct_defaults(self):
+        redis = MagicMock()
+        key = MagicMock()
+        redis_string = RedisString(redis, key)
+
+        result = redis_string.increment()
+
+        redis.incrby.assert_called_once_with(key, 1)
+        self.assertEqual(result, redis.incrby.return_value)
+
+    async def test_read_chunks_reads_ranges_until_short_chunk(self):
+        redis = MagicMock()
+        redis.getrange = AsyncMock(side_effect=[b'abc', b'def', b'g'])
+        key = MagicMock()
+        redis_string = RedisString(redis, key)
+
+        result = [chunk async for chunk in redis_string.read_chunks(chunk_size=3)]
+
+        self.assertEqual(result, [b'abc', b'def', b'g'])
+        redis.getrange.assert_has_awaits([
+            call(key, 0, 2, encoding=None),
+            call(key, 3, 5, encoding=None),
+            call(key, 6, 8, encoding=None)
+        ])
+
+    async def test_read_chunks_with_exact_multiple_stops_on_empty_chunk(self):
+        redis = MagicMock()
+        redis.getrange = AsyncMock(side_effect=[b'abc', b''])
+        redis_string = RedisString(redis, MagicMock())
+
+        result = [chunk async for chunk in redis_string.read_chunks(chunk_size=3)]
+
+        self.assertEqual(result, [b'abc'])
+        self.assertEqual(redis.getrange.await_count, 2)
+
+    async def test_write_from_with_async_iterable_sets_then_appends(self):
+        redis = MagicMock()
+        redis.set = AsyncMock()
+        redis.append = AsyncMock()
+        key = MagicMock()
+        redis_string = RedisString(redis, key)
+        async def chunks():
+            yield b'abc'
+            yield memoryview(b'def')
+            yield b'g'
+
+        await redis_string.write_from(chunks())
+
+        redis.set.assert_awaited_once_with(key, b'abc', pexpire=None, exist=None)
+        redis.append.assert_has_awaits([call(key, b'def'), call(key, b'g')])
+        self.assertIsInstance(redis.append.await_args_list[0].args[1], bytes)
+
+    async def test_write_from_with_bytes_writes_slices(self):
+        redis = MagicMock()
+        redis.set = AsyncMock()
+        redis.append = AsyncMock()
+        key = MagicMock()
+        redis_string = RedisString(redis, key)
+
+        await redis_string.write_from(bytearray(b'abcdefg'), chunk_size=3)
+
+        redis.set.assert_awaited_once_with(key, b'abc', pexpire=None, exist=None)
+        redis.append.assert_has_awaits([call(key, b'def'), call(key, b'g')])
+
+    async def test_write_from_with_empty_source_sets_empty_value(self):
+        redis = MagicMock()
+        redis.set = AsyncMock()
+        redis.append = AsyncMock()
+        key = MagicMock()
+        redis_string = RedisString(redis, key)
+
+        await redis_string.write_from(b'')
+
+        redis.set.assert_awaited_once_with(key, b'', pexpire=None, exist=None)
+        redis.append.assert_not_awaited()
+
+    async def test_read_chunks_with_non_positive_chunk_size_raises(self):
+        redis = MagicMock()
+        redis.getrange = None
+        redis_string = RedisString(redis, MagicMock())
+
+        with self.assertRaises(ValueError):
+            async for _ in redis_string.read_chunks(0):
+                pass
+
+    async def test_write_from_with_non_positive_chunk_size_raises(self):
+        redis = MagicMock()
+        redis.set = None
+        redis_string = RedisString(redis, MagicMock())
+
+        with self.assertRaises(ValueError):
+            await redis_string.write_from(b'abc', chunk_size=-1)
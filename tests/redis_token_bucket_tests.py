@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import MagicMock, AsyncMock
+from aioredis_models.redis_token_bucket import RedisTokenBucket
+
+
+class RedisTokenBucketTests(unittest.IsolatedAsyncioTestCase):
+    def test_init_succeeds(self):
+        redis_token_bucket = RedisTokenBucket(MagicMock(), MagicMock(), 10, 1)
+
+        self.assertIsInstance(redis_token_bucket, RedisTokenBucket)
+
+    async def test_acquire_when_allowed_returns_true(self):
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=1)
+        key = MagicMock()
+        redis_token_bucket = RedisTokenBucket(redis, key, 10, 2)
+
+        result = await redis_token_bucket.acquire(3)
+
+        self.assertTrue(result)
+        redis.eval.assert_awaited_once_with(
+            RedisTokenBucket._ACQUIRE_SCRIPT,
+            keys=[key],
+            args=[3, 10, 0.002]
+        )
+
+    async def test_acquire_when_denied_returns_false(self):
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=0)
+        redis_token_bucket = RedisTokenBucket(redis, MagicMock(), 10, 2)
+
+        result = await redis_token_bucket.acquire()
+
+        self.assertFalse(result)
+        self.assertEqual(redis.eval.await_args.kwargs['args'][0], 1)
+
+    async def test_acquire_all_checks_all_buckets_in_one_call(self):
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=1)
+        keys = [MagicMock(), MagicMock()]
+        buckets = [
+            RedisTokenBucket(redis, keys[0], 10, 1),
+            RedisTokenBucket(redis, keys[1], 100, 50)
+        ]
+
+        result = await RedisTokenBucket.acquire_all(buckets, tokens=2)
+
+        self.assertTrue(result)
+        redis.eval.assert_awaited_once_with(
+            RedisTokenBucket._ACQUIRE_SCRIPT,
+            keys=keys,
+            args=[2, 10, 0.001, 100, 0.05]
+        )
+
+    async def test_acquire_all_with_no_buckets_returns_true(self):
+        result = await RedisTokenBucket.acquire_all([])
+
+        self.assertTrue(result)